@@ -0,0 +1,241 @@
+import net from "node:net";
+import os from "node:os";
+import path from "node:path";
+import readline from "node:readline";
+import { spawn } from "node:child_process";
+import { fileURLToPath } from "node:url";
+
+// Remote eval client for neat_train.py (eval_backend = "broker").
+// Connects to the broker embedded in neat_train.py, leases eval jobs and runs them on
+// local neat_eval_server.mjs children (one per slot), then posts results back.
+// Protocol: one JSON message per line over TCP; every message carries an id and the
+// broker answers with the same id.
+//   { id, op: "hello", name, slots }              -> { id, ok, heartbeat_sec }
+//   { id, op: "lease" }                           -> { id, ok, job: { job_id, argv, genome } | null, retry_ms }
+//   { id, op: "heartbeat" }                       -> { id, ok, leases, cancel: [job_id, ...] }
+//   { id, op: "result", job_id, ok, summary|error } -> { id, ok, accepted, reason? }
+// The eval server child runs the CPU-heavy game loop, so this process stays free to heartbeat.
+// A job listed in "cancel" (timed out or re-leased on the broker) gets its child killed; the
+// child restarts on the next lease.
+//
+// Usage:
+//   node scripts/neat_eval_broker_client.mjs --broker 192.168.0.10:7788 --slots 6
+// Job argv may carry absolute paths (e.g. --opponent-genome); clients must see the same paths.
+
+const SERVER_SCRIPT = path.join(path.dirname(fileURLToPath(import.meta.url)), "neat_eval_server.mjs");
+const RECONNECT_DELAY_MS = 2000;
+
+function parseArgs(argv) {
+  const args = [...argv];
+  const out = {
+    broker: "",
+    slots: 1,
+    name: `${os.hostname()}-${process.pid}`,
+    exitOnDisconnect: false,
+  };
+  while (args.length > 0) {
+    const key = args.shift();
+    if (key === "--broker") out.broker = String(args.shift() || "").trim();
+    else if (key === "--slots") out.slots = Number(args.shift());
+    else if (key === "--name") out.name = String(args.shift() || "").trim();
+    else if (key === "--exit-on-disconnect") out.exitOnDisconnect = true;
+    else throw new Error(`unknown argument: ${key}`);
+  }
+  const match = /^(.+):(\d+)$/.exec(out.broker);
+  if (!match) throw new Error("--broker must be host:port");
+  out.host = match[1];
+  out.port = Number(match[2]);
+  if (!Number.isInteger(out.slots) || out.slots < 1) throw new Error("--slots must be an integer >= 1");
+  if (!out.name) throw new Error("--name must not be empty");
+  return out;
+}
+
+function sleep(ms) {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+class EvalServerChild {
+  constructor() {
+    this.proc = null;
+    this.pending = new Map();
+    this.currentJobId = null;
+  }
+
+  start() {
+    this.proc = spawn(process.execPath, [SERVER_SCRIPT], { stdio: ["pipe", "pipe", "inherit"] });
+    const proc = this.proc;
+    const rl = readline.createInterface({ input: proc.stdout, crlfDelay: Infinity });
+    rl.on("line", (rawLine) => {
+      let response = null;
+      try {
+        response = JSON.parse(String(rawLine || "").trim());
+      } catch {
+        // Stray non-protocol output from engine code.
+        return;
+      }
+      const waiter = this.pending.get(response?.id);
+      if (!waiter) return;
+      this.pending.delete(response.id);
+      waiter.resolve(response);
+    });
+    proc.on("exit", (code) => {
+      if (this.proc === proc) this.proc = null;
+      for (const waiter of this.pending.values()) {
+        waiter.reject(new Error(`eval server exited (code=${code})`));
+      }
+      this.pending.clear();
+    });
+  }
+
+  request(jobId, argv, genome) {
+    if (!this.proc) this.start();
+    return new Promise((resolve, reject) => {
+      this.pending.set(jobId, { resolve, reject });
+      this.proc.stdin.write(`${JSON.stringify({ id: jobId, argv, genome })}\n`);
+    });
+  }
+
+  kill() {
+    // The exit handler rejects the pending request.
+    if (this.proc) this.proc.kill();
+  }
+
+  close() {
+    if (this.proc) this.proc.stdin.end();
+    this.proc = null;
+  }
+}
+
+class BrokerConnection {
+  constructor(host, port) {
+    this.host = host;
+    this.port = port;
+    this.socket = null;
+    this.pending = new Map();
+    this.nextId = 0;
+    this.closed = false;
+  }
+
+  connect() {
+    return new Promise((resolve, reject) => {
+      const socket = net.createConnection({ host: this.host, port: this.port });
+      socket.setNoDelay(true);
+      socket.once("error", reject);
+      socket.once("connect", () => {
+        this.socket = socket;
+        socket.off("error", reject);
+        resolve();
+      });
+      socket.on("error", () => {});
+      const rl = readline.createInterface({ input: socket, crlfDelay: Infinity });
+      rl.on("error", () => {});
+      rl.on("line", (rawLine) => {
+        const response = JSON.parse(String(rawLine || "").trim());
+        const waiter = this.pending.get(response?.id);
+        if (!waiter) return;
+        this.pending.delete(response.id);
+        if (response.ok) waiter.resolve(response);
+        else waiter.reject(new Error(`broker error: ${response.error || "unknown"}`));
+      });
+      socket.on("close", () => {
+        this.closed = true;
+        for (const waiter of this.pending.values()) waiter.reject(new Error("broker connection closed"));
+        this.pending.clear();
+      });
+    });
+  }
+
+  send(op, fields = {}) {
+    if (this.closed || !this.socket) return Promise.reject(new Error("broker connection closed"));
+    this.nextId += 1;
+    const id = this.nextId;
+    return new Promise((resolve, reject) => {
+      this.pending.set(id, { resolve, reject });
+      this.socket.write(`${JSON.stringify({ id, op, ...fields })}\n`);
+    });
+  }
+
+  close() {
+    if (this.socket) this.socket.destroy();
+  }
+}
+
+async function runSlot(conn, child) {
+  while (!conn.closed) {
+    const leased = await conn.send("lease");
+    const job = leased.job;
+    if (!job) {
+      await sleep(Math.max(10, Number(leased.retry_ms) || 200));
+      continue;
+    }
+    let response = null;
+    child.currentJobId = job.job_id;
+    try {
+      response = await child.request(job.job_id, job.argv, job.genome ?? null);
+    } catch (err) {
+      response = { ok: false, error: { message: String(err?.message || err), stack: String(err?.stack || "") } };
+    } finally {
+      child.currentJobId = null;
+    }
+    const posted = await conn.send("result", {
+      job_id: job.job_id,
+      ok: Boolean(response.ok),
+      summary: response.ok ? response.summary : undefined,
+      error: response.ok ? undefined : response.error,
+    });
+    if (!posted.accepted) {
+      process.stderr.write(`[broker-client] result for job ${job.job_id} rejected (${posted.reason || "unknown"})\n`);
+    }
+  }
+}
+
+function cancelJobs(children, jobIds) {
+  const cancelled = new Set((jobIds || []).map(Number));
+  for (const child of children) {
+    if (child.currentJobId !== null && cancelled.has(Number(child.currentJobId))) {
+      process.stderr.write(`[broker-client] cancelling job ${child.currentJobId}\n`);
+      child.kill();
+    }
+  }
+}
+
+async function runSession(opts, children) {
+  const conn = new BrokerConnection(opts.host, opts.port);
+  await conn.connect();
+  const hello = await conn.send("hello", { name: opts.name, slots: opts.slots });
+  const heartbeatMs = Math.max(100, Number(hello.heartbeat_sec) * 1000);
+  const timer = setInterval(() => {
+    conn
+      .send("heartbeat")
+      .then((reply) => cancelJobs(children, reply.cancel))
+      .catch(() => {});
+  }, heartbeatMs);
+  process.stderr.write(`[broker-client] ${opts.name} connected to ${opts.host}:${opts.port} (slots=${opts.slots})\n`);
+  try {
+    await Promise.allSettled(children.map((child) => runSlot(conn, child)));
+  } finally {
+    clearInterval(timer);
+    conn.close();
+  }
+}
+
+async function main() {
+  const opts = parseArgs(process.argv.slice(2));
+  const children = Array.from({ length: opts.slots }, () => new EvalServerChild());
+  try {
+    for (;;) {
+      try {
+        await runSession(opts, children);
+        process.stderr.write(`[broker-client] ${opts.name} disconnected\n`);
+      } catch (err) {
+        process.stderr.write(`[broker-client] ${opts.name} connect failed: ${String(err?.message || err)}\n`);
+      }
+      if (opts.exitOnDisconnect) break;
+      await sleep(RECONNECT_DELAY_MS);
+    }
+  } finally {
+    for (const child of children) child.close();
+  }
+}
+
+await main();
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Localhost smoke run for the eval broker (eval_backend = "broker").
+
+Starts the broker from neat_train.py on 127.0.0.1, spawns two
+neat_eval_broker_client.mjs processes (one slot each) and checks:
+1) jobs are spread over both clients and come back with summaries
+2) a job that runs past its timeout raises TimeoutError, its client is told
+   to cancel it, the late result is rejected and the slot serves new jobs
+
+Plays fewer than 100 games in total.
+
+Usage:
+  python scripts/neat_eval_broker_smoke.py
+"""
+
+import argparse
+import concurrent.futures
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import neat_train  # noqa: E402
+
+CLIENT_SCRIPT = os.path.join(SCRIPT_DIR, "neat_eval_broker_client.mjs")
+HEARTBEAT_SEC = 0.5
+SHORT_GAMES = 6
+SHORT_JOBS = 8
+LONG_GAMES = 40
+FOLLOWUP_GAMES = 3
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Two-client localhost smoke run for the eval broker")
+    parser.add_argument("--config-feedforward", default="scripts/configs/neat_feedforward.ini")
+    parser.add_argument("--runtime-config", default="scripts/configs/runtime_phase1.json")
+    parser.add_argument(
+        "--opponent-policy",
+        default="H-CL",
+        help="replaces the runtime opponent mix, so the run needs no trained model files",
+    )
+    parser.add_argument("--wait-sec", type=float, default=30.0)
+    return parser.parse_args()
+
+
+def _wait_until(predicate, timeout_sec: float, what: str) -> None:
+    deadline = time.monotonic() + float(timeout_sec)
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"timed out after {timeout_sec:.0f}s waiting for {what}")
+        time.sleep(0.1)
+
+
+def _read_log(path: str) -> str:
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+def main() -> None:
+    args = parse_args()
+    config = neat_train._build_config(os.path.join(REPO_ROOT, args.config_feedforward))
+    runtime = neat_train._load_runtime_config(os.path.join(REPO_ROOT, args.runtime_config))
+    runtime["opponent_policy"] = str(args.opponent_policy)
+    runtime["opponent_policy_mix"] = []
+    # A fresh population wires the innovation tracker new genomes need.
+    genome = next(iter(neat_train.neat.Population(config).population.values()))
+    payload = neat_train._export_neat_python_genome(genome, config, runtime)
+
+    def argv_for(games: int, seed: str) -> list:
+        return neat_train._build_eval_worker_argv(
+            runtime,
+            genome_count=1,
+            seed_text=seed,
+            games=games,
+            early_stop_win_rate_cutoffs=[],
+            early_stop_go_take_rate_cutoffs=[],
+        )
+
+    broker = neat_train.EvalBroker("127.0.0.1:0", HEARTBEAT_SEC, 2)
+    host, port = broker.address[0], broker.address[1]
+    log_dir = tempfile.mkdtemp(prefix="neat_broker_smoke_")
+    clients = []
+    logs = []
+    try:
+        for name in ("smoke-a", "smoke-b"):
+            log_path = os.path.join(log_dir, f"{name}.log")
+            log_file = open(log_path, "w", encoding="utf-8")
+            logs.append(log_path)
+            clients.append(
+                (
+                    subprocess.Popen(
+                        [
+                            neat_train._resolve_node_executable(),
+                            CLIENT_SCRIPT,
+                            "--broker",
+                            f"{host}:{port}",
+                            "--slots",
+                            "1",
+                            "--name",
+                            name,
+                            "--exit-on-disconnect",
+                        ],
+                        cwd=REPO_ROOT,
+                        stdout=log_file,
+                        stderr=subprocess.STDOUT,
+                    ),
+                    log_file,
+                )
+            )
+        _wait_until(lambda: broker.client_count() == 2, args.wait_sec, "2 broker clients")
+
+        # 1) spread: more jobs than slots, both clients must answer some.
+        started = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=SHORT_JOBS) as pool:
+            futures = [
+                pool.submit(broker.request, argv_for(SHORT_GAMES, f"smoke|job={i}"), args.wait_sec, payload)
+                for i in range(SHORT_JOBS)
+            ]
+            summaries = [future.result() for future in futures]
+        if not all(summaries):
+            raise RuntimeError("broker returned an empty summary")
+        stats = broker.client_stats()
+        if len(stats) != 2 or any(int(client["results"]) < 1 for client in stats):
+            raise RuntimeError(f"jobs were not spread over both clients: {stats}")
+        print(f"spread ok: {SHORT_JOBS} jobs in {time.perf_counter() - started:.1f}s, clients={stats}")
+
+        # 2) timeout: the broker gives up, the client kills the job and the slot is reused.
+        try:
+            broker.request(argv_for(LONG_GAMES, "smoke|long"), 1.0, payload)
+        except TimeoutError as exc:
+            print(f"timeout ok: {exc}")
+        else:
+            raise RuntimeError(f"{LONG_GAMES}-game job finished inside 1s; cannot check the cancel path")
+        started = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(broker.request, argv_for(FOLLOWUP_GAMES, f"smoke|after={i}"), args.wait_sec, payload)
+                for i in range(2)
+            ]
+            for future in futures:
+                future.result()
+        print(f"followup ok: 2 jobs in {time.perf_counter() - started:.1f}s after the timeout")
+        _wait_until(
+            lambda: sum(int(client["rejected"]) for client in broker.client_stats()) >= 1,
+            args.wait_sec,
+            "the cancelled job's late result to be rejected",
+        )
+        if not any("cancelling job" in _read_log(path) for path in logs):
+            raise RuntimeError("no client logged a cancelled job")
+        print(f"cancel ok: clients={broker.client_stats()}")
+    finally:
+        broker.close()
+        for proc, log_file in clients:
+            proc.terminate()
+            proc.wait()
+            log_file.close()
+        for path in logs:
+            print(f"--- {os.path.basename(path)}\n{_read_log(path).rstrip()}")
+    print("broker smoke ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Same-process determinism smoke run for the eval worker.
+
+Evaluates one genome several times inside one worker process and checks that
+every evaluation scores identically:
+1) spawn mode: one --genome-batch call carrying the same genome N times
+2) persistent mode: N sequential requests to one neat_eval_server.mjs
+
+Catches state shared across evaluations (e.g. cached round starts that a game
+mutates), which would let later genomes play from different positions.
+
+Usage:
+  python scripts/neat_eval_determinism_smoke.py
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import neat_train  # noqa: E402
+
+# Per-run results only; timing and cumulative bridge counters legitimately differ.
+COMPARED_KEYS = (
+    "games",
+    "wins",
+    "losses",
+    "draws",
+    "mean_gold_delta",
+    "gold_delta_sum_sq",
+    "p10_gold_delta",
+    "p50_gold_delta",
+    "p90_gold_delta",
+    "seat_breakdown",
+    "go_count",
+    "go_opportunity_count",
+    "imitation_weighted_score",
+    "fitness",
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Same-process determinism smoke run for the eval worker")
+    parser.add_argument("--config-feedforward", default="scripts/configs/neat_feedforward.ini")
+    parser.add_argument("--runtime-config", default="scripts/configs/runtime_phase1.json")
+    parser.add_argument(
+        "--opponent-policy",
+        default="H-CL",
+        help="replaces the runtime opponent mix, so the run needs no trained model files",
+    )
+    parser.add_argument("--seed", default="X9")
+    parser.add_argument("--games", type=int, default=24)
+    parser.add_argument("--repeats", type=int, default=3)
+    return parser.parse_args()
+
+
+def _check_identical(label: str, results: list) -> None:
+    for index, result in enumerate(results):
+        if not bool(result.get("eval_ok")):
+            raise RuntimeError(f"{label}: evaluation {index} failed: {result}")
+    first = {key: results[0].get(key) for key in COMPARED_KEYS}
+    for index, result in enumerate(results[1:], start=1):
+        diff = {key: (first[key], result.get(key)) for key in COMPARED_KEYS if result.get(key) != first[key]}
+        if diff:
+            raise RuntimeError(f"{label}: evaluation {index} differs from evaluation 0: {diff}")
+    print(
+        f"{label} ok: {len(results)} evaluations, "
+        f"wins={first['wins']}/{first['games']} mean_gold_delta={first['mean_gold_delta']:+.0f}"
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    if int(args.repeats) < 2:
+        raise RuntimeError("--repeats must be >= 2")
+    config = neat_train._build_config(os.path.join(REPO_ROOT, args.config_feedforward))
+    runtime = neat_train._load_runtime_config(os.path.join(REPO_ROOT, args.runtime_config))
+    runtime["opponent_policy"] = str(args.opponent_policy)
+    runtime["opponent_policy_mix"] = []
+    neat_train._set_eval_env(runtime, tempfile.mkdtemp(prefix="neat_determinism_smoke_"))
+    # A fresh population wires the innovation tracker new genomes need.
+    genome = next(iter(neat_train.neat.Population(config).population.values()))
+
+    def evaluate(mode: str, entries: list) -> list:
+        return neat_train._run_eval_worker_for_genomes(
+            entries,
+            config,
+            dict(runtime, eval_worker_mode=mode),
+            args.seed,
+            games_override=int(args.games),
+        )
+
+    try:
+        _check_identical(
+            "batch",
+            evaluate("spawn", [(index, genome) for index in range(int(args.repeats))]),
+        )
+        _check_identical(
+            "persistent",
+            [evaluate("persistent", [(index, genome)])[0] for index in range(int(args.repeats))],
+        )
+    finally:
+        neat_train._close_eval_servers()
+    print("determinism smoke ok")
+
+
+if __name__ == "__main__":
+    main()
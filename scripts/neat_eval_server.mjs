@@ -0,0 +1,49 @@
+import readline from "node:readline";
+import { closeAllRustPolicyBridges } from "../src/ai/rustPolicyBridge.js";
+import { runNeatEvalCli } from "./neat_eval_worker.mjs";
+
+// Long-lived neat_eval_worker host for neat_train.py.
+// Protocol: one JSON request per stdin line -> one JSON response per stdout line.
+//   request:  { id, argv: [...neat_eval_worker.mjs CLI args], genome? }
+//             genome carries the payload for "--genome -" (object) or "--genome-batch -" (array).
+//   response: { id, ok: true, summary } | { id, ok: false, error: { message, stack } }
+// Module imports, opponent spec cache and native bridges survive across requests.
+
+const rl = readline.createInterface({
+  input: process.stdin,
+  crlfDelay: Infinity,
+});
+
+for await (const rawLine of rl) {
+  const line = String(rawLine || "").trim();
+  if (!line) continue;
+
+  let request = null;
+  let id = null;
+  try {
+    request = JSON.parse(line);
+    id = request?.id ?? null;
+    if (!Array.isArray(request?.argv)) {
+      throw new Error("request.argv must be an array");
+    }
+    const summary = await runNeatEvalCli(request.argv, {
+      writeStdout: false,
+      closeNativeBridges: false,
+      genomePayload: request.genome ?? null,
+      readStdin: false,
+    });
+    process.stdout.write(`${JSON.stringify({ id, ok: true, summary })}\n`);
+  } catch (err) {
+    const payload = {
+      id,
+      ok: false,
+      error: {
+        message: String(err?.message || err),
+        stack: String(err?.stack || ""),
+      },
+    };
+    process.stdout.write(`${JSON.stringify(payload)}\n`);
+  }
+}
+
+await closeAllRustPolicyBridges();
@@ -1,5 +1,6 @@
 ﻿import fs from "node:fs";
 import path from "node:path";
+import { pathToFileURL } from "node:url";
 import { createSeededRng } from "../src/engine/index.js";
 import { getActionPlayerKey } from "../src/engine/runner.js";
 import { aiPlay } from "../src/ai/aiPlay.js";
@@ -13,6 +14,11 @@ import {
   getRustPolicyBridgeStats,
   resetRustPolicyBridgeStats,
 } from "../src/ai/rustPolicyBridge.js";
+import {
+  getModelPolicyStats,
+  resetModelPolicyStats,
+  setModelPolicyTimingEnabled,
+} from "../src/ai/modelPolicyEngine.js";
 import {
   canonicalOptionAction,
   normalizeOptionCandidates,
@@ -32,8 +38,13 @@ import {
   quantile,
 } from "../src/ai/evalCore/sharedGameHelpers.js";
 
+// Static imports above are resolved before this line runs, so this is the process's module load time.
+const MODULE_LOAD_MS = performance.now();
+// A persistent server process reports module load once, on its first summary.
+let moduleLoadReported = false;
+
 // Quick Read Map (top-down):
-// 1) main()
+// 1) runNeatEvalCli() (CLI main + neat_eval_server.mjs entry, --genome-batch)
 // 2) runEvalRound(): per-game simulation loop
 // 3) decision inference helpers (imitation counters)
 // 4) parseArgs()/state transition helpers
@@ -52,6 +63,12 @@ function normalizeControlPolicyMode(mode) {
 }
 
 const OPPONENT_SPEC_CACHE = new Map();
+// Common-random-numbers caches (persistent server): every genome of a generation shares
+// opts.seed, so fresh round starts and reference-policy outcomes are computed once per seed.
+const ROUND_START_CACHE = new Map();
+const ROUND_START_CACHE_LIMIT = 4096;
+const CRN_REFERENCE_CACHE = new Map();
+let CRN_REFERENCE_CACHE_SEED = "";
 const NEAT_MODEL_FORMAT = "neat_python_genome_v1";
 const K_HYPERNEAT_MODEL_FORMAT = "k_hyperneat_executor_v1";
 function loadGenomeModel(genomePath, label) {
@@ -328,12 +345,70 @@ function normalizeEarlyStopGoTakeRateCutoffs(parsed, label) {
   return out;
 }
 
+// SPRT on the per-game win indicator: H0 win_rate=p0 (clearly worse) vs H1 win_rate=p1
+// (generation top-K reference). Only "accept H0" stops a run; contenders keep playing.
+function parseEarlyStopSprt(rawValue, label) {
+  const text = String(rawValue || "").trim();
+  if (!text) return null;
+  let parsed = null;
+  try {
+    parsed = JSON.parse(text);
+  } catch (err) {
+    throw new Error(`invalid ${label} JSON: ${String(err && err.message ? err.message : err)}`);
+  }
+  if (!parsed || typeof parsed !== "object" || Array.isArray(parsed)) {
+    throw new Error(`${label} must be a JSON object`);
+  }
+  const p0 = Number(parsed.p0);
+  const p1 = Number(parsed.p1);
+  const alpha = Number(parsed.alpha);
+  const beta = Number(parsed.beta);
+  const minGames = Number(parsed.min_games);
+  if (!Number.isFinite(p0) || !Number.isFinite(p1) || p0 <= 0 || p1 >= 1 || p0 >= p1) {
+    throw new Error(`${label} requires 0 < p0 < p1 < 1`);
+  }
+  if (!Number.isFinite(alpha) || alpha <= 0 || alpha >= 0.5) {
+    throw new Error(`${label}.alpha must be in (0,0.5)`);
+  }
+  if (!Number.isFinite(beta) || beta <= 0 || beta >= 0.5) {
+    throw new Error(`${label}.beta must be in (0,0.5)`);
+  }
+  if (!Number.isInteger(minGames) || minGames < 1) {
+    throw new Error(`${label}.min_games must be an integer >= 1`);
+  }
+  return {
+    p0,
+    p1,
+    alpha,
+    beta,
+    minGames,
+    winLlr: Math.log(p1 / p0),
+    lossLlr: Math.log((1 - p1) / (1 - p0)),
+    lowerBound: Math.log(beta / (1 - alpha)),
+    upperBound: Math.log((1 - beta) / alpha),
+  };
+}
+
+function wilsonInterval(successes, trials, z = 1.96) {
+  if (!(trials > 0)) return { low: 0, high: 1 };
+  const p = successes / trials;
+  const z2 = z * z;
+  const denom = 1 + z2 / trials;
+  const center = (p + z2 / (2 * trials)) / denom;
+  const half = (z * Math.sqrt((p * (1 - p)) / trials + z2 / (4 * trials * trials))) / denom;
+  return { low: Math.max(0, center - half), high: Math.min(1, center + half) };
+}
+
 function parseArgs(argv) {
   const args = [...argv];
   const out = {
     genomePath: "",
+    genomeBatch: [],
+    genomeBatchFromStdin: false,
     opponentGenomePath: "",
     games: 3,
+    gameOffset: 0,
+    scheduleGames: 0,
     seed: "neat-python",
     maxSteps: 600,
     opponentPolicy: "",
@@ -342,6 +417,7 @@ function parseArgs(argv) {
     fixedFirstTurn: "human",
     continuousSeries: true,
     kiboOut: "",
+    crnReferencePolicy: "",
     // NOTE:
     // - fitnessGoldScale is used as tanh normalization scale for mean_gold_delta.
     // - fitnessGoldNeutralDelta shifts gold neutral baseline (0-score point).
@@ -354,8 +430,10 @@ function parseArgs(argv) {
     fitnessWinNeutralRate: null,
     earlyStopWinRateCutoffs: [],
     earlyStopGoTakeRateCutoffs: [],
+    earlyStopSprt: null,
     controlPolicyMode: "pure_model",
     nativeInferenceBackend: "off",
+    timingBreakdown: false,
   };
 
   while (args.length > 0) {
@@ -372,8 +450,30 @@ function parseArgs(argv) {
     }
 
     if (key === "--genome") out.genomePath = String(value || "").trim();
+    else if (key === "--genome-batch" && String(value || "").trim() === "-") {
+      out.genomeBatch = [];
+      out.genomeBatchFromStdin = true;
+    }
+    else if (key === "--genome-batch") {
+      let parsed = null;
+      try {
+        parsed = JSON.parse(String(value || "[]"));
+      } catch (err) {
+        throw new Error(`invalid --genome-batch JSON: ${String(err && err.message ? err.message : err)}`);
+      }
+      if (!Array.isArray(parsed) || parsed.length <= 0) {
+        throw new Error("--genome-batch must be a non-empty JSON array of genome paths");
+      }
+      out.genomeBatch = parsed.map((item) => {
+        const genomePath = String(item || "").trim();
+        if (!genomePath) throw new Error("--genome-batch items must be non-empty genome paths");
+        return genomePath;
+      });
+    }
     else if (key === "--opponent-genome") out.opponentGenomePath = String(value || "").trim();
     else if (key === "--games") out.games = Math.max(1, Number(value || 0));
+    else if (key === "--game-offset") out.gameOffset = Math.max(0, Math.floor(Number(value || 0)));
+    else if (key === "--schedule-games") out.scheduleGames = Math.max(0, Math.floor(Number(value || 0)));
     else if (key === "--seed") out.seed = String(value || "neat-python");
     else if (key === "--max-steps") out.maxSteps = Math.max(20, Number(value || 600));
     else if (key === "--opponent-policy") out.opponentPolicy = String(value || "").trim();
@@ -415,6 +515,7 @@ function parseArgs(argv) {
     }
     else if (key === "--continuous-series") out.continuousSeries = !(String(value || "1").trim() === "0");
     else if (key === "--kibo-out") out.kiboOut = String(value || "").trim();
+    else if (key === "--crn-reference-policy") out.crnReferencePolicy = String(value || "").trim();
     else if (key === "--fitness-gold-scale") out.fitnessGoldScale = Number(value);
     else if (key === "--fitness-gold-neutral-delta") out.fitnessGoldNeutralDelta = Number(value);
     else if (key === "--fitness-win-weight") out.fitnessWinWeight = Number(value);
@@ -429,8 +530,10 @@ function parseArgs(argv) {
         "--early-stop-go-take-rate-cutoffs"
       );
     }
+    else if (key === "--early-stop-sprt") out.earlyStopSprt = parseEarlyStopSprt(value, "--early-stop-sprt");
     else if (key === "--control-policy-mode") out.controlPolicyMode = normalizeControlPolicyMode(value);
     else if (key === "--native-inference-backend") out.nativeInferenceBackend = String(value || "off").trim().toLowerCase();
+    else if (key === "--timing-breakdown") out.timingBreakdown = String(value || "1").trim() !== "0";
     else if (key === "--control-heuristic-policy") {
       throw new Error(`deprecated option: ${key} (control fallback modes were removed)`);
     }
@@ -440,7 +543,14 @@ function parseArgs(argv) {
     else throw new Error(`Unknown argument: ${key}`);
   }
 
-  if (!out.genomePath) throw new Error("--genome is required");
+  const hasGenomeBatch = out.genomeBatch.length > 0 || out.genomeBatchFromStdin;
+  if (!out.genomePath && !hasGenomeBatch) throw new Error("--genome or --genome-batch is required");
+  if (out.genomePath && hasGenomeBatch) {
+    throw new Error("--genome and --genome-batch are mutually exclusive");
+  }
+  if (out.kiboOut && hasGenomeBatch) {
+    throw new Error("--kibo-out is not supported with --genome-batch");
+  }
   if (out.firstTurnPolicy !== "alternate" && out.firstTurnPolicy !== "fixed") {
     throw new Error(`invalid --first-turn-policy: ${out.firstTurnPolicy}`);
   }
@@ -646,6 +756,103 @@ function buildEvaluationSchedule(opts, totalGames) {
   return schedule;
 }
 
+function cachedStartRound(seed, firstTurnKey) {
+  const key = `${seed}|first=${firstTurnKey}`;
+  let state = ROUND_START_CACHE.get(key);
+  if (!state) {
+    state = startRound(seed, firstTurnKey);
+    if (ROUND_START_CACHE.size >= ROUND_START_CACHE_LIMIT) {
+      ROUND_START_CACHE.delete(ROUND_START_CACHE.keys().next().value);
+    }
+    ROUND_START_CACHE.set(key, state);
+  }
+  // playTurn mutates parts of its input (pushCaptured appends to captured), so every game
+  // gets its own copy and the cached start stays pristine.
+  return structuredClone(state);
+}
+
+function roundResultScore(winner, controlActor) {
+  if (winner === controlActor) return 1;
+  if (winner === "human" || winner === "ai") return 0;
+  return 0.5;
+}
+
+// Reference-policy outcome for one scheduled game, replaying the same deal/seed/seat.
+// In continuous series the reference runs its own series from the same series start.
+async function resolveCrnReferenceOutcome(opts, plan, game, referenceSession, controlActor) {
+  if (CRN_REFERENCE_CACHE_SEED !== opts.seed) {
+    CRN_REFERENCE_CACHE.clear();
+    CRN_REFERENCE_CACHE_SEED = opts.seed;
+  }
+  const seriesKey = opts.continuousSeries ? `series_from=${plan.gameOffset}` : "fresh";
+  const key = [
+    opts.crnReferencePolicy,
+    game.opponentPolicy,
+    String(opts.opponentGenomePath || ""),
+    plan.maxSteps,
+    seriesKey,
+    game.seed,
+  ].join("|");
+  let outcome = CRN_REFERENCE_CACHE.get(key);
+  if (!outcome) {
+    const roundStart =
+      opts.continuousSeries && referenceSession.previousEndState
+        ? continueRound(referenceSession.previousEndState, game.seed, game.firstTurnKey)
+        : cachedStartRound(game.seed, game.firstTurnKey);
+    const beforeGoldDiff = controlGoldDiff(roundStart, controlActor);
+    const result = await runEvalRound(
+      roundStart,
+      null,
+      game.seed,
+      controlActor,
+      game.opponentPolicy,
+      plan.maxSteps,
+      opts.opponentGenomePath,
+      { controlSpec: resolveOpponentSpec(opts.crnReferencePolicy, opts.opponentGenomePath) }
+    );
+    const endState = result?.endState || result;
+    outcome = {
+      endState,
+      goldDelta: controlGoldDiff(endState, controlActor) - beforeGoldDiff,
+      score: roundResultScore(endState?.result?.winner || "unknown", controlActor),
+      win: (endState?.result?.winner || "") === controlActor ? 1 : 0,
+    };
+    CRN_REFERENCE_CACHE.set(key, outcome);
+    referenceSession.misses += 1;
+  } else {
+    referenceSession.hits += 1;
+  }
+  referenceSession.previousEndState = outcome.endState;
+  return outcome;
+}
+
+function meanAndStdErr(sum, sumsq, n) {
+  if (!(n > 0)) return { mean: 0, stdErr: null };
+  const mean = sum / n;
+  if (n < 2) return { mean, stdErr: null };
+  const variance = Math.max(0, (sumsq - n * mean * mean) / (n - 1));
+  return { mean, stdErr: Math.sqrt(variance / n) };
+}
+
+function buildCrnSummary(referencePolicy, sums, session) {
+  const n = Number(sums.games || 0);
+  const gold = meanAndStdErr(sums.gold_diff_sum, sums.gold_diff_sumsq, n);
+  const score = meanAndStdErr(sums.score_diff_sum, sums.score_diff_sumsq, n);
+  return {
+    reference_policy: referencePolicy,
+    games: n,
+    reference_win_rate: n > 0 ? sums.reference_wins / n : 0,
+    reference_mean_gold_delta: n > 0 ? sums.reference_gold_sum / n : 0,
+    mean_gold_delta_diff: gold.mean,
+    std_err_gold_delta_diff: gold.stdErr,
+    mean_result_diff: score.mean,
+    std_err_result_diff: score.stdErr,
+    reference_cache_hits: session.hits,
+    reference_cache_misses: session.misses,
+    sums: { ...sums },
+  };
+}
+
 function controlGoldDiff(state, controlActor) {
   const opp = controlActor === "human" ? "ai" : "human";
   const controlGold = Number(state?.players?.[controlActor]?.gold || 0);
@@ -670,6 +877,8 @@ async function runEvalRound(
     ai: { policyStates: new Map() },
   };
   const opponentSpec = resolveOpponentSpec(opponentPolicy, opponentGenomePath);
+  // controlSpec lets a CRN reference policy sit in the control seat instead of the genome.
+  const controlSpec = controlOptions.controlSpec || { kind: "model", model: controlModel };
   const controlPolicyMode = normalizeControlPolicyMode(controlOptions.controlPolicyMode || "pure_model");
   const nativeInferenceBackend = String(controlOptions.nativeInferenceBackend || "off");
   const nativeInferenceStats = controlOptions.nativeInferenceStats || null;
@@ -687,6 +896,7 @@ async function runEvalRound(
     gukjin_five_count: 0,
   };
   let goOpportunityCount = 0;
+  const controlDecisions = { play: 0, match: 0, option: 0 };
 
   let steps = 0;
   while (state.phase !== "resolution" && steps < maxSteps) {
@@ -715,11 +925,13 @@ async function runEvalRound(
     let controlDecisionOwnedByModel = false;
 
     if (actor === controlActor) {
+      if (decisionType) {
+        controlDecisions[decisionType] += 1;
+      }
       const opponentActor = actor === "human" ? "ai" : "human";
       next = (
         (await resolveResolvedPlayerActionAsync(state, actor, {
-          kind: "model",
-          model: controlModel,
+          ...controlSpec,
           runtimeCtx: runtimeCtxByActor[actor],
           opponentModel: opponentSpec?.model || null,
           opponentRuntimeCtx: runtimeCtxByActor[opponentActor],
@@ -733,7 +945,7 @@ async function runEvalRound(
       next = (await resolveResolvedPlayerActionAsync(state, actor, {
         ...opponentSpec,
         runtimeCtx: runtimeCtxByActor[actor],
-        opponentModel: controlModel,
+        opponentModel: controlSpec.model || null,
         opponentRuntimeCtx: runtimeCtxByActor[opponentActor],
         nativeInferenceBackend,
         nativeInferenceStats,
@@ -817,6 +1029,8 @@ async function runEvalRound(
     imitation,
     goOpportunityCount,
     behaviorDecisions,
+    steps,
+    controlDecisions,
   };
 }
 
@@ -859,19 +1073,38 @@ function buildImitationMetrics(totals, matches) {
 // =============================================================================
 // Section 5. Entrypoint
 // =============================================================================
-async function main() {
-  const evalStartMs = Date.now();
-  const opts = parseArgs(process.argv.slice(2));
-  const full = path.resolve(opts.genomePath);
-  if (!fs.existsSync(full)) throw new Error(`genome not found: ${opts.genomePath}`);
-
-  const controlModel = JSON.parse(fs.readFileSync(full, "utf8"));
+// Genome source: a file path, or an already-parsed payload sent inline ("-" on the CLI).
+function loadControlModel(genomeSource) {
+  let controlModel = genomeSource;
+  if (typeof genomeSource === "string") {
+    const full = path.resolve(genomeSource);
+    if (!fs.existsSync(full)) throw new Error(`genome not found: ${genomeSource}`);
+    controlModel = JSON.parse(fs.readFileSync(full, "utf8"));
+  }
   {
     const formatVersion = String(controlModel?.format_version || "").trim();
     if (formatVersion !== NEAT_MODEL_FORMAT) {
       throw new Error(`invalid --genome format: expected ${NEAT_MODEL_FORMAT}`);
     }
   }
+  return controlModel;
+}
+
+// "-" genome arguments: the server hands over request.genome, the CLI reads stdin.
+function resolveInlineGenomePayload(runtimeOptions) {
+  if (runtimeOptions.genomePayload !== undefined && runtimeOptions.genomePayload !== null) {
+    return runtimeOptions.genomePayload;
+  }
+  if (runtimeOptions.readStdin === false) {
+    throw new Error("inline genome payload is required when --genome/--genome-batch is '-'");
+  }
+  const raw = fs.readFileSync(0, "utf8");
+  if (!raw.trim()) throw new Error("stdin genome payload is empty");
+  return JSON.parse(raw);
+}
+
+// Per-invocation setup shared by every genome of a --genome-batch request.
+function prepareEvalPlan(opts) {
   if (String(opts.opponentPolicy || "").trim()) {
     resolveOpponentSpec(opts.opponentPolicy, opts.opponentGenomePath);
   }
@@ -880,14 +1113,35 @@ async function main() {
   }
 
   const requestedGames = Math.max(1, Math.floor(opts.games));
-  const maxSteps = Math.max(20, Math.floor(opts.maxSteps));
-  const evaluationSchedule = buildEvaluationSchedule(opts, requestedGames);
-  const earlyStopWinRateCutoffs = (opts.earlyStopWinRateCutoffs || []).filter(
-    (item) => item.games <= requestedGames
-  );
-  const earlyStopGoTakeRateCutoffs = (opts.earlyStopGoTakeRateCutoffs || []).filter(
-    (item) => item.games <= requestedGames
-  );
+  // --game-offset plays games [offset, offset + games) of one shared schedule so that
+  // partial runs (successive halving rounds) reuse the seeds of a single full run.
+  const gameOffset = Math.max(0, Math.floor(Number(opts.gameOffset || 0)));
+  const scheduleGames = Math.max(gameOffset + requestedGames, Math.floor(Number(opts.scheduleGames || 0)));
+  return {
+    requestedGames,
+    gameOffset,
+    scheduleGames,
+    maxSteps: Math.max(20, Math.floor(opts.maxSteps)),
+    evaluationSchedule: buildEvaluationSchedule(opts, scheduleGames),
+    earlyStopWinRateCutoffs: (opts.earlyStopWinRateCutoffs || []).filter(
+      (item) => item.games <= requestedGames
+    ),
+    earlyStopGoTakeRateCutoffs: (opts.earlyStopGoTakeRateCutoffs || []).filter(
+      (item) => item.games <= requestedGames
+    ),
+  };
+}
+
+async function evaluateControlModel(controlModel, opts, plan, evalStartMs = Date.now()) {
+  const {
+    requestedGames,
+    gameOffset,
+    scheduleGames,
+    maxSteps,
+    evaluationSchedule,
+    earlyStopWinRateCutoffs,
+    earlyStopGoTakeRateCutoffs,
+  } = plan;
   const controlActor = "ai";
   const opponentActor = "human";
   let wins = 0;
@@ -899,9 +1153,11 @@ async function main() {
     my_inflicted_bankrupt_count: 0,
   };
   const seatStats = {
-    first: { games: 0, wins: 0, losses: 0, draws: 0, goldSum: 0 },
-    second: { games: 0, wins: 0, losses: 0, draws: 0, goldSum: 0 },
+    first: { games: 0, wins: 0, losses: 0, draws: 0, goldSum: 0, goldSumSq: 0 },
+    second: { games: 0, wins: 0, losses: 0, draws: 0, goldSum: 0, goldSumSq: 0 },
   };
+  // Additive per-opponent-policy tallies for raw_stats.
+  const opponentStats = {};
   let goOpportunityCount = 0;
   let goOpportunityGames = 0;
   let goCount = 0;
@@ -909,28 +1165,48 @@ async function main() {
   let goFailCount = 0;
   const simImitationTotals = { play: 0, match: 0, option: 0 };
   const simImitationMatches = { play: 0, match: 0, option: 0 };
+  const controlDecisionTotals = { play: 0, match: 0, option: 0 };
+  let engineSteps = 0;
   const firstTurnCounts = {
     human: 0,
     ai: 0,
   };
   const opponentPolicyCounts = {};
   const seriesSession = {
-    roundsPlayed: 0,
+    roundsPlayed: gameOffset,
     previousEndState: null,
   };
   let completedGames = 0;
   let earlyStop = null;
   let nextEarlyStopCutoffIdx = 0;
   let nextEarlyStopGoTakeRateCutoffIdx = 0;
+  const earlyStopSprt = opts.earlyStopSprt;
+  let sprtLlr = 0;
+  const crnSession = {
+    previousEndState: null,
+    hits: 0,
+    misses: 0,
+  };
+  const crnSums = {
+    games: 0,
+    reference_wins: 0,
+    reference_gold_sum: 0,
+    gold_diff_sum: 0,
+    gold_diff_sumsq: 0,
+    score_diff_sum: 0,
+    score_diff_sumsq: 0,
+  };
   const kiboWriter = opts.kiboOut ? fs.createWriteStream(opts.kiboOut, { encoding: "utf8" }) : null;
   const nativeInferenceStats = {
     request_count: 0,
     by_backend: {},
   };
   resetRustPolicyBridgeStats();
+  resetModelPolicyStats();
+  const gameLoopStartMs = performance.now();
 
   try {
-    for (let gi = 0; gi < requestedGames; gi += 1) {
+    for (let gi = gameOffset; gi < gameOffset + requestedGames; gi += 1) {
       const scheduleItem = evaluationSchedule[gi];
       const firstTurnKey = String(scheduleItem?.firstTurnKey || "");
       const opponentPolicyForGame = String(scheduleItem?.opponentPolicy || "");
@@ -943,8 +1219,8 @@ async function main() {
       const roundStart = opts.continuousSeries
         ? seriesSession.previousEndState
           ? continueRound(seriesSession.previousEndState, seed, firstTurnKey)
-          : startRound(seed, firstTurnKey)
-        : startRound(seed, firstTurnKey);
+          : cachedStartRound(seed, firstTurnKey)
+        : cachedStartRound(seed, firstTurnKey);
       const beforeGoldDiff = controlGoldDiff(roundStart, controlActor);
       const gameResult = await runEvalRound(
         roundStart,
@@ -961,6 +1237,10 @@ async function main() {
         }
       );
       const endState = gameResult?.endState || gameResult;
+      engineSteps += Math.max(0, Number(gameResult?.steps || 0));
+      for (const key of Object.keys(controlDecisionTotals)) {
+        controlDecisionTotals[key] += Math.max(0, Number(gameResult?.controlDecisions?.[key] || 0));
+      }
       const controlGoOpportunityCount = Math.max(0, Number(gameResult?.goOpportunityCount || 0));
       const afterGoldDiff = controlGoldDiff(endState, controlActor);
       const goldDelta = afterGoldDiff - beforeGoldDiff;
@@ -969,6 +1249,18 @@ async function main() {
       const seatRecord = seatStats[seatKey];
       seatRecord.games += 1;
       seatRecord.goldSum += goldDelta;
+      seatRecord.goldSumSq += goldDelta * goldDelta;
+      const opponentRecord = (opponentStats[opponentPolicyForGame] ||= {
+        games: 0,
+        wins: 0,
+        losses: 0,
+        draws: 0,
+        gold_sum: 0,
+        gold_sum_sq: 0,
+      });
+      opponentRecord.games += 1;
+      opponentRecord.gold_sum += goldDelta;
+      opponentRecord.gold_sum_sq += goldDelta * goldDelta;
       const controlGold = Number(endState?.players?.[controlActor]?.gold || 0);
       const opponentGold = Number(endState?.players?.[opponentActor]?.gold || 0);
       const controlBankrupt = controlGold <= 0;
@@ -1012,25 +1304,47 @@ async function main() {
         seriesSession.previousEndState = endState;
       }
       seriesSession.roundsPlayed += 1;
-      completedGames = gi + 1;
+      completedGames = gi - gameOffset + 1;
 
       const winner = endState?.result?.winner || "unknown";
       if (winner === controlActor) {
         wins += 1;
         seatRecord.wins += 1;
+        opponentRecord.wins += 1;
       }
       else if (winner === opponentActor) {
         losses += 1;
         seatRecord.losses += 1;
+        opponentRecord.losses += 1;
       }
       else {
         draws += 1;
         seatRecord.draws += 1;
+        opponentRecord.draws += 1;
       }
       if (controlGoCount > 0 && winner !== controlActor) {
         goFailCount += 1;
       }
 
+      if (opts.crnReferencePolicy) {
+        const reference = await resolveCrnReferenceOutcome(
+          opts,
+          plan,
+          { seed, firstTurnKey, opponentPolicy: opponentPolicyForGame },
+          crnSession,
+          controlActor
+        );
+        const goldDiff = goldDelta - reference.goldDelta;
+        const scoreDiff = roundResultScore(winner, controlActor) - reference.score;
+        crnSums.games += 1;
+        crnSums.reference_wins += reference.win;
+        crnSums.reference_gold_sum += reference.goldDelta;
+        crnSums.gold_diff_sum += goldDiff;
+        crnSums.gold_diff_sumsq += goldDiff * goldDiff;
+        crnSums.score_diff_sum += scoreDiff;
+        crnSums.score_diff_sumsq += scoreDiff * scoreDiff;
+      }
+
       const gt = gameResult?.imitation?.totals || {};
       const gm = gameResult?.imitation?.matches || {};
       for (const k of ["play", "match", "option"]) {
@@ -1079,6 +1393,16 @@ async function main() {
         }
         nextEarlyStopGoTakeRateCutoffIdx += 1;
       }
+      if (earlyStopSprt) {
+        sprtLlr = (wins * earlyStopSprt.winLlr) + ((completedGames - wins) * earlyStopSprt.lossLlr);
+        if (!earlyStop && completedGames >= earlyStopSprt.minGames && sprtLlr <= earlyStopSprt.lowerBound) {
+          earlyStop = {
+            reason: "sprt_accept_h0",
+            cutoffGames: completedGames,
+            observedWinRate: wins / completedGames,
+          };
+        }
+      }
       if (earlyStop) {
         break;
       }
@@ -1087,16 +1411,20 @@ async function main() {
     if (kiboWriter) {
       kiboWriter.end();
     }
-    await closeAllRustPolicyBridges();
   }
+  const gameLoopMs = performance.now() - gameLoopStartMs;
 
   if (completedGames <= 0) {
     throw new Error("evaluation finished without any completed games");
   }
 
   const games = completedGames;
-  const meanGoldDelta = goldDeltas.length > 0 ? goldDeltas.reduce((a, b) => a + b, 0) / goldDeltas.length : 0;
+  const goldDeltaSum = goldDeltas.reduce((a, b) => a + b, 0);
+  const goldDeltaSumSq = goldDeltas.reduce((a, b) => a + b * b, 0);
+  const meanGoldDelta = goldDeltas.length > 0 ? goldDeltaSum / goldDeltas.length : 0;
   const winRate = wins / games;
+  const winRateCi = wilsonInterval(wins, games);
+  const crn = opts.crnReferencePolicy ? buildCrnSummary(opts.crnReferencePolicy, crnSums, crnSession) : null;
   const lossRate = losses / games;
   const drawRate = draws / games;
   const firstGames = Math.max(0, Number(seatStats.first.games || 0));
@@ -1154,10 +1482,26 @@ async function main() {
   const imitationOptionRatio = Number(simImitation.optionRatio || 0);
   const imitationWeights = simImitation.weights || { play: 0.5, match: 0.3, option: 0.2 };
   const imitationWeightedScore = Number(simImitation.weightedScore || 0);
+  const opponentBreakdown = {};
+  for (const policy of Object.keys(opponentStats).sort()) {
+    const block = opponentStats[policy];
+    opponentBreakdown[policy] = {
+      games: block.games,
+      wins: block.wins,
+      losses: block.losses,
+      draws: block.draws,
+      win_rate: block.games > 0 ? block.wins / block.games : 0,
+      loss_rate: block.games > 0 ? block.losses / block.games : 0,
+      draw_rate: block.games > 0 ? block.draws / block.games : 0,
+      mean_gold_delta: block.games > 0 ? block.gold_sum / block.games : 0,
+    };
+  }
 
   const summary = {
     games,
     requested_games: requestedGames,
+    game_offset: gameOffset,
+    schedule_games: scheduleGames,
     control_actor: controlActor,
     opponent_actor: opponentActor,
     opponent_policy: opts.opponentPolicy,
@@ -1173,6 +1517,18 @@ async function main() {
       min_go_take_rate: item.minGoTakeRate,
       max_go_take_rate: item.maxGoTakeRate,
     })),
+    early_stop_sprt: earlyStopSprt
+      ? {
+          p0: earlyStopSprt.p0,
+          p1: earlyStopSprt.p1,
+          alpha: earlyStopSprt.alpha,
+          beta: earlyStopSprt.beta,
+          min_games: earlyStopSprt.minGames,
+          lower_bound: earlyStopSprt.lowerBound,
+          upper_bound: earlyStopSprt.upperBound,
+        }
+      : null,
+    sprt_llr: earlyStopSprt ? sprtLlr : null,
     early_stop_triggered: !!earlyStop,
     early_stop_reason: earlyStop?.reason || null,
     early_stop_cutoff_games: earlyStop?.cutoffGames ?? null,
@@ -1208,6 +1564,10 @@ async function main() {
     losses,
     draws,
     win_rate: winRate,
+    win_rate_ci_low: winRateCi.low,
+    win_rate_ci_high: winRateCi.high,
+    win_rate_ci_z: 1.96,
+    crn,
     loss_rate: lossRate,
     draw_rate: drawRate,
     seat_breakdown: {
@@ -1237,9 +1597,10 @@ async function main() {
         draw_rate: weightedDrawRate,
         mean_gold_delta: weightedMeanGoldDelta,
         win_weights: { first: 0.48, second: 0.52 },
-        gold_weights: { first: 0.45, second: 0.55 },
+        gold_weights: { first: 0.48, second: 0.52 },
       },
     },
+    opponent_breakdown: opponentBreakdown,
     go_opportunity_count: goOpportunityCount,
     go_opportunity_games: goOpportunityGames,
     go_opportunity_rate: goOpportunityRate,
@@ -1250,6 +1611,7 @@ async function main() {
     go_rate: goRate,
     go_take_rate: goTakeRate,
     mean_gold_delta: meanGoldDelta,
+    gold_delta_sum_sq: goldDeltaSumSq,
     p10_gold_delta: quantile(goldDeltas, 0.1),
     p50_gold_delta: quantile(goldDeltas, 0.5),
     p90_gold_delta: quantile(goldDeltas, 0.9),
@@ -1302,17 +1664,154 @@ async function main() {
         gold: fitnessGoldWeight,
       },
     },
+    // Sufficient statistics: every field is a plain sum over games (except format and
+    // imitation_weights), so summaries of disjoint game sets can be added and re-finalized
+    // (neat_train.py _merge_eval_raw_stats / _finalize_eval_stats).
+    raw_stats: {
+      format: "neat_eval_raw_stats_v1",
+      games,
+      wins,
+      losses,
+      draws,
+      gold_delta_sum: goldDeltaSum,
+      gold_delta_sum_sq: goldDeltaSumSq,
+      go_opportunity_count: goOpportunityCount,
+      go_opportunity_games: goOpportunityGames,
+      go_count: goCount,
+      go_games: goGames,
+      go_fail_count: goFailCount,
+      my_bankrupt_count: bankrupt.my_bankrupt_count,
+      inflicted_bankrupt_count: bankrupt.my_inflicted_bankrupt_count,
+      imitation_totals: cloneDecisionCounters(simImitationTotals),
+      imitation_matches: cloneDecisionCounters(simImitationMatches),
+      imitation_weights: { ...imitationWeights },
+      seats: {
+        first: {
+          games: firstGames,
+          wins: seatStats.first.wins,
+          losses: seatStats.first.losses,
+          draws: seatStats.first.draws,
+          gold_sum: seatStats.first.goldSum,
+          gold_sum_sq: seatStats.first.goldSumSq,
+        },
+        second: {
+          games: secondGames,
+          wins: seatStats.second.wins,
+          losses: seatStats.second.losses,
+          draws: seatStats.second.draws,
+          gold_sum: seatStats.second.goldSum,
+          gold_sum_sq: seatStats.second.goldSumSq,
+        },
+      },
+      opponents: opponentStats,
+      opponent_policy_counts: { ...opponentPolicyCounts },
+      first_turn_counts: { ...firstTurnCounts },
+      crn_sums: opts.crnReferencePolicy ? { ...crnSums } : null,
+    },
     eval_time_ms: Math.max(0, Date.now() - evalStartMs),
+    timing_breakdown: opts.timingBreakdown ? buildTimingBreakdown(gameLoopMs) : null,
+    throughput: buildThroughput(completedGames, engineSteps, controlDecisionTotals, gameLoopMs),
     seed_used: opts.seed,
     eval_ok: true,
     fitness,
   };
+  return summary;
+}
+
+// Compile and feature time happen inside the game loop, so they are subsets of game_loop_ms.
+function buildTimingBreakdown(gameLoopMs) {
+  const modelStats = getModelPolicyStats();
+  const moduleLoadMs = moduleLoadReported ? 0 : MODULE_LOAD_MS;
+  moduleLoadReported = true;
+  return {
+    module_load_ms: moduleLoadMs,
+    compile_ms: modelStats.compile_ms,
+    compile_count: modelStats.compile_count,
+    game_loop_ms: gameLoopMs,
+    feature_ms: modelStats.feature_ms,
+    feature_calls: modelStats.feature_calls,
+  };
+}
+
+// Rates are per second of game loop time; decisions are the control seat's, forward passes
+// count every model evaluation in the loop (a genome opponent included).
+function buildThroughput(games, engineSteps, decisions, gameLoopMs) {
+  const decisionCount = decisions.play + decisions.match + decisions.option;
+  const forwardPasses = getModelPolicyStats().forward_passes;
+  const perSec = (count) => (gameLoopMs > 0 ? (count * 1000) / gameLoopMs : 0);
+  return {
+    games,
+    engine_steps: engineSteps,
+    decisions: { ...decisions },
+    forward_passes: forwardPasses,
+    game_loop_ms: gameLoopMs,
+    games_per_sec: perSec(games),
+    steps_per_sec: perSec(engineSteps),
+    decisions_per_sec: perSec(decisionCount),
+    forward_passes_per_sec: perSec(forwardPasses),
+  };
+}
+
+export async function runNeatEvalCli(argv = process.argv.slice(2), runtimeOptions = {}) {
+  const writeStdout = runtimeOptions.writeStdout !== false;
+  const closeNativeBridges = runtimeOptions.closeNativeBridges !== false;
+  const evalStartMs = Date.now();
+  const opts = parseArgs(argv);
+  setModelPolicyTimingEnabled(opts.timingBreakdown);
+  let genomeSource = opts.genomePath;
+  let genomeBatch = opts.genomeBatch;
+  if (opts.genomePath === "-") {
+    genomeSource = resolveInlineGenomePayload(runtimeOptions);
+  } else if (opts.genomeBatchFromStdin) {
+    genomeBatch = resolveInlineGenomePayload(runtimeOptions);
+    if (!Array.isArray(genomeBatch) || genomeBatch.length <= 0) {
+      throw new Error("inline --genome-batch payload must be a non-empty JSON array");
+    }
+  }
+  let output = null;
+  try {
+    const plan = prepareEvalPlan(opts);
+    if (genomeBatch.length > 0) {
+      // One result per genome, in request order; a bad genome does not fail its batch mates.
+      const results = [];
+      for (let bi = 0; bi < genomeBatch.length; bi += 1) {
+        const source = genomeBatch[bi];
+        const label = typeof source === "string" ? source : `inline[${bi}]`;
+        try {
+          const summary = await evaluateControlModel(loadControlModel(source), opts, plan);
+          results.push({ genome: label, ok: true, summary });
+        } catch (err) {
+          results.push({
+            genome: label,
+            ok: false,
+            error: {
+              message: String(err?.message || err),
+              stack: String(err?.stack || ""),
+            },
+          });
+        }
+      }
+      output = { batch: true, results };
+    } else {
+      output = await evaluateControlModel(loadControlModel(genomeSource), opts, plan, evalStartMs);
+    }
+  } finally {
+    if (closeNativeBridges) {
+      await closeAllRustPolicyBridges();
+    }
+  }
 
-  process.stdout.write(`${JSON.stringify(summary)}\n`);
+  if (writeStdout) {
+    process.stdout.write(`${JSON.stringify(output)}\n`);
+  }
+  return output;
 }
 
-main().catch((err) => {
-  const msg = err && err.stack ? err.stack : String(err);
-  process.stderr.write(`${msg}\n`);
-  process.exit(1);
-});
+const executedPath = process.argv[1] ? pathToFileURL(path.resolve(process.argv[1])).href : "";
+if (import.meta.url === executedPath) {
+  runNeatEvalCli(process.argv.slice(2)).catch((err) => {
+    const msg = err && err.stack ? err.stack : String(err);
+    process.stderr.write(`${msg}\n`);
+    process.exit(1);
+  });
+}
@@ -7,7 +7,7 @@ Pipeline Stage: 1/3 (neat_train.py -> neat_eval_worker.mjs -> heuristic_duel_wor
 Execution Flow Map:
 1) parse_args()/main(): runtime bootstrap + NEAT train loop
 2) LoggedParallelEvaluator: generation-level metrics and gate tracking
-3) eval_function(): per-genome worker evaluation call
+3) _run_eval_worker_for_genomes(): batched worker evaluation call (one Node child per eval thread)
 
 File Layout Map (top-down):
 1) runtime defaults + normalization + env bridge helpers
@@ -15,22 +15,29 @@ File Layout Map (top-down):
 """
 
 import argparse
+import atexit
+import collections
+import concurrent.futures
 import copy
 import contextlib
 import functools
 import gzip
 import hashlib
+import io
 import json
 import math
-import multiprocessing as mp
 import os
 import pickle
+import queue
 import random
 import re
 import shutil
+import socketserver
+import sqlite3
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import traceback
 from datetime import datetime, timezone
@@ -47,6 +54,11 @@ try:
 except Exception:
     neat = None
 
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None
+
 
 # =============================================================================
 # Section 1. Runtime Schema + Primitive Coercion Helpers
@@ -382,6 +394,108 @@ def _parse_early_stop_go_take_rate_cutoffs(raw_value: object) -> list:
     return out
 
 
+def _parse_early_stop_sprt(raw_value: object) -> dict:
+    source = raw_value
+    if source is None:
+        source = {}
+    elif not isinstance(source, dict):
+        text = str(source).strip()
+        try:
+            source = json.loads(text) if text else {}
+        except Exception as exc:
+            raise RuntimeError(f"early_stop_sprt must be a JSON object: {exc}") from exc
+    if not isinstance(source, dict):
+        raise RuntimeError("early_stop_sprt must be a JSON object")
+
+    out = {
+        "delta": _to_float(source.get("delta"), 0.05),
+        "alpha": _to_float(source.get("alpha"), 0.05),
+        "beta": _to_float(source.get("beta"), 0.05),
+        "min_games": _to_int(source.get("min_games"), 20),
+        "topk": _to_int(source.get("topk"), 5),
+        "reference_win_rate": _safe_optional_float(source.get("reference_win_rate")),
+    }
+    if (not math.isfinite(out["delta"])) or out["delta"] <= 0.0 or out["delta"] >= 0.5:
+        raise RuntimeError("early_stop_sprt.delta must be in (0,0.5)")
+    for key in ("alpha", "beta"):
+        if (not math.isfinite(out[key])) or out[key] <= 0.0 or out[key] >= 0.5:
+            raise RuntimeError(f"early_stop_sprt.{key} must be in (0,0.5)")
+    if out["min_games"] < 1:
+        raise RuntimeError("early_stop_sprt.min_games must be >= 1")
+    if out["topk"] < 1:
+        raise RuntimeError("early_stop_sprt.topk must be >= 1")
+    reference = out["reference_win_rate"]
+    if reference is not None and ((not math.isfinite(reference)) or reference <= 0.0 or reference >= 1.0):
+        raise RuntimeError("early_stop_sprt.reference_win_rate must be in (0,1) or null")
+    return out
+
+
+def _parse_successive_halving(raw_value: object) -> dict:
+    source = raw_value
+    if source is None:
+        source = {}
+    elif not isinstance(source, dict):
+        text = str(source).strip()
+        try:
+            source = json.loads(text) if text else {}
+        except Exception as exc:
+            raise RuntimeError(f"successive_halving must be a JSON object: {exc}") from exc
+    if not isinstance(source, dict):
+        raise RuntimeError("successive_halving must be a JSON object")
+
+    out = {
+        "initial_games": _to_int(source.get("initial_games"), 50),
+        "keep_fraction": _to_float(source.get("keep_fraction"), 0.5),
+        "min_survivors": _to_int(source.get("min_survivors"), 1),
+    }
+    if out["initial_games"] < 1:
+        raise RuntimeError("successive_halving.initial_games must be >= 1")
+    if (not math.isfinite(out["keep_fraction"])) or out["keep_fraction"] <= 0.0 or out["keep_fraction"] >= 1.0:
+        raise RuntimeError("successive_halving.keep_fraction must be in (0,1)")
+    if out["min_survivors"] < 1:
+        raise RuntimeError("successive_halving.min_survivors must be >= 1")
+    return out
+
+
+def _parse_winner_playoff_racing(raw_value: object) -> dict:
+    if raw_value is None:
+        raw_value = {}
+    if not isinstance(raw_value, dict):
+        raise RuntimeError("runtime key 'winner_playoff_racing' must be an object")
+    cfg = {
+        "round_games": _to_int(raw_value.get("round_games"), 250),
+        "z": _to_float(raw_value.get("z"), 1.96),
+    }
+    if cfg["round_games"] < 1:
+        raise RuntimeError("winner_playoff_racing.round_games must be >= 1")
+    if cfg["z"] <= 0:
+        raise RuntimeError("winner_playoff_racing.z must be > 0")
+    return cfg
+
+
+def _parse_broker_listen(raw_value: object) -> tuple[str, int]:
+    text = str(raw_value or "").strip()
+    host, sep, port_text = text.rpartition(":")
+    if not sep or not host or not port_text.isdigit() or not (0 <= int(port_text) <= 65535):
+        raise RuntimeError(f"runtime key 'broker_listen' must be host:port (got {text!r})")
+    return host, int(port_text)
+
+
+def _sprt_hypotheses(reference_win_rate: Optional[float], sprt_cfg: dict) -> Optional[dict]:
+    """H1: win_rate = top-K reference (p1) vs H0: win_rate = p1 - delta (p0)."""
+    if reference_win_rate is None:
+        return None
+    delta = float(sprt_cfg["delta"])
+    p1 = min(0.99, max(delta + 0.01, float(reference_win_rate)))
+    return {
+        "p0": float(p1 - delta),
+        "p1": float(p1),
+        "alpha": float(sprt_cfg["alpha"]),
+        "beta": float(sprt_cfg["beta"]),
+        "min_games": int(sprt_cfg["min_games"]),
+    }
+
+
 def _load_runtime_config_recursive(path: str, cfg: dict, seen: set[str]) -> None:
     abs_path = os.path.abspath(path)
     if abs_path in seen:
@@ -506,9 +620,63 @@ def _normalize_runtime_values(cfg: dict) -> dict:
     cfg["switch_seats"] = _required_bool(cfg, "switch_seats")
 
     cfg["checkpoint_every"] = _required_int(cfg, "checkpoint_every", 1)
+    cfg["checkpoint_async"] = _to_bool(cfg.get("checkpoint_async"), True)
+    cfg["checkpoint_full_every"] = _to_int(cfg.get("checkpoint_full_every"), 1)
+    if cfg["checkpoint_full_every"] < 1:
+        raise RuntimeError("runtime key 'checkpoint_full_every' must be >= 1 (1 = every checkpoint is full)")
+    cfg["checkpoint_keep_last"] = _to_int(cfg.get("checkpoint_keep_last"), 0)
+    if cfg["checkpoint_keep_last"] < 0:
+        raise RuntimeError("runtime key 'checkpoint_keep_last' must be >= 0 (0 = keep every checkpoint)")
+    cfg["checkpoint_keep_every"] = _to_int(cfg.get("checkpoint_keep_every"), 0)
+    if cfg["checkpoint_keep_every"] < 0:
+        raise RuntimeError("runtime key 'checkpoint_keep_every' must be >= 0 (0 = off)")
+    cfg["checkpoint_keep_best"] = _to_bool(cfg.get("checkpoint_keep_best"), True)
+    cfg["lineage_compact_every"] = _to_int(cfg.get("lineage_compact_every"), 50)
+    if cfg["lineage_compact_every"] < 1:
+        raise RuntimeError("runtime key 'lineage_compact_every' must be >= 1 (1 = rewrite lineage_state.json every generation)")
+    cfg["lineage_index"] = _to_bool(cfg.get("lineage_index"), True)
+    cfg["metrics_background_writer"] = _to_bool(cfg.get("metrics_background_writer"), True)
+    cfg["metrics_compression"] = str(cfg.get("metrics_compression") or "none").strip().lower()
+    if cfg["metrics_compression"] not in ("none", "gzip"):
+        raise RuntimeError("runtime key 'metrics_compression' must be one of: none, gzip")
+    cfg["metrics_columnar"] = str(cfg.get("metrics_columnar") or "off").strip().lower()
+    if cfg["metrics_columnar"] not in ("off", "npy"):
+        raise RuntimeError("runtime key 'metrics_columnar' must be one of: off, npy")
+    if cfg["metrics_columnar"] == "npy" and np is None:
+        raise RuntimeError("metrics_columnar = npy needs numpy. Install with: pip install numpy")
+    cfg["timing_breakdown"] = _to_bool(cfg.get("timing_breakdown"), False)
     cfg["eval_script"] = str(_required_value(cfg, "eval_script") or "").strip()
     if not cfg["eval_script"]:
         raise RuntimeError("runtime key 'eval_script' must be non-empty")
+    cfg["eval_backend"] = str(cfg.get("eval_backend") or "js_worker").strip().lower()
+    if cfg["eval_backend"] not in ("js_worker", "broker"):
+        raise RuntimeError("runtime key 'eval_backend' must be one of: js_worker, broker")
+    cfg["broker_listen"] = str(cfg.get("broker_listen") or "127.0.0.1:7788").strip()
+    _parse_broker_listen(cfg["broker_listen"])
+    cfg["broker_heartbeat_sec"] = _to_float(cfg.get("broker_heartbeat_sec"), 5.0)
+    if cfg["broker_heartbeat_sec"] <= 0:
+        raise RuntimeError("runtime key 'broker_heartbeat_sec' must be > 0")
+    cfg["broker_max_attempts"] = _to_int(cfg.get("broker_max_attempts"), 3)
+    if cfg["broker_max_attempts"] < 1:
+        raise RuntimeError("runtime key 'broker_max_attempts' must be >= 1")
+    cfg["eval_worker_mode"] = str(cfg.get("eval_worker_mode") or "persistent").strip().lower()
+    if cfg["eval_worker_mode"] not in ("persistent", "spawn"):
+        raise RuntimeError("runtime key 'eval_worker_mode' must be one of: persistent, spawn")
+    cfg["eval_batch_size"] = _to_int(cfg.get("eval_batch_size"), 0)
+    if cfg["eval_batch_size"] < 0:
+        raise RuntimeError("runtime key 'eval_batch_size' must be >= 0 (0 = auto)")
+    cfg["eval_job_order"] = str(cfg.get("eval_job_order") or "population").strip().lower()
+    if cfg["eval_job_order"] not in ("longest_first", "population"):
+        raise RuntimeError("runtime key 'eval_job_order' must be one of: longest_first, population")
+    cfg["continuous_series"] = _to_bool(cfg.get("continuous_series"), True)
+    cfg["eval_shard_games"] = _to_int(cfg.get("eval_shard_games"), 0)
+    if cfg["eval_shard_games"] < 0:
+        raise RuntimeError("runtime key 'eval_shard_games' must be >= 0 (0 = no sharding)")
+    if cfg["eval_shard_games"] > 0 and cfg["continuous_series"]:
+        raise RuntimeError(
+            "runtime key 'eval_shard_games' needs continuous_series = false: "
+            "every shard restarts the gold series at its game offset"
+        )
     cfg["seed"] = str(_required_value(cfg, "seed") or "").strip()
     if not cfg["seed"]:
         raise RuntimeError("runtime key 'seed' must be non-empty")
@@ -528,6 +696,9 @@ def _normalize_runtime_values(cfg: dict) -> dict:
     cfg["gate_ema_window"] = _required_int(cfg, "gate_ema_window", 2)
     cfg["transition_ema_imitation"] = _required_optional_float(cfg, "transition_ema_imitation")
     cfg["transition_ema_win_rate"] = _required_optional_float(cfg, "transition_ema_win_rate")
+    cfg["transition_win_rate_basis"] = str(cfg.get("transition_win_rate_basis") or "point").strip().lower()
+    if cfg["transition_win_rate_basis"] not in ("point", "ci_low"):
+        raise RuntimeError("runtime key 'transition_win_rate_basis' must be one of: point, ci_low")
     cfg["transition_mean_gold_delta_min"] = _required_optional_float(cfg, "transition_mean_gold_delta_min")
     cfg["transition_best_fitness_min"] = _required_optional_float(cfg, "transition_best_fitness_min")
     cfg["transition_streak"] = _required_int(cfg, "transition_streak", 1)
@@ -545,12 +716,55 @@ def _normalize_runtime_values(cfg: dict) -> dict:
     cfg["early_stop_go_take_rate_cutoffs"] = _parse_early_stop_go_take_rate_cutoffs(
         cfg.get("early_stop_go_take_rate_cutoffs")
     )
+    cfg["early_stop_mode"] = str(cfg.get("early_stop_mode") or "cutoffs").strip().lower()
+    if cfg["early_stop_mode"] not in ("cutoffs", "sprt"):
+        raise RuntimeError("runtime key 'early_stop_mode' must be one of: cutoffs, sprt")
+    cfg["early_stop_sprt"] = _parse_early_stop_sprt(cfg.get("early_stop_sprt"))
+    cfg["crn_reference_policy"] = str(cfg.get("crn_reference_policy") or "").strip()
+    cfg["eval_cache"] = str(cfg.get("eval_cache") or "off").strip().lower()
+    if cfg["eval_cache"] not in ("off", "ndjson"):
+        raise RuntimeError("runtime key 'eval_cache' must be one of: off, ndjson")
+    cfg["eval_cache_path"] = str(cfg.get("eval_cache_path") or "").strip()
+    cfg["eval_cache_seed_scope"] = str(cfg.get("eval_cache_seed_scope") or "generation").strip().lower()
+    if cfg["eval_cache_seed_scope"] not in ("generation", "run"):
+        raise RuntimeError("runtime key 'eval_cache_seed_scope' must be one of: generation, run")
+    cfg["eval_schedule"] = str(cfg.get("eval_schedule") or "full").strip().lower()
+    if cfg["eval_schedule"] not in ("full", "successive_halving"):
+        raise RuntimeError("runtime key 'eval_schedule' must be one of: full, successive_halving")
+    if cfg["eval_schedule"] == "successive_halving" and cfg["continuous_series"]:
+        raise RuntimeError(
+            "eval_schedule=successive_halving needs continuous_series = false: "
+            "every round restarts the gold series at its game offset"
+        )
+    cfg["successive_halving"] = _parse_successive_halving(cfg.get("successive_halving"))
+    cfg["evolution_mode"] = str(cfg.get("evolution_mode") or "generational").strip().lower()
+    if cfg["evolution_mode"] not in ("generational", "steady_state"):
+        raise RuntimeError("runtime key 'evolution_mode' must be one of: generational, steady_state")
+    if cfg["evolution_mode"] == "steady_state" and cfg["eval_schedule"] != "full":
+        raise RuntimeError("evolution_mode=steady_state requires eval_schedule=full")
     cfg["control_policy_mode"] = _normalize_control_policy_mode(cfg.get("control_policy_mode"))
     cfg["winner_playoff_topk"] = max(1, _to_int(cfg.get("winner_playoff_topk"), 5))
     cfg["winner_playoff_games"] = max(
         1,
         _to_int(cfg.get("winner_playoff_games"), cfg["games_per_genome"]),
     )
+    cfg["winner_playoff_mode"] = str(cfg.get("winner_playoff_mode") or "full").strip().lower()
+    if cfg["winner_playoff_mode"] not in ("full", "racing"):
+        raise RuntimeError("runtime key 'winner_playoff_mode' must be one of: full, racing")
+    if cfg["winner_playoff_mode"] == "racing" and cfg["continuous_series"]:
+        raise RuntimeError(
+            "winner_playoff_mode=racing needs continuous_series = false: "
+            "every race round restarts the gold series at its game offset"
+        )
+    cfg["winner_playoff_racing"] = _parse_winner_playoff_racing(cfg.get("winner_playoff_racing"))
+    cfg["winner_playoff_shard_games"] = _to_int(cfg.get("winner_playoff_shard_games"), 0)
+    if cfg["winner_playoff_shard_games"] < 0:
+        raise RuntimeError("runtime key 'winner_playoff_shard_games' must be >= 0 (0 = no sharding)")
+    if cfg["winner_playoff_shard_games"] > 0 and cfg["continuous_series"]:
+        raise RuntimeError(
+            "runtime key 'winner_playoff_shard_games' needs continuous_series = false: "
+            "every shard restarts the gold series at its game offset"
+        )
     cfg["winner_playoff_win_rate_tie_threshold"] = max(
         0.0, _to_float(cfg.get("winner_playoff_win_rate_tie_threshold"), 0.01)
     )
@@ -590,7 +804,27 @@ def _set_eval_env(runtime: dict, output_dir: str) -> None:
     os.environ[f"{ENV_PREFIX}GENERATIONS"] = str(int(runtime["generations"]))
     os.environ[f"{ENV_PREFIX}EVAL_WORKERS"] = str(int(runtime["eval_workers"]))
     os.environ[f"{ENV_PREFIX}CHECKPOINT_EVERY"] = str(int(runtime["checkpoint_every"]))
+    os.environ[f"{ENV_PREFIX}CHECKPOINT_ASYNC"] = "1" if bool(runtime["checkpoint_async"]) else "0"
+    os.environ[f"{ENV_PREFIX}CHECKPOINT_FULL_EVERY"] = str(int(runtime["checkpoint_full_every"]))
+    os.environ[f"{ENV_PREFIX}CHECKPOINT_KEEP_LAST"] = str(int(runtime["checkpoint_keep_last"]))
+    os.environ[f"{ENV_PREFIX}CHECKPOINT_KEEP_EVERY"] = str(int(runtime["checkpoint_keep_every"]))
+    os.environ[f"{ENV_PREFIX}CHECKPOINT_KEEP_BEST"] = "1" if bool(runtime["checkpoint_keep_best"]) else "0"
+    os.environ[f"{ENV_PREFIX}LINEAGE_COMPACT_EVERY"] = str(int(runtime["lineage_compact_every"]))
+    os.environ[f"{ENV_PREFIX}LINEAGE_INDEX"] = "1" if bool(runtime["lineage_index"]) else "0"
+    os.environ[f"{ENV_PREFIX}METRICS_BACKGROUND_WRITER"] = "1" if bool(runtime["metrics_background_writer"]) else "0"
+    os.environ[f"{ENV_PREFIX}METRICS_COMPRESSION"] = str(runtime["metrics_compression"])
+    os.environ[f"{ENV_PREFIX}METRICS_COLUMNAR"] = str(runtime["metrics_columnar"])
+    os.environ[f"{ENV_PREFIX}TIMING_BREAKDOWN"] = "1" if bool(runtime["timing_breakdown"]) else "0"
     os.environ[f"{ENV_PREFIX}EVAL_SCRIPT"] = os.path.abspath(str(runtime["eval_script"]))
+    os.environ[f"{ENV_PREFIX}EVAL_BACKEND"] = str(runtime["eval_backend"])
+    os.environ[f"{ENV_PREFIX}BROKER_LISTEN"] = str(runtime["broker_listen"])
+    os.environ[f"{ENV_PREFIX}BROKER_HEARTBEAT_SEC"] = str(float(runtime["broker_heartbeat_sec"]))
+    os.environ[f"{ENV_PREFIX}BROKER_MAX_ATTEMPTS"] = str(int(runtime["broker_max_attempts"]))
+    os.environ[f"{ENV_PREFIX}EVAL_WORKER_MODE"] = str(runtime["eval_worker_mode"])
+    os.environ[f"{ENV_PREFIX}EVAL_BATCH_SIZE"] = str(int(runtime["eval_batch_size"]))
+    os.environ[f"{ENV_PREFIX}EVAL_JOB_ORDER"] = str(runtime["eval_job_order"])
+    os.environ[f"{ENV_PREFIX}CONTINUOUS_SERIES"] = "1" if bool(runtime["continuous_series"]) else "0"
+    os.environ[f"{ENV_PREFIX}EVAL_SHARD_GAMES"] = str(int(runtime["eval_shard_games"]))
     os.environ[f"{ENV_PREFIX}GAMES_PER_GENOME"] = str(int(runtime["games_per_genome"]))
     os.environ[f"{ENV_PREFIX}EVAL_TIMEOUT_SEC"] = str(int(runtime["eval_timeout_sec"]))
     os.environ[f"{ENV_PREFIX}MAX_EVAL_STEPS"] = str(int(runtime["max_eval_steps"]))
@@ -618,6 +852,7 @@ def _set_eval_env(runtime: dict, output_dir: str) -> None:
     os.environ[f"{ENV_PREFIX}GATE_EMA_WINDOW"] = str(int(runtime["gate_ema_window"]))
     os.environ[f"{ENV_PREFIX}TRANSITION_EMA_IMITATION"] = str(runtime.get("transition_ema_imitation"))
     os.environ[f"{ENV_PREFIX}TRANSITION_EMA_WIN_RATE"] = str(runtime.get("transition_ema_win_rate"))
+    os.environ[f"{ENV_PREFIX}TRANSITION_WIN_RATE_BASIS"] = str(runtime["transition_win_rate_basis"])
     os.environ[f"{ENV_PREFIX}TRANSITION_MEAN_GOLD_DELTA_MIN"] = str(
         runtime.get("transition_mean_gold_delta_min")
     )
@@ -640,6 +875,23 @@ def _set_eval_env(runtime: dict, output_dir: str) -> None:
         ensure_ascii=False,
         separators=(",", ":"),
     )
+    os.environ[f"{ENV_PREFIX}EARLY_STOP_MODE"] = str(runtime["early_stop_mode"])
+    os.environ[f"{ENV_PREFIX}EVAL_SCHEDULE"] = str(runtime["eval_schedule"])
+    os.environ[f"{ENV_PREFIX}EVOLUTION_MODE"] = str(runtime["evolution_mode"])
+    os.environ[f"{ENV_PREFIX}CRN_REFERENCE_POLICY"] = str(runtime["crn_reference_policy"])
+    os.environ[f"{ENV_PREFIX}EVAL_CACHE"] = str(runtime["eval_cache"])
+    os.environ[f"{ENV_PREFIX}EVAL_CACHE_PATH"] = str(runtime["eval_cache_path"])
+    os.environ[f"{ENV_PREFIX}EVAL_CACHE_SEED_SCOPE"] = str(runtime["eval_cache_seed_scope"])
+    os.environ[f"{ENV_PREFIX}SUCCESSIVE_HALVING"] = json.dumps(
+        runtime["successive_halving"],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    os.environ[f"{ENV_PREFIX}EARLY_STOP_SPRT"] = json.dumps(
+        runtime["early_stop_sprt"],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
 
 
 def _runtime_from_env() -> Dict[str, object]:
@@ -648,6 +900,15 @@ def _runtime_from_env() -> Dict[str, object]:
         "generations": os.environ.get(f"{ENV_PREFIX}GENERATIONS"),
         "eval_workers": os.environ.get(f"{ENV_PREFIX}EVAL_WORKERS"),
         "eval_script": os.environ.get(f"{ENV_PREFIX}EVAL_SCRIPT") or "",
+        "eval_backend": os.environ.get(f"{ENV_PREFIX}EVAL_BACKEND"),
+        "broker_listen": os.environ.get(f"{ENV_PREFIX}BROKER_LISTEN"),
+        "broker_heartbeat_sec": os.environ.get(f"{ENV_PREFIX}BROKER_HEARTBEAT_SEC"),
+        "broker_max_attempts": os.environ.get(f"{ENV_PREFIX}BROKER_MAX_ATTEMPTS"),
+        "eval_worker_mode": os.environ.get(f"{ENV_PREFIX}EVAL_WORKER_MODE"),
+        "eval_batch_size": os.environ.get(f"{ENV_PREFIX}EVAL_BATCH_SIZE"),
+        "eval_job_order": os.environ.get(f"{ENV_PREFIX}EVAL_JOB_ORDER"),
+        "continuous_series": os.environ.get(f"{ENV_PREFIX}CONTINUOUS_SERIES"),
+        "eval_shard_games": os.environ.get(f"{ENV_PREFIX}EVAL_SHARD_GAMES"),
         "games_per_genome": os.environ.get(f"{ENV_PREFIX}GAMES_PER_GENOME"),
         "eval_timeout_sec": os.environ.get(f"{ENV_PREFIX}EVAL_TIMEOUT_SEC"),
         "max_eval_steps": os.environ.get(f"{ENV_PREFIX}MAX_EVAL_STEPS"),
@@ -656,6 +917,17 @@ def _runtime_from_env() -> Dict[str, object]:
         "opponent_genome": os.environ.get(f"{ENV_PREFIX}OPPONENT_GENOME"),
         "switch_seats": os.environ.get(f"{ENV_PREFIX}SWITCH_SEATS"),
         "checkpoint_every": os.environ.get(f"{ENV_PREFIX}CHECKPOINT_EVERY"),
+        "checkpoint_async": os.environ.get(f"{ENV_PREFIX}CHECKPOINT_ASYNC"),
+        "checkpoint_full_every": os.environ.get(f"{ENV_PREFIX}CHECKPOINT_FULL_EVERY"),
+        "checkpoint_keep_last": os.environ.get(f"{ENV_PREFIX}CHECKPOINT_KEEP_LAST"),
+        "checkpoint_keep_every": os.environ.get(f"{ENV_PREFIX}CHECKPOINT_KEEP_EVERY"),
+        "checkpoint_keep_best": os.environ.get(f"{ENV_PREFIX}CHECKPOINT_KEEP_BEST"),
+        "lineage_compact_every": os.environ.get(f"{ENV_PREFIX}LINEAGE_COMPACT_EVERY"),
+        "lineage_index": os.environ.get(f"{ENV_PREFIX}LINEAGE_INDEX"),
+        "metrics_background_writer": os.environ.get(f"{ENV_PREFIX}METRICS_BACKGROUND_WRITER"),
+        "metrics_compression": os.environ.get(f"{ENV_PREFIX}METRICS_COMPRESSION"),
+        "metrics_columnar": os.environ.get(f"{ENV_PREFIX}METRICS_COLUMNAR"),
+        "timing_breakdown": os.environ.get(f"{ENV_PREFIX}TIMING_BREAKDOWN"),
         "seed": os.environ.get(f"{ENV_PREFIX}SEED"),
         "feature_profile": os.environ.get(f"{ENV_PREFIX}FEATURE_PROFILE"),
         "output_dir": os.environ.get(f"{ENV_PREFIX}OUTPUT_DIR"),
@@ -668,6 +940,7 @@ def _runtime_from_env() -> Dict[str, object]:
         "gate_ema_window": os.environ.get(f"{ENV_PREFIX}GATE_EMA_WINDOW"),
         "transition_ema_imitation": os.environ.get(f"{ENV_PREFIX}TRANSITION_EMA_IMITATION"),
         "transition_ema_win_rate": os.environ.get(f"{ENV_PREFIX}TRANSITION_EMA_WIN_RATE"),
+        "transition_win_rate_basis": os.environ.get(f"{ENV_PREFIX}TRANSITION_WIN_RATE_BASIS"),
         "transition_mean_gold_delta_min": os.environ.get(f"{ENV_PREFIX}TRANSITION_MEAN_GOLD_DELTA_MIN"),
         "transition_best_fitness_min": os.environ.get(f"{ENV_PREFIX}TRANSITION_BEST_FITNESS_MIN"),
         "transition_streak": os.environ.get(f"{ENV_PREFIX}TRANSITION_STREAK"),
@@ -678,6 +951,15 @@ def _runtime_from_env() -> Dict[str, object]:
         "failure_slope_metric": os.environ.get(f"{ENV_PREFIX}FAILURE_SLOPE_METRIC"),
         "early_stop_win_rate_cutoffs": os.environ.get(f"{ENV_PREFIX}EARLY_STOP_WIN_RATE_CUTOFFS"),
         "early_stop_go_take_rate_cutoffs": os.environ.get(f"{ENV_PREFIX}EARLY_STOP_GO_TAKE_RATE_CUTOFFS"),
+        "early_stop_mode": os.environ.get(f"{ENV_PREFIX}EARLY_STOP_MODE"),
+        "early_stop_sprt": os.environ.get(f"{ENV_PREFIX}EARLY_STOP_SPRT"),
+        "eval_schedule": os.environ.get(f"{ENV_PREFIX}EVAL_SCHEDULE"),
+        "evolution_mode": os.environ.get(f"{ENV_PREFIX}EVOLUTION_MODE"),
+        "crn_reference_policy": os.environ.get(f"{ENV_PREFIX}CRN_REFERENCE_POLICY"),
+        "eval_cache": os.environ.get(f"{ENV_PREFIX}EVAL_CACHE"),
+        "eval_cache_path": os.environ.get(f"{ENV_PREFIX}EVAL_CACHE_PATH"),
+        "eval_cache_seed_scope": os.environ.get(f"{ENV_PREFIX}EVAL_CACHE_SEED_SCOPE"),
+        "successive_halving": os.environ.get(f"{ENV_PREFIX}SUCCESSIVE_HALVING"),
     }
     return _normalize_runtime_values(raw)
 
@@ -695,12 +977,401 @@ def _runtime_from_env_cached(force_reload: bool = False) -> Dict[str, object]:
 # =============================================================================
 # Section 6. Logging + Numeric Utilities
 # =============================================================================
+_COLUMNAR_DIRNAME = "metrics_columns"
+
+
+def _records_to_columns(records) -> dict:
+    """Scalar fields of ndjson records as numpy columns, one entry per record.
+
+    bool -> bool, int -> int64, mixed numbers or any None -> float64 (None = NaN), str -> fixed-width
+    unicode (None = ""). Nested dict/list fields and str/number mixes are left to the ndjson log.
+    """
+    names = []
+    seen = set()
+    for record in records:
+        for name in record:
+            if name not in seen:
+                seen.add(name)
+                names.append(name)
+    columns = {}
+    for name in names:
+        values = [record.get(name) for record in records]
+        present = [value for value in values if value is not None]
+        if not present:
+            continue
+        if all(isinstance(value, bool) for value in present):
+            if len(present) == len(values):
+                columns[name] = np.asarray(values, dtype=np.bool_)
+            else:
+                columns[name] = np.asarray([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+        elif all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in present):
+            if len(present) == len(values) and all(isinstance(value, int) for value in present):
+                columns[name] = np.asarray(values, dtype=np.int64)
+            else:
+                columns[name] = np.asarray([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+        elif all(isinstance(value, str) for value in present):
+            columns[name] = np.asarray(["" if v is None else v for v in values], dtype=np.str_)
+    return columns
+
+
+# Chunks under this many rows count as small; once _COLUMNAR_COMPACT_CHUNKS small chunks pile up
+# (one per flush) they are merged into one, and MetricsSink.close() merges each table into a
+# single chunk so a finished run loads as plain memory maps.
+_COLUMNAR_CHUNK_ROWS = 65536
+_COLUMNAR_COMPACT_CHUNKS = 16
+
+
+def _read_columnar_chunks(table_dir: str, shadowed: Optional[list] = None) -> list:
+    """[(chunk_name, meta), ...] of a table in row order.
+
+    A chunk whose row range lies inside another chunk's (left behind by a compaction that
+    stopped before deleting its sources) is skipped, and its name appended to shadowed;
+    the rest must cover the rows without gaps.
+    """
+    chunks = []
+    next_row = 0
+    for chunk_name in sorted(name for name in os.listdir(table_dir) if re.fullmatch(r"chunk_\d+", name)):
+        with open(os.path.join(table_dir, chunk_name, "chunk.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        meta.setdefault("first_row", next_row)
+        next_row = int(meta["first_row"]) + int(meta["rows"])
+        chunks.append((chunk_name, meta))
+    chunks.sort(key=lambda item: (int(item[1]["first_row"]), -int(item[1]["rows"])))
+    live = []
+    end_row = 0
+    for chunk_name, meta in chunks:
+        first_row = int(meta["first_row"])
+        if first_row + int(meta["rows"]) <= end_row:
+            if shadowed is not None:
+                shadowed.append(chunk_name)
+            continue
+        if first_row != end_row:
+            raise RuntimeError(f"columnar metrics chunk {chunk_name} starts at row {first_row}, expected {end_row}")
+        live.append((chunk_name, meta))
+        end_row = first_row + int(meta["rows"])
+    return live
+
+
+def _write_columnar_columns(table_dir: str, columns: dict, rows: int, first_row: int) -> None:
+    """Writes one chunk_<n>/<column>.npy + chunk.json directory, atomically (tmp dir + rename)."""
+    os.makedirs(table_dir, exist_ok=True)
+    existing = [int(name[6:]) for name in os.listdir(table_dir) if re.fullmatch(r"chunk_\d+", name)]
+    chunk_dir = os.path.join(table_dir, f"chunk_{(max(existing) + 1) if existing else 0:06d}")
+    temp_dir = f"{chunk_dir}.tmp"
+    if os.path.exists(temp_dir):
+        shutil.rmtree(temp_dir)
+    os.makedirs(temp_dir)
+    for name, values in columns.items():
+        np.save(os.path.join(temp_dir, f"{name}.npy"), values, allow_pickle=False)
+    with open(os.path.join(temp_dir, "chunk.json"), "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "first_row": int(first_row),
+                "rows": int(rows),
+                "columns": {name: values.dtype.str for name, values in columns.items()},
+            },
+            f,
+            ensure_ascii=False,
+        )
+    os.replace(temp_dir, chunk_dir)
+
+
+def _concat_columnar_chunks(table_dir: str, chunks: list, columns=None, mmap: bool = True) -> dict:
+    wanted = list(columns) if columns is not None else []
+    if columns is None:
+        for _, meta in chunks:
+            wanted.extend(name for name in meta["columns"] if name not in wanted)
+    out = {}
+    for name in wanted:
+        text = any(np.dtype(meta["columns"][name]).kind == "U" for _, meta in chunks if name in meta["columns"])
+        parts = []
+        for chunk_name, meta in chunks:
+            if name in meta["columns"]:
+                parts.append(
+                    np.load(os.path.join(table_dir, chunk_name, f"{name}.npy"), mmap_mode="r" if mmap else None)
+                )
+            elif text:
+                parts.append(np.full(int(meta["rows"]), "", dtype=np.str_))
+            else:
+                parts.append(np.full(int(meta["rows"]), np.nan, dtype=np.float64))
+        kinds = {part.dtype.kind for part in parts}
+        if "U" in kinds and len(kinds) > 1:
+            raise RuntimeError(f"column {name!r} mixes text and numbers across chunks in {table_dir}")
+        if len(parts) == 1:
+            out[name] = parts[0]
+        elif parts:
+            out[name] = np.concatenate(parts)
+    return out
+
+
+def _compact_columnar_table(table_dir: str, small_only: bool = False) -> None:
+    """Merges chunks into one: every chunk, or (small_only) the trailing run of small chunks
+    once it reaches _COLUMNAR_COMPACT_CHUNKS. The merged chunk is written before the sources go."""
+    if not os.path.isdir(table_dir):
+        return
+    shadowed = []
+    chunks = _read_columnar_chunks(table_dir, shadowed)
+    for chunk_name in shadowed:
+        shutil.rmtree(os.path.join(table_dir, chunk_name))
+    if small_only:
+        tail = []
+        for chunk in reversed(chunks):
+            if int(chunk[1]["rows"]) >= _COLUMNAR_CHUNK_ROWS:
+                break
+            tail.append(chunk)
+        chunks = tail[::-1]
+        if len(chunks) < _COLUMNAR_COMPACT_CHUNKS:
+            return
+    if len(chunks) < 2:
+        return
+    # Read into memory: mapped source files could not be removed on Windows.
+    columns = _concat_columnar_chunks(table_dir, chunks, mmap=False)
+    rows = sum(int(meta["rows"]) for _, meta in chunks)
+    _write_columnar_columns(table_dir, columns, rows, int(chunks[0][1]["first_row"]))
+    for chunk_name, _ in chunks:
+        shutil.rmtree(os.path.join(table_dir, chunk_name))
+
+
+def _write_columnar_chunk(table_dir: str, records) -> None:
+    """Appends one chunk (chunk_<n>/<column>.npy + chunk.json) to a columnar table directory."""
+    if not records:
+        return
+    os.makedirs(table_dir, exist_ok=True)
+    chunks = _read_columnar_chunks(table_dir)
+    first_row = (int(chunks[-1][1]["first_row"]) + int(chunks[-1][1]["rows"])) if chunks else 0
+    _write_columnar_columns(table_dir, _records_to_columns(records), len(records), first_row)
+    _compact_columnar_table(table_dir, small_only=True)
+
+
+def _load_columnar_metrics(table_dir: str, columns=None) -> dict:
+    """Column name -> numpy array over every chunk of a table (e.g. <run>/metrics_columns/eval_metrics).
+
+    A single-chunk table (every table after MetricsSink.close()) returns read-only memory maps;
+    several chunks are concatenated. A column missing from a chunk is NaN (or "" for text) there.
+    """
+    if np is None:
+        raise RuntimeError("columnar metrics need numpy. Install with: pip install numpy")
+    if not os.path.isdir(table_dir):
+        raise RuntimeError(f"columnar metrics table not found: {table_dir}")
+    return _concat_columnar_chunks(table_dir, _read_columnar_chunks(table_dir), columns)
+
+
+def _build_columnar_metrics_from_log(log_path: str, table_dir: str, chunk_rows: int = 5000) -> int:
+    """Columnar copy of an existing eval/generation metrics ndjson(.gz) log; returns the row count."""
+    if np is None:
+        raise RuntimeError("columnar metrics need numpy. Install with: pip install numpy")
+    if os.path.exists(table_dir):
+        raise RuntimeError(f"columnar metrics table already exists: {table_dir}")
+    opener = gzip.open if log_path.endswith(".gz") else open
+    count = 0
+    batch = []
+    with opener(log_path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            batch.append(json.loads(line))
+            if len(batch) >= int(chunk_rows):
+                _write_columnar_chunk(table_dir, batch)
+                count += len(batch)
+                batch = []
+    _write_columnar_chunk(table_dir, batch)
+    _compact_columnar_table(table_dir)
+    return count + len(batch)
+
+
+class MetricsSink:
+    """Buffered ndjson appender shared by the eval / generation / lineage / eval-failure logs.
+
+    append() only serializes records into memory; flush() runs once per generation
+    (LineageReporter.end_generation) and writes each file's batch with a single open. With
+    background=True the batch goes to one writer thread, in order, and write errors surface on
+    the next flush or close(). compression="gzip" appends to <path>.gz, one gzip member per flush.
+    columnar="npy" also writes records passed with a column_table as one .npy chunk per flush
+    under <log dir>/metrics_columns/<column_table> (_write_columnar_chunk); small chunks are
+    merged as they pile up and close() merges each table into one chunk.
+    """
+
+    def __init__(self):
+        self.background = True
+        self.compression = "none"
+        self.columnar = "off"
+        self._lock = threading.Lock()
+        self._buffers: Dict[str, list] = {}
+        self._column_buffers: Dict[str, list] = {}
+        self._column_tables = set()
+        self._writer = None
+        self._pending_writes = []
+
+    def configure(self, background: bool, compression: str, columnar: str = "off") -> None:
+        self.close()
+        self.background = bool(background)
+        self.compression = str(compression)
+        self.columnar = str(columnar)
+
+    def path_for(self, path: str) -> str:
+        return f"{path}.gz" if self.compression == "gzip" else path
+
+    def append(self, path: str, records, column_table: Optional[str] = None) -> None:
+        if not records:
+            return
+        lines = [json.dumps(record, ensure_ascii=False) + "\n" for record in records]
+        column_rows = None
+        if column_table and self.columnar == "npy":
+            # Shallow copies: scalar values are immutable, and the callers may keep mutating records.
+            column_rows = [dict(record) for record in records]
+        with self._lock:
+            self._buffers.setdefault(self.path_for(path), []).extend(lines)
+            if column_rows is not None:
+                table_dir = os.path.join(os.path.dirname(path), _COLUMNAR_DIRNAME, str(column_table))
+                self._column_buffers.setdefault(table_dir, []).extend(column_rows)
+                self._column_tables.add(table_dir)
+
+    def _take_buffers(self) -> tuple:
+        with self._lock:
+            batch, self._buffers = self._buffers, {}
+            column_batch, self._column_buffers = self._column_buffers, {}
+        return batch, column_batch
+
+    @staticmethod
+    def _write_batch(batch: dict, column_batch: dict, compression: str) -> None:
+        for table_dir, rows in column_batch.items():
+            _write_columnar_chunk(table_dir, rows)
+        for path, lines in batch.items():
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = "".join(lines)
+            if compression == "gzip":
+                with gzip.open(path, "ab", compresslevel=5) as f:
+                    f.write(data.encode("utf-8"))
+            else:
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(data)
+
+    def _collect_finished_writes(self) -> None:
+        pending = []
+        for future in self._pending_writes:
+            if future.done():
+                future.result()
+            else:
+                pending.append(future)
+        self._pending_writes = pending
+
+    def flush(self) -> None:
+        batch, column_batch = self._take_buffers()
+        if not batch and not column_batch:
+            return
+        if not self.background:
+            self._write_batch(batch, column_batch, self.compression)
+            return
+        self._collect_finished_writes()
+        if self._writer is None:
+            self._writer = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="neat-metrics")
+        self._pending_writes.append(self._writer.submit(self._write_batch, batch, column_batch, self.compression))
+
+    def close(self) -> None:
+        """Drain queued batches and write what is still buffered; safe to call at interpreter exit."""
+        pending, self._pending_writes = self._pending_writes, []
+        try:
+            for future in pending:
+                future.result()
+        finally:
+            if self._writer is not None:
+                self._writer.shutdown(wait=True)
+                self._writer = None
+            batch, column_batch = self._take_buffers()
+            if batch or column_batch:
+                self._write_batch(batch, column_batch, self.compression)
+            tables, self._column_tables = self._column_tables, set()
+            for table_dir in sorted(tables):
+                _compact_columnar_table(table_dir)
+
+
+_METRICS_SINK = MetricsSink()
+atexit.register(_METRICS_SINK.close)
+
+
+# Fixed column order for generation_timings.ndjson; worker_* phases come from the eval worker's
+# timing_breakdown and are summed over every eval call (and thread) of the generation.
+_TIMING_PHASES = (
+    "process_spawn",
+    "payload_export",
+    "worker_roundtrip",
+    "response_parse",
+    "worker_module_load",
+    "worker_compile",
+    "worker_game_loop",
+    "worker_feature",
+    "record_build",
+    "gate_update",
+    "reproduction",
+    "speciation",
+    "checkpoint",
+    "lineage_write",
+)
+
+
+class PhaseTimer:
+    """Thread-safe wall-time totals (ms) and call counts per training phase.
+
+    Eval threads and the main loop add() into one table; PhaseTimingReporter drains it with
+    take() once per generation. Phases measured on eval threads add up across threads, so
+    their totals can exceed the generation's wall time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: Dict[str, list] = {}
+        self.reproduce_finished: Optional[float] = None
+
+    def add(self, phase: str, elapsed_ms: float, count: int = 1) -> None:
+        with self._lock:
+            entry = self._totals.setdefault(str(phase), [0.0, 0])
+            entry[0] += float(elapsed_ms)
+            entry[1] += int(count)
+
+    @contextlib.contextmanager
+    def measure(self, phase: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, (time.perf_counter() - started) * 1000.0)
+
+    def take(self) -> Dict[str, list]:
+        with self._lock:
+            totals, self._totals = self._totals, {}
+        return totals
+
+
+_PHASE_TIMER = PhaseTimer()
+
+
+def _record_worker_timing(summary: dict) -> None:
+    breakdown = summary.get("timing_breakdown")
+    if not isinstance(breakdown, dict):
+        return
+    module_load_ms = _safe_float(breakdown.get("module_load_ms"), 0.0)
+    if module_load_ms > 0.0:
+        _PHASE_TIMER.add("worker_module_load", module_load_ms)
+    _PHASE_TIMER.add(
+        "worker_compile",
+        _safe_float(breakdown.get("compile_ms"), 0.0),
+        count=int(_safe_float(breakdown.get("compile_count"), 0.0)),
+    )
+    _PHASE_TIMER.add("worker_game_loop", _safe_float(breakdown.get("game_loop_ms"), 0.0))
+    _PHASE_TIMER.add(
+        "worker_feature",
+        _safe_float(breakdown.get("feature_ms"), 0.0),
+        count=int(_safe_float(breakdown.get("feature_calls"), 0.0)),
+    )
+
+
+def _eval_failure_log_path(output_dir: str) -> str:
+    return _METRICS_SINK.path_for(os.path.join(output_dir, "eval_failures.log"))
+
+
 def _append_eval_failure_log(output_dir: str, record: dict) -> None:
-    os.makedirs(output_dir, exist_ok=True)
-    log_path = os.path.join(output_dir, "eval_failures.log")
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False))
-        f.write("\n")
+    _METRICS_SINK.append(os.path.join(output_dir, "eval_failures.log"), [record])
 
 
 def _resolve_eval_output_dir(runtime: dict) -> str:
@@ -812,6 +1483,58 @@ def _quantile(values, q):
     return vals[idx]
 
 
+def _wilson_interval(successes, trials, z: float = 1.96) -> tuple[float, float]:
+    trials = float(trials)
+    if trials <= 0.0:
+        return 0.0, 1.0
+    p = float(successes) / trials
+    z2 = z * z
+    denom = 1.0 + z2 / trials
+    center = (p + z2 / (2.0 * trials)) / denom
+    half = (z * math.sqrt((p * (1.0 - p)) / trials + z2 / (4.0 * trials * trials))) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def _gold_delta_interval(record: dict, z: float = 1.96) -> Optional[tuple[float, float]]:
+    """Normal-approximation CI of mean_gold_delta from games / mean / gold_delta_sum_sq."""
+    games = int(_safe_float(record.get("games"), 0.0))
+    sum_sq = _safe_optional_float(record.get("gold_delta_sum_sq"))
+    if games < 2 or sum_sq is None:
+        return None
+    mean = _safe_float(record.get("mean_gold_delta"), 0.0)
+    variance = max(0.0, (sum_sq - games * mean * mean) / float(games - 1))
+    half = z * math.sqrt(variance / float(games))
+    return mean - half, mean + half
+
+
+def _crn_summary_from_sums(reference_policy: str, sums: dict) -> dict:
+    """Paired (common-random-numbers) deltas vs the reference policy, from additive sums."""
+    n = max(0, int(_safe_float(sums.get("games"), 0.0)))
+
+    def _mean_std_err(sum_key: str, sumsq_key: str):
+        if n <= 0:
+            return 0.0, None
+        mean = _safe_float(sums.get(sum_key), 0.0) / float(n)
+        if n < 2:
+            return mean, None
+        variance = max(0.0, (_safe_float(sums.get(sumsq_key), 0.0) - float(n) * mean * mean) / float(n - 1))
+        return mean, math.sqrt(variance / float(n))
+
+    gold_mean, gold_std_err = _mean_std_err("gold_diff_sum", "gold_diff_sumsq")
+    result_mean, result_std_err = _mean_std_err("score_diff_sum", "score_diff_sumsq")
+    return {
+        "reference_policy": str(reference_policy or ""),
+        "games": int(n),
+        "reference_win_rate": (_safe_float(sums.get("reference_wins"), 0.0) / float(n)) if n > 0 else 0.0,
+        "reference_mean_gold_delta": (_safe_float(sums.get("reference_gold_sum"), 0.0) / float(n)) if n > 0 else 0.0,
+        "mean_gold_delta_diff": gold_mean,
+        "std_err_gold_delta_diff": gold_std_err,
+        "mean_result_diff": result_mean,
+        "std_err_result_diff": result_std_err,
+        "sums": dict(sums),
+    }
+
+
 def _clamp_unit(value):
     x = _safe_float(value, 0.0)
     if x <= 0.0:
@@ -968,18 +1691,516 @@ def _playoff_record_compare(record_a: dict, record_b: dict, runtime: dict) -> in
 # =============================================================================
 # Section 7. Single Genome Evaluation Worker
 # =============================================================================
-def _run_eval_worker_for_genome(
-    genome,
+def _resolve_eval_server_script(runtime: dict) -> str:
+    eval_script = os.path.abspath(str(runtime["eval_script"] or ""))
+    return os.path.join(os.path.dirname(eval_script), "neat_eval_server.mjs")
+
+
+class NodeEvalServer:
+    """Long-lived neat_eval_server.mjs child speaking line-delimited JSON over stdio.
+
+    The child is started lazily, reused across requests, and restarted after a
+    crash or timeout so one bad genome cannot poison later evaluations.
+    """
+
+    def __init__(self, server_script: str):
+        self.server_script = os.path.abspath(server_script)
+        self.proc = None
+        self.started_count = 0
+        self._lines = None
+        self._stderr_tail = collections.deque(maxlen=200)
+        self._next_request_id = 0
+
+    @staticmethod
+    def _pump_lines(stream, sink) -> None:
+        try:
+            for line in stream:
+                sink.put(line)
+        finally:
+            sink.put(None)
+
+    @staticmethod
+    def _pump_stderr(stream, tail) -> None:
+        for line in stream:
+            tail.append(line.rstrip("\n"))
+
+    def _start(self) -> None:
+        if not os.path.exists(self.server_script):
+            raise RuntimeError(f"eval server script not found: {self.server_script}")
+        started = time.perf_counter()
+        self.proc = subprocess.Popen(
+            [_resolve_node_executable(), self.server_script],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self._lines = queue.Queue()
+        self._stderr_tail = collections.deque(maxlen=200)
+        threading.Thread(target=self._pump_lines, args=(self.proc.stdout, self._lines), daemon=True).start()
+        threading.Thread(target=self._pump_stderr, args=(self.proc.stderr, self._stderr_tail), daemon=True).start()
+        self.started_count += 1
+        _PHASE_TIMER.add("process_spawn", (time.perf_counter() - started) * 1000.0)
+
+    def stderr_tail(self) -> str:
+        return "\n".join(list(self._stderr_tail)[-40:])
+
+    def request(self, argv: list, timeout_sec: float, genome=None) -> dict:
+        if self.proc is None or self.proc.poll() is not None:
+            self.close()
+            self._start()
+        self._next_request_id += 1
+        request_id = int(self._next_request_id)
+        request = {"id": request_id, "argv": [str(x) for x in argv]}
+        if genome is not None:
+            request["genome"] = genome
+        line = json.dumps(request, ensure_ascii=False, separators=(",", ":"))
+        try:
+            self.proc.stdin.write(line + "\n")
+            self.proc.stdin.flush()
+        except OSError as exc:
+            stderr = self.stderr_tail()
+            self.close(kill=True)
+            raise RuntimeError(f"eval server stdin closed: {exc}; stderr={stderr}") from exc
+
+        deadline = time.monotonic() + max(1.0, float(timeout_sec))
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0.0:
+                self.close(kill=True)
+                raise TimeoutError(f"eval server request timed out after {float(timeout_sec):.0f}s")
+            try:
+                raw = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if raw is None:
+                exit_code = self.proc.poll() if self.proc is not None else None
+                stderr = self.stderr_tail()
+                self.close(kill=True)
+                raise RuntimeError(f"eval server exited (code={exit_code}); stderr={stderr}")
+            text = str(raw or "").strip()
+            if not text:
+                continue
+            try:
+                with _PHASE_TIMER.measure("response_parse"):
+                    response = json.loads(text)
+            except Exception:
+                # Stray non-protocol output from engine code; the protocol line follows.
+                continue
+            if not isinstance(response, dict) or response.get("id") != request_id:
+                continue
+            if not bool(response.get("ok")):
+                error = dict(response.get("error") or {})
+                raise RuntimeError(
+                    f"eval server error: {error.get('message') or 'unknown'}\n{error.get('stack') or ''}"
+                )
+            summary = response.get("summary")
+            return summary if isinstance(summary, dict) else {}
+
+    def close(self, kill: bool = False) -> None:
+        proc = self.proc
+        self.proc = None
+        if proc is None:
+            return
+        if kill:
+            with contextlib.suppress(Exception):
+                proc.kill()
+        with contextlib.suppress(Exception):
+            proc.stdin.close()
+        try:
+            proc.wait(timeout=10)
+        except Exception:
+            with contextlib.suppress(Exception):
+                proc.kill()
+                proc.wait(timeout=10)
+
+
+# One server per (script, calling thread): each evaluator thread owns its Node child.
+_EVAL_SERVERS: Dict[tuple, NodeEvalServer] = {}
+_EVAL_SERVERS_LOCK = threading.Lock()
+
+
+def _get_eval_server(runtime: dict) -> NodeEvalServer:
+    server_key = (_resolve_eval_server_script(runtime), threading.get_ident())
+    with _EVAL_SERVERS_LOCK:
+        server = _EVAL_SERVERS.get(server_key)
+        if server is None:
+            server = NodeEvalServer(server_key[0])
+            _EVAL_SERVERS[server_key] = server
+    return server
+
+
+def _close_eval_servers(kill: bool = False) -> None:
+    with _EVAL_SERVERS_LOCK:
+        servers = list(_EVAL_SERVERS.values())
+        _EVAL_SERVERS.clear()
+    for server in servers:
+        server.close(kill=kill)
+
+
+atexit.register(_close_eval_servers)
+
+
+class EvalBroker:
+    """TCP job broker behind eval_backend=broker.
+
+    neat_eval_broker_client.mjs processes (any host) lease jobs -- worker argv plus inline
+    genome payload -- run them on their own neat_eval_server.mjs children and post the
+    response back. request() has the same contract as NodeEvalServer.request(), so each
+    evaluator thread simply blocks on one job. A lease lasts three heartbeats and every
+    client heartbeat renews its leases; a job whose client disconnects or goes silent is
+    requeued, and fails after broker_max_attempts leases. A job its client should stop --
+    timed out in request() or requeued after a silent lease -- is listed in that client's next
+    heartbeat reply ("cancel"), and the client kills the eval server running it. Results for
+    unknown, finished or re-leased job ids are rejected.
+    """
+
+    def __init__(self, listen: str, heartbeat_sec: float, max_attempts: int):
+        host, port = _parse_broker_listen(listen)
+        self.heartbeat_sec = float(heartbeat_sec)
+        self.lease_sec = 3.0 * self.heartbeat_sec
+        self.max_attempts = int(max_attempts)
+        self._cond = threading.Condition()
+        self._queue = collections.deque()
+        self._jobs: Dict[int, dict] = {}
+        self._clients: Dict[int, dict] = {}
+        self._next_job_id = 0
+        self._next_client_id = 0
+        self._closed = False
+
+        broker = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                broker._serve_client(self)
+
+        self.server = socketserver.ThreadingTCPServer((host, port), _Handler, bind_and_activate=False)
+        self.server.daemon_threads = True
+        self.server.allow_reuse_address = True
+        try:
+            self.server.server_bind()
+            self.server.server_activate()
+        except OSError as exc:
+            self.server.server_close()
+            raise RuntimeError(f"eval broker cannot listen on {host}:{port}: {exc}") from exc
+        self.address = self.server.server_address
+        threading.Thread(target=self.server.serve_forever, name="neat-broker", daemon=True).start()
+        threading.Thread(target=self._reap_expired_leases, name="neat-broker-reaper", daemon=True).start()
+        print(f"eval broker listening on {self.address[0]}:{self.address[1]}", file=sys.stderr)
+
+    def client_count(self) -> int:
+        with self._cond:
+            return len(self._clients)
+
+    def client_stats(self) -> list:
+        """[{name, slots, results, rejected}, ...] of the connected clients."""
+        with self._cond:
+            return [
+                {
+                    "name": client["name"],
+                    "slots": client["slots"],
+                    "results": client["results"],
+                    "rejected": client["rejected"],
+                }
+                for client in self._clients.values()
+            ]
+
+    def _cancel_on_owner(self, job: dict) -> None:
+        client = self._clients.get(job["owner"])
+        if client is not None:
+            client["cancel"].add(int(job["job_id"]))
+
+    def _serve_client(self, handler) -> None:
+        with self._cond:
+            self._next_client_id += 1
+            client_id = int(self._next_client_id)
+            self._clients[client_id] = {
+                "name": "",
+                "slots": 0,
+                "address": handler.client_address,
+                "results": 0,
+                "rejected": 0,
+                "cancel": set(),
+            }
+        try:
+            for raw in handler.rfile:
+                text = raw.decode("utf-8").strip()
+                if not text:
+                    continue
+                with _PHASE_TIMER.measure("response_parse"):
+                    message = json.loads(text)
+                try:
+                    response = self._handle_message(client_id, message)
+                    response["ok"] = True
+                except RuntimeError as exc:
+                    response = {"ok": False, "error": str(exc)}
+                response["id"] = message.get("id")
+                handler.wfile.write((json.dumps(response, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8"))
+                handler.wfile.flush()
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self._cond:
+                self._clients.pop(client_id, None)
+                for job in list(self._jobs.values()):
+                    if job["state"] == "leased" and job["owner"] == client_id:
+                        self._requeue(job, "client disconnected")
+                self._cond.notify_all()
+
+    def _handle_message(self, client_id: int, message: dict) -> dict:
+        op = str(message.get("op") or "")
+        now = time.monotonic()
+        with self._cond:
+            if op == "hello":
+                self._clients[client_id]["name"] = str(message.get("name") or "")
+                self._clients[client_id]["slots"] = _to_int(message.get("slots"), 1)
+                return {"heartbeat_sec": self.heartbeat_sec}
+            if op == "heartbeat":
+                leases = 0
+                for job in self._jobs.values():
+                    if job["state"] == "leased" and job["owner"] == client_id:
+                        job["lease_expires"] = now + self.lease_sec
+                        leases += 1
+                client = self._clients[client_id]
+                cancel, client["cancel"] = sorted(client["cancel"]), set()
+                return {"leases": leases, "cancel": cancel}
+            if op == "lease":
+                while self._queue:
+                    job = self._jobs.get(self._queue.popleft())
+                    if job is None or job["state"] != "queued":
+                        continue
+                    job["state"] = "leased"
+                    job["owner"] = client_id
+                    job["attempts"] += 1
+                    job["leased_at"] = now
+                    job["lease_expires"] = now + self.lease_sec
+                    return {
+                        "job": {"job_id": job["job_id"], "argv": job["argv"], "genome": job["genome"]},
+                    }
+                return {"job": None, "retry_ms": 200}
+            if op == "result":
+                job = self._jobs.get(_to_int(message.get("job_id"), -1))
+                if job is None or job["state"] != "leased" or job["owner"] != client_id:
+                    # Late answer for a job that was requeued, cancelled or timed out meanwhile.
+                    self._clients[client_id]["rejected"] += 1
+                    reason = "unknown_job" if job is None else "not_leased_by_client"
+                    return {"accepted": False, "reason": reason}
+                job["state"] = "done"
+                job["response"] = message
+                self._clients[client_id]["results"] += 1
+                self._cond.notify_all()
+                return {"accepted": True}
+        raise RuntimeError(f"unknown broker op: {op!r}")
+
+    def _requeue(self, job: dict, reason: str) -> None:
+        job["owner"] = None
+        if job["attempts"] >= self.max_attempts:
+            job["state"] = "failed"
+            job["error"] = f"{reason} after {job['attempts']} lease(s)"
+            return
+        job["state"] = "queued"
+        self._queue.appendleft(job["job_id"])
+
+    def _reap_expired_leases(self) -> None:
+        while True:
+            time.sleep(self.heartbeat_sec)
+            with self._cond:
+                if self._closed:
+                    return
+                now = time.monotonic()
+                for job in list(self._jobs.values()):
+                    if job["state"] == "leased" and job["lease_expires"] < now:
+                        # A silent client may still be running it; tell it to stop if it comes back.
+                        self._cancel_on_owner(job)
+                        self._requeue(job, "lease expired")
+                self._cond.notify_all()
+
+    def request(self, argv: list, timeout_sec: float, genome=None) -> dict:
+        """Queue one worker call and block until a client answers.
+
+        timeout_sec bounds each lease (time spent running on a client); time spent queued
+        only counts while no client is connected at all.
+        """
+        timeout_sec = max(1.0, float(timeout_sec))
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("eval broker is closed")
+            self._next_job_id += 1
+            job = {
+                "job_id": int(self._next_job_id),
+                "argv": [str(x) for x in argv],
+                "genome": genome,
+                "state": "queued",
+                "owner": None,
+                "attempts": 0,
+                "leased_at": None,
+                "lease_expires": None,
+                "response": None,
+                "error": "",
+            }
+            self._jobs[job["job_id"]] = job
+            self._queue.append(job["job_id"])
+            idle_since = time.monotonic()
+            try:
+                while job["state"] not in ("done", "failed"):
+                    now = time.monotonic()
+                    if job["state"] == "leased" and now - float(job["leased_at"]) > timeout_sec:
+                        raise TimeoutError(f"broker job timed out after {timeout_sec:.0f}s on a client")
+                    if self._clients or job["state"] == "leased":
+                        idle_since = now
+                    elif now - idle_since > timeout_sec:
+                        raise TimeoutError(f"no eval broker client connected for {timeout_sec:.0f}s")
+                    if self._closed:
+                        raise RuntimeError("eval broker closed")
+                    self._cond.wait(timeout=min(1.0, self.heartbeat_sec))
+            finally:
+                if job["state"] == "leased":
+                    self._cancel_on_owner(job)
+                self._jobs.pop(job["job_id"], None)
+        if job["state"] == "failed":
+            raise RuntimeError(f"broker job failed: {job['error']}")
+        response = dict(job["response"] or {})
+        if not bool(response.get("ok")):
+            error = dict(response.get("error") or {})
+            raise RuntimeError(
+                f"eval client error: {error.get('message') or 'unknown'}\n{error.get('stack') or ''}"
+            )
+        summary = response.get("summary")
+        return summary if isinstance(summary, dict) else {}
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+_EVAL_BROKER: Optional[EvalBroker] = None
+_EVAL_BROKER_LOCK = threading.Lock()
+
+
+def _get_eval_broker(runtime: dict) -> EvalBroker:
+    global _EVAL_BROKER
+    with _EVAL_BROKER_LOCK:
+        if _EVAL_BROKER is None:
+            _EVAL_BROKER = EvalBroker(
+                str(runtime["broker_listen"]),
+                float(runtime["broker_heartbeat_sec"]),
+                int(runtime["broker_max_attempts"]),
+            )
+        return _EVAL_BROKER
+
+
+def _close_eval_broker() -> None:
+    global _EVAL_BROKER
+    with _EVAL_BROKER_LOCK:
+        broker = _EVAL_BROKER
+        _EVAL_BROKER = None
+    if broker is not None:
+        broker.close()
+
+
+atexit.register(_close_eval_broker)
+
+
+def _build_eval_worker_argv(
+    runtime: dict,
+    genome_count: int,
+    seed_text: str,
+    games: int,
+    early_stop_win_rate_cutoffs: list,
+    early_stop_go_take_rate_cutoffs: list,
+    opponent_genome: str = "",
+    early_stop_sprt: Optional[dict] = None,
+    game_offset: int = 0,
+    schedule_games: int = 0,
+) -> list:
+    opponent_policy = str(runtime.get("opponent_policy") or "").strip()
+    opponent_policy_mix = runtime.get("opponent_policy_mix") or []
+    # Genome payloads travel inline (server request field or stdin), never through temp files.
+    argv = ["--genome", "-"] if int(genome_count) == 1 else ["--genome-batch", "-"]
+    argv += [
+        "--games",
+        str(int(games)),
+        "--seed",
+        seed_text,
+        "--max-steps",
+        str(int(runtime["max_eval_steps"])),
+        "--switch-seats",
+        "1" if bool(runtime["switch_seats"]) else "0",
+        "--continuous-series",
+        "1" if bool(runtime["continuous_series"]) else "0",
+        "--fitness-gold-scale",
+        str(float(runtime["fitness_gold_scale"])),
+        "--fitness-gold-neutral-delta",
+        str(float(runtime["fitness_gold_neutral_delta"])),
+        "--fitness-win-weight",
+        str(float(runtime["fitness_win_weight"])),
+        "--fitness-gold-weight",
+        str(float(runtime["fitness_gold_weight"])),
+        "--fitness-win-neutral-rate",
+        str(float(runtime["fitness_win_neutral_rate"])),
+        "--early-stop-win-rate-cutoffs",
+        json.dumps(
+            early_stop_win_rate_cutoffs,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ),
+        "--early-stop-go-take-rate-cutoffs",
+        json.dumps(
+            early_stop_go_take_rate_cutoffs,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ),
+    ]
+    if opponent_policy:
+        argv.extend(["--opponent-policy", opponent_policy])
+    elif isinstance(opponent_policy_mix, list) and len(opponent_policy_mix) > 0:
+        argv.extend(
+            [
+                "--opponent-policy-mix",
+                json.dumps(opponent_policy_mix, ensure_ascii=False, separators=(",", ":")),
+            ]
+        )
+    if opponent_genome:
+        argv.extend(["--opponent-genome", opponent_genome])
+    crn_reference_policy = str(runtime.get("crn_reference_policy") or "").strip()
+    if crn_reference_policy:
+        argv.extend(["--crn-reference-policy", crn_reference_policy])
+    if early_stop_sprt:
+        argv.extend(
+            [
+                "--early-stop-sprt",
+                json.dumps(early_stop_sprt, ensure_ascii=False, separators=(",", ":")),
+            ]
+        )
+    if int(game_offset) > 0:
+        argv.extend(["--game-offset", str(int(game_offset))])
+    if int(schedule_games) > 0:
+        argv.extend(["--schedule-games", str(int(schedule_games))])
+    return argv
+
+
+def _run_eval_worker_for_genomes(
+    entries: list,
     config,
     runtime: dict,
     seed_text: str,
     generation: int = -1,
-    genome_key: int = -1,
     games_override: Optional[int] = None,
     early_stop_win_rate_cutoffs_override: Optional[list] = None,
     early_stop_go_take_rate_cutoffs_override: Optional[list] = None,
     context_label: str = "train_eval",
-):
+    early_stop_sprt: Optional[dict] = None,
+    game_offset: int = 0,
+    schedule_games: int = 0,
+) -> list:
+    """Evaluate [(genome_key, genome), ...] in one worker call; returns one result per entry, in order."""
     eval_script = str(runtime["eval_script"] or "")
     seed_text = str(seed_text or runtime["seed"])
     output_dir = _resolve_eval_output_dir(runtime)
@@ -996,61 +2217,53 @@ def _run_eval_worker_for_genome(
         )
     )
     opponent_genome = str(runtime.get("opponent_genome") or "").strip()
+    entries = list(entries or [])
     failure_meta = {
         "saved_at": datetime.now(timezone.utc).isoformat(),
         "generation": int(generation),
-        "genome_key": int(genome_key),
         "seed_used": seed_text,
         "opponent_policy": opponent_policy,
         "opponent_policy_mix": opponent_policy_mix,
         "context": str(context_label or "train_eval"),
     }
-    if not eval_script or not os.path.exists(eval_script):
-        _append_eval_failure_log(
-            output_dir,
-            dict(failure_meta, reason="eval_script_missing", eval_script=eval_script),
-        )
+    if len(entries) > 1:
+        failure_meta["batch_genome_keys"] = [int(genome_key) for genome_key, _ in entries]
+
+    def _failed(genome_key: int, **failure) -> dict:
+        _append_eval_failure_log(output_dir, dict(failure_meta, genome_key=int(genome_key), **failure))
         return {"fitness": -1e9, "seed_used": seed_text, "eval_ok": False}
 
-    payload = _export_neat_python_genome(genome, config, runtime)
+    def _failed_all(**failure) -> list:
+        return [_failed(genome_key, **failure) for genome_key, _ in entries]
+
+    if not entries:
+        return []
+    if not eval_script or not os.path.exists(eval_script):
+        return _failed_all(reason="eval_script_missing", eval_script=eval_script)
+
+    # Already-exported genome JSON (e.g. models/winner_genome.json) is sent as is.
+    with _PHASE_TIMER.measure("payload_export"):
+        payloads = [
+            genome if isinstance(genome, dict) else _export_neat_python_genome(genome, config, runtime)
+            for _, genome in entries
+        ]
 
     if (not has_opponent_policy) and (not has_opponent_policy_mix):
-        _append_eval_failure_log(
-            output_dir,
-            dict(failure_meta, reason="opponent_policy_missing"),
-        )
-        return {"fitness": -1e9, "seed_used": seed_text, "eval_ok": False}
+        return _failed_all(reason="opponent_policy_missing")
 
     if requires_genome_opponent:
         if not opponent_genome:
-            _append_eval_failure_log(
-                output_dir,
-                dict(failure_meta, reason="opponent_genome_missing", opponent_policy=opponent_policy),
-            )
-            return {"fitness": -1e9, "seed_used": seed_text, "eval_ok": False}
+            return _failed_all(reason="opponent_genome_missing", opponent_policy=opponent_policy)
         opponent_genome = os.path.abspath(opponent_genome)
         if not os.path.exists(opponent_genome):
-            _append_eval_failure_log(
-                output_dir,
-                dict(
-                    failure_meta,
-                    reason="opponent_genome_not_found",
-                    opponent_policy=opponent_policy,
-                    opponent_genome=opponent_genome,
-                ),
+            return _failed_all(
+                reason="opponent_genome_not_found",
+                opponent_policy=opponent_policy,
+                opponent_genome=opponent_genome,
             )
-            return {"fitness": -1e9, "seed_used": seed_text, "eval_ok": False}
 
+    genome_payload = payloads[0] if len(payloads) == 1 else payloads
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix="_neat_python_genome.json",
-            delete=False,
-            encoding="utf-8",
-        ) as f:
-            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
-            genome_path = f.name
-
         games_value = int(games_override) if games_override is not None else int(runtime["games_per_genome"])
         early_stop_win_rate_cutoffs = (
             runtime.get("early_stop_win_rate_cutoffs") or []
@@ -1063,106 +2276,402 @@ def _run_eval_worker_for_genome(
             else early_stop_go_take_rate_cutoffs_override
         )
 
-        cmd = [
-            _resolve_node_executable(),
-            eval_script,
-            "--genome",
-            genome_path,
-            "--games",
-            str(int(games_value)),
-            "--seed",
-            seed_text,
-            "--max-steps",
-            str(int(runtime["max_eval_steps"])),
-            "--switch-seats",
-            "1" if bool(runtime["switch_seats"]) else "0",
-            "--fitness-gold-scale",
-            str(float(runtime["fitness_gold_scale"])),
-            "--fitness-gold-neutral-delta",
-            str(float(runtime["fitness_gold_neutral_delta"])),
-            "--fitness-win-weight",
-            str(float(runtime["fitness_win_weight"])),
-            "--fitness-gold-weight",
-            str(float(runtime["fitness_gold_weight"])),
-            "--fitness-win-neutral-rate",
-            str(float(runtime["fitness_win_neutral_rate"])),
-            "--early-stop-win-rate-cutoffs",
-            json.dumps(
-                early_stop_win_rate_cutoffs,
-                ensure_ascii=False,
-                separators=(",", ":"),
-            ),
-            "--early-stop-go-take-rate-cutoffs",
-            json.dumps(
-                early_stop_go_take_rate_cutoffs,
-                ensure_ascii=False,
-                separators=(",", ":"),
-            ),
-        ]
-        if has_opponent_policy:
-            cmd.extend(["--opponent-policy", opponent_policy])
-        elif has_opponent_policy_mix:
-            cmd.extend(
-                [
-                    "--opponent-policy-mix",
-                    json.dumps(opponent_policy_mix, ensure_ascii=False, separators=(",", ":")),
-                ]
+        worker_argv = _build_eval_worker_argv(
+            runtime,
+            genome_count=len(payloads),
+            seed_text=seed_text,
+            games=games_value,
+            early_stop_win_rate_cutoffs=early_stop_win_rate_cutoffs,
+            early_stop_go_take_rate_cutoffs=early_stop_go_take_rate_cutoffs,
+            opponent_genome=(opponent_genome if requires_genome_opponent else ""),
+            early_stop_sprt=early_stop_sprt,
+            game_offset=game_offset,
+            schedule_games=schedule_games,
+        )
+        if bool(runtime["timing_breakdown"]):
+            worker_argv.extend(["--timing-breakdown", "1"])
+        # eval_timeout_sec stays a per-genome budget; a batch gets one budget per member.
+        timeout_sec = max(10, int(runtime["eval_timeout_sec"])) * len(entries)
+        roundtrip_started = time.perf_counter()
+        if str(runtime["eval_backend"]) == "broker":
+            output = _get_eval_broker(runtime).request(worker_argv, timeout_sec, genome=genome_payload)
+        elif str(runtime["eval_worker_mode"]) == "persistent":
+            output = _get_eval_server(runtime).request(worker_argv, timeout_sec, genome=genome_payload)
+        else:
+            proc = subprocess.run(
+                [_resolve_node_executable(), eval_script] + worker_argv,
+                input=json.dumps(genome_payload, ensure_ascii=False, separators=(",", ":")),
+                check=True,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                timeout=timeout_sec,
             )
-        if requires_genome_opponent:
-            cmd.extend(["--opponent-genome", opponent_genome])
-
-        proc = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=max(10, int(runtime["eval_timeout_sec"])),
+            lines = [x.strip() for x in str(proc.stdout or "").splitlines() if x.strip()]
+            if not lines:
+                return _failed_all(reason="worker_empty_stdout", stderr=str(proc.stderr or ""))
+            with _PHASE_TIMER.measure("response_parse"):
+                output = json.loads(lines[-1])
+        _PHASE_TIMER.add("worker_roundtrip", (time.perf_counter() - roundtrip_started) * 1000.0)
+
+        if len(entries) == 1:
+            worker_results = [{"ok": True, "summary": output}]
+        else:
+            worker_results = output.get("results") if isinstance(output, dict) else None
+            if not isinstance(worker_results, list) or len(worker_results) != len(entries):
+                raise RuntimeError(
+                    f"eval worker batch returned {len(worker_results or [])} results for {len(entries)} genomes"
+                )
+    except Exception as exc:
+        return _failed_all(
+            reason="worker_exception",
+            error=repr(exc),
+            traceback=traceback.format_exc(),
         )
-        lines = [x.strip() for x in str(proc.stdout or "").splitlines() if x.strip()]
-        if not lines:
-            _append_eval_failure_log(
-                output_dir,
-                dict(failure_meta, reason="worker_empty_stdout", stderr=str(proc.stderr or "")),
+
+    results = []
+    for (genome_key, _), worker_result in zip(entries, worker_results):
+        worker_result = worker_result if isinstance(worker_result, dict) else {}
+        if not bool(worker_result.get("ok")):
+            error = dict(worker_result.get("error") or {})
+            results.append(
+                _failed(
+                    genome_key,
+                    reason="worker_exception",
+                    error=str(error.get("message") or "unknown"),
+                    traceback=str(error.get("stack") or ""),
+                )
             )
-            return {"fitness": -1e9, "seed_used": seed_text, "eval_ok": False}
-        summary = json.loads(lines[-1])
+            continue
+        summary = worker_result.get("summary")
         if not isinstance(summary, dict):
             summary = {}
         summary["fitness"] = _safe_float(summary.get("fitness"), -1e9)
         summary["seed_used"] = seed_text
         summary["eval_ok"] = True
-        return summary
-    except Exception as exc:
-        _append_eval_failure_log(
-            output_dir,
-            dict(
-                failure_meta,
-                reason="worker_exception",
-                error=repr(exc),
-                traceback=traceback.format_exc(),
-            ),
+        _record_worker_timing(summary)
+        results.append(summary)
+    return results
+
+
+def _resolve_eval_shard_games(runtime: dict, games: int) -> int:
+    """eval_shard_games, or the whole schedule (no sharding) when it is 0."""
+    shard_games = int(runtime.get("eval_shard_games", 0) or 0)
+    if shard_games <= 0:
+        return int(games)
+    return max(1, min(int(games), shard_games))
+
+
+def _eval_shard_bounds(games: int, shard_games: int, check_points) -> list:
+    """[(game_offset, game_end), ...] covering range(games); every early-stop check point is a boundary."""
+    edges = set(range(0, int(games), int(shard_games)))
+    edges.update(int(point) for point in check_points if 0 < int(point) < int(games))
+    edges = sorted(edges) + [int(games)]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _run_eval_worker_for_genome(
+    genome,
+    config,
+    runtime: dict,
+    seed_text: str,
+    generation: int = -1,
+    genome_key: int = -1,
+    games_override: Optional[int] = None,
+    early_stop_win_rate_cutoffs_override: Optional[list] = None,
+    early_stop_go_take_rate_cutoffs_override: Optional[list] = None,
+    context_label: str = "train_eval",
+    early_stop_sprt: Optional[dict] = None,
+    executor=None,
+):
+    """Evaluate one genome with its game schedule split into eval_shard_games shards.
+
+    Sharding is off unless eval_shard_games > 0, which runtime normalization only allows with
+    continuous_series = false: a shard starts a fresh series at its --game-offset, so under a
+    continuous series the games would differ from one worker's. Shards run in parallel on
+    executor (a temporary eval_workers pool when None) with --game-offset / --schedule-games,
+    so every game index keeps its seed and seat. Early-stop rules are applied here on the
+    in-order prefix of finished shards: shard boundaries are put on every cutoff game count
+    (and SPRT min_games), so win/go-take cutoffs fire at the same game as in one worker;
+    SPRT is only checked at shard boundaries. Shards past the stop point are cancelled or
+    dropped. Any failed shard fails the whole evaluation.
+    """
+    seed_text = str(seed_text or runtime["seed"])
+    games = int(games_override) if games_override is not None else int(runtime["games_per_genome"])
+    win_cutoffs = list(
+        runtime.get("early_stop_win_rate_cutoffs") or []
+        if early_stop_win_rate_cutoffs_override is None
+        else early_stop_win_rate_cutoffs_override
+    )
+    go_cutoffs = list(
+        runtime.get("early_stop_go_take_rate_cutoffs") or []
+        if early_stop_go_take_rate_cutoffs_override is None
+        else early_stop_go_take_rate_cutoffs_override
+    )
+    shard_games = _resolve_eval_shard_games(runtime, games)
+    if shard_games >= games:
+        return _run_eval_worker_for_genomes(
+            [(int(genome_key), genome)],
+            config=config,
+            runtime=runtime,
+            seed_text=seed_text,
+            generation=generation,
+            games_override=games,
+            early_stop_win_rate_cutoffs_override=win_cutoffs,
+            early_stop_go_take_rate_cutoffs_override=go_cutoffs,
+            context_label=context_label,
+            early_stop_sprt=early_stop_sprt,
+        )[0]
+
+    check_points = [item["games"] for item in win_cutoffs + go_cutoffs]
+    sprt_llr = None
+    if early_stop_sprt:
+        p0 = float(early_stop_sprt["p0"])
+        p1 = float(early_stop_sprt["p1"])
+        sprt_win_llr = math.log(p1 / p0)
+        sprt_loss_llr = math.log((1.0 - p1) / (1.0 - p0))
+        sprt_lower = math.log(float(early_stop_sprt["beta"]) / (1.0 - float(early_stop_sprt["alpha"])))
+        check_points.append(int(early_stop_sprt["min_games"]))
+    bounds = _eval_shard_bounds(games, shard_games, check_points)
+    shard_end = dict(bounds)
+
+    owned_executor = None
+    if executor is None:
+        owned_executor = executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, int(runtime["eval_workers"])),
+            thread_name_prefix="neat-eval-shard",
         )
-        return {"fitness": -1e9, "seed_used": seed_text, "eval_ok": False}
+    jobs = {}
+    finished = {}
+    prefix = []
+    completed = wins = go_opportunity_count = go_count = 0
+    next_offset = 0
+    win_idx = go_idx = 0
+    early_stop = None
+    failed = False
+    try:
+        for game_offset, game_end in bounds:
+            future = executor.submit(
+                _run_eval_worker_for_genomes,
+                [(int(genome_key), genome)],
+                config,
+                runtime,
+                seed_text,
+                int(generation),
+                games_override=game_end - game_offset,
+                early_stop_win_rate_cutoffs_override=[],
+                early_stop_go_take_rate_cutoffs_override=[],
+                context_label=context_label,
+                game_offset=game_offset,
+                schedule_games=games,
+            )
+            jobs[future] = game_offset
+        for future in concurrent.futures.as_completed(jobs):
+            try:
+                finished[jobs[future]] = future.result()[0]
+            except Exception as exc:
+                _append_eval_failure_log(
+                    _resolve_eval_output_dir(runtime),
+                    {
+                        "saved_at": datetime.now(timezone.utc).isoformat(),
+                        "generation": int(generation),
+                        "genome_key": int(genome_key),
+                        "seed_used": seed_text,
+                        "context": str(context_label or "train_eval"),
+                        "reason": "worker_exception",
+                        "error": repr(exc),
+                        "game_offset": int(jobs[future]),
+                    },
+                )
+                failed = True
+                break
+            while next_offset in finished and early_stop is None and not failed:
+                shard = finished.pop(next_offset)
+                if not bool(shard.get("eval_ok")):
+                    failed = True
+                    break
+                prefix.append(shard)
+                next_offset = shard_end[next_offset]
+                completed += int(_safe_float(shard.get("games"), 0.0))
+                wins += int(_safe_float(shard.get("wins"), 0.0))
+                go_opportunity_count += int(_safe_float(shard.get("go_opportunity_count"), 0.0))
+                go_count += int(_safe_float(shard.get("go_count"), 0.0))
+                while win_idx < len(win_cutoffs) and completed >= int(win_cutoffs[win_idx]["games"]):
+                    cutoff = win_cutoffs[win_idx]
+                    if wins / float(completed) <= float(cutoff["max_win_rate"]):
+                        early_stop = {
+                            "reason": "win_rate_cutoff",
+                            "cutoff_games": int(cutoff["games"]),
+                            "cutoff_max_win_rate": float(cutoff["max_win_rate"]),
+                            "observed_win_rate": wins / float(completed),
+                        }
+                        break
+                    win_idx += 1
+                while early_stop is None and go_idx < len(go_cutoffs) and completed >= int(go_cutoffs[go_idx]["games"]):
+                    cutoff = go_cutoffs[go_idx]
+                    if go_opportunity_count >= int(cutoff["min_go_opportunity_count"]):
+                        go_take_rate = (go_count / float(go_opportunity_count)) if go_opportunity_count > 0 else 0.0
+                        too_low = cutoff["min_go_take_rate"] is not None and go_take_rate <= cutoff["min_go_take_rate"]
+                        too_high = cutoff["max_go_take_rate"] is not None and go_take_rate >= cutoff["max_go_take_rate"]
+                        if too_low or too_high:
+                            early_stop = {
+                                "reason": "go_take_rate_cutoff",
+                                "cutoff_games": int(cutoff["games"]),
+                                "observed_go_take_rate": go_take_rate,
+                                "observed_go_opportunity_count": int(go_opportunity_count),
+                            }
+                            break
+                    go_idx += 1
+                if early_stop_sprt:
+                    sprt_llr = (wins * sprt_win_llr) + ((completed - wins) * sprt_loss_llr)
+                    if (
+                        early_stop is None
+                        and completed >= int(early_stop_sprt["min_games"])
+                        and sprt_llr <= sprt_lower
+                    ):
+                        early_stop = {
+                            "reason": "sprt_accept_h0",
+                            "cutoff_games": int(completed),
+                            "observed_win_rate": wins / float(completed),
+                        }
+            if failed or early_stop is not None or next_offset >= games:
+                break
+    except BaseException:
+        _close_eval_servers(kill=True)
+        raise
     finally:
-        try:
-            if "genome_path" in locals() and genome_path and os.path.exists(genome_path):
-                os.remove(genome_path)
-        except Exception:
-            pass
+        for future in jobs:
+            future.cancel()
+        if owned_executor is not None:
+            owned_executor.shutdown(wait=True, cancel_futures=True)
+
+    if failed or not prefix:
+        return {"fitness": -1e9, "seed_used": seed_text, "eval_ok": False, "eval_shards": len(bounds)}
+    if len(prefix) == 1:
+        record = dict(prefix[0])
+    else:
+        record = _merge_eval_records(prefix, runtime, "eval_shards")
+        if record is None:
+            return {"fitness": -1e9, "seed_used": seed_text, "eval_ok": False, "eval_shards": len(bounds)}
+    record["requested_games"] = int(games)
+    record["seed_used"] = seed_text
+    record["eval_ok"] = True
+    record["eval_shards"] = len(prefix)
+    record["eval_shard_games"] = int(shard_games)
+    record["sprt_llr"] = sprt_llr
+    record["early_stop_triggered"] = early_stop is not None
+    record["early_stop_reason"] = (early_stop or {}).get("reason")
+    record["early_stop_cutoff_games"] = (early_stop or {}).get("cutoff_games")
+    record["early_stop_observed_win_rate"] = (early_stop or {}).get("observed_win_rate")
+    record["early_stop_observed_go_take_rate"] = (early_stop or {}).get("observed_go_take_rate")
+    return record
+
+
+# longest_first with eval_batch_size=0 cuts each call into this many batches per eval thread,
+# so threads that finish early pull the remaining batches instead of idling.
+_EVAL_JOB_SLICES_PER_WORKER = 4
+
+# Per-observation decay of the longest_first size ratio sums (~50 recent genomes dominate),
+# so the estimate follows the current engine/opponent cost instead of the whole run.
+_EVAL_COST_DECAY = 0.98
+
+
+def _genome_eval_size(genome) -> int:
+    return len(genome.nodes) + sum(1 for conn in genome.connections.values() if conn.enabled)
+
+
+# Runtime keys that change what a worker call measures; part of every eval cache key.
+_EVAL_CACHE_RUNTIME_KEYS = (
+    "format_version",
+    "feature_profile",
+    "max_eval_steps",
+    "opponent_policy",
+    "opponent_policy_mix",
+    "opponent_genome",
+    "switch_seats",
+    "continuous_series",
+    "fitness_gold_scale",
+    "fitness_gold_neutral_delta",
+    "fitness_win_weight",
+    "fitness_gold_weight",
+    "fitness_win_neutral_rate",
+    "control_policy_mode",
+    "crn_reference_policy",
+)
 
 
-def eval_function(genome, config, seed_override="", generation=-1, genome_key=-1):
-    runtime = _runtime_from_env_cached()
-    seed_text = str(seed_override or runtime["seed"])
-    return _run_eval_worker_for_genome(
-        genome=genome,
-        config=config,
-        runtime=runtime,
-        seed_text=seed_text,
-        generation=int(generation),
-        genome_key=int(genome_key),
-        context_label="train_eval",
+def _eval_cache_key(payload: dict, runtime: dict, seed_text: str, eval_kwargs: dict, worker_digest: str) -> str:
+    canonical_payload = dict(payload)
+    canonical_payload["connections"] = sorted(
+        payload.get("connections") or [],
+        key=lambda conn: (int(conn["in_node"]), int(conn["out_node"])),
     )
+    win_rate_cutoffs = eval_kwargs.get("early_stop_win_rate_cutoffs_override")
+    go_take_rate_cutoffs = eval_kwargs.get("early_stop_go_take_rate_cutoffs_override")
+    key_source = {
+        "worker": worker_digest,
+        "payload": canonical_payload,
+        "seed": str(seed_text),
+        "games": int(eval_kwargs.get("games_override") or runtime["games_per_genome"]),
+        "early_stop_win_rate_cutoffs": (
+            runtime.get("early_stop_win_rate_cutoffs") or [] if win_rate_cutoffs is None else win_rate_cutoffs
+        ),
+        "early_stop_go_take_rate_cutoffs": (
+            runtime.get("early_stop_go_take_rate_cutoffs") or [] if go_take_rate_cutoffs is None else go_take_rate_cutoffs
+        ),
+        "early_stop_sprt": eval_kwargs.get("early_stop_sprt"),
+        "game_offset": int(eval_kwargs.get("game_offset") or 0),
+        "schedule_games": int(eval_kwargs.get("schedule_games") or 0),
+        "runtime": {key: runtime.get(key) for key in _EVAL_CACHE_RUNTIME_KEYS},
+    }
+    text = json.dumps(key_source, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EvalResultCache:
+    """Append-only NDJSON store of successful eval summaries keyed by _eval_cache_key().
+
+    The eval worker script digest is part of every key, so editing neat_eval_worker.mjs
+    never serves stale results; engine (src/) changes need a fresh cache file.
+    """
+
+    def __init__(self, path: str, eval_script: str):
+        self.path = os.path.abspath(path)
+        with open(os.path.abspath(eval_script), "rb") as f:
+            self.worker_digest = hashlib.sha256(f.read()).hexdigest()
+        self.entries: Dict[str, dict] = {}
+        self.skipped_lines = 0
+        self._lock = threading.Lock()
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    text = line.strip()
+                    if not text:
+                        continue
+                    try:
+                        row = json.loads(text)
+                    except Exception:
+                        # A run killed mid-append leaves one torn line; later lines are intact.
+                        self.skipped_lines += 1
+                        continue
+                    if isinstance(row, dict) and isinstance(row.get("summary"), dict) and row.get("key"):
+                        self.entries[str(row["key"])] = row["summary"]
+
+    def get(self, key: str) -> Optional[dict]:
+        summary = self.entries.get(key)
+        return copy.deepcopy(summary) if summary is not None else None
+
+    def put(self, key: str, summary: dict) -> None:
+        row = {
+            "key": key,
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+            "summary": summary,
+        }
+        line = json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            self.entries[key] = copy.deepcopy(summary)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
 
 
 # =============================================================================
@@ -1181,7 +2690,20 @@ class LoggedParallelEvaluator:
         self.output_dir = os.path.abspath(output_dir)
         os.makedirs(self.output_dir, exist_ok=True)
         self.runtime_seed = str(runtime["seed"])
-        self.pool = mp.Pool(processes=self.num_workers)
+        self.eval_batch_size = int(runtime["eval_batch_size"])
+        self.eval_job_order = str(runtime["eval_job_order"])
+        # Cost model for longest_first: last observed ms/game per genome key, plus a
+        # ms/game-per-size ratio (decayed sum of ms/game over decayed sum of sizes) for unseen genomes.
+        self.eval_ms_per_game: Dict[int, float] = {}
+        self.eval_cost_ms_sum = 0.0
+        self.eval_cost_size_sum = 0.0
+        self.runtime = dict(runtime)
+        # Threads only babysit Node children (persistent servers or spawned workers),
+        # so there is no need for forked interpreters or pickled genomes.
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.num_workers,
+            thread_name_prefix="neat-eval",
+        )
 
         self.eval_metrics_log = os.path.join(self.output_dir, "eval_metrics.ndjson")
         self.generation_metrics_log = os.path.join(self.output_dir, "generation_metrics.ndjson")
@@ -1194,6 +2716,8 @@ class LoggedParallelEvaluator:
         self.ema_alpha = 2.0 / (float(self.ema_window) + 1.0)
         self.transition_ema_imitation = runtime.get("transition_ema_imitation")
         self.transition_ema_win_rate = runtime.get("transition_ema_win_rate")
+        # "ci_low": the transition EMA tracks the Wilson lower bound instead of the point win rate.
+        self.transition_win_rate_basis = str(runtime["transition_win_rate_basis"])
         self.transition_mean_gold_delta_min = runtime.get("transition_mean_gold_delta_min")
         self.transition_best_fitness_min = runtime.get("transition_best_fitness_min")
         self.transition_streak = int(runtime["transition_streak"])
@@ -1203,8 +2727,24 @@ class LoggedParallelEvaluator:
         self.failure_slope_5_max = float(runtime["failure_slope_5_max"])
         self.failure_slope_metric = str(runtime["failure_slope_metric"])
         self.full_eval_games = int(runtime["games_per_genome"])
+        self.early_stop_mode = str(runtime["early_stop_mode"])
+        self.eval_schedule = str(runtime["eval_schedule"])
+        self.successive_halving_cfg = dict(runtime["successive_halving"])
+        self.eval_cache = None
+        if str(runtime["eval_cache"]) == "ndjson":
+            self.eval_cache = EvalResultCache(
+                runtime["eval_cache_path"] or os.path.join(self.output_dir, "eval_cache.ndjson"),
+                str(runtime["eval_script"]),
+            )
+        self.eval_cache_stats = None
+        # Summed worker throughput of every recorded generation; rates are over summed eval_wall_ms.
+        self.run_throughput = None
+        self.early_stop_sprt_cfg = dict(runtime["early_stop_sprt"])
+        # SPRT p1: K-th best full-eval win rate of the previous generation (config seed until then).
+        self.sprt_reference_win_rate = self.early_stop_sprt_cfg.get("reference_win_rate")
         self.ema_imitation = None
         self.ema_win_rate = None
+        self.ema_win_rate_ci_low = None
         self.gate_streak = 0
         self.transition_generation = None
         self.failure_generation = None
@@ -1226,13 +2766,8 @@ class LoggedParallelEvaluator:
         current = self.generation if generation is None else int(generation)
         return int(self.generation_display_offset + current)
 
-    def _append_lines(self, path: str, records):
-        if not records:
-            return
-        with open(path, "a", encoding="utf-8") as f:
-            for record in records:
-                f.write(json.dumps(record, ensure_ascii=False))
-                f.write("\n")
+    def _append_lines(self, path: str, records, column_table: Optional[str] = None):
+        _METRICS_SINK.append(path, records, column_table=column_table)
 
     def _thresholds(self) -> Dict[str, Any]:
         return {
@@ -1248,6 +2783,7 @@ class LoggedParallelEvaluator:
                 if self.transition_ema_win_rate is not None
                 else None
             ),
+            "transition_win_rate_basis": self.transition_win_rate_basis,
             "transition_mean_gold_delta_min": (
                 float(self.transition_mean_gold_delta_min)
                 if self.transition_mean_gold_delta_min is not None
@@ -1365,6 +2901,7 @@ class LoggedParallelEvaluator:
         return True
 
     def _is_full_eval_record(self, record: dict) -> bool:
+        # SPRT stops only on "accept H0"; those records stay early-stop records here.
         if not bool(record.get("eval_ok")):
             return False
         games = _safe_float(record.get("games"), 0.0)
@@ -1384,6 +2921,9 @@ class LoggedParallelEvaluator:
                 "ema_alpha": float(self.ema_alpha),
                 "ema_imitation": float(self.ema_imitation) if self.ema_imitation is not None else None,
                 "ema_win_rate": float(self.ema_win_rate) if self.ema_win_rate is not None else None,
+                "ema_win_rate_ci_low": (
+                    float(self.ema_win_rate_ci_low) if self.ema_win_rate_ci_low is not None else None
+                ),
                 "gate_streak": int(self.gate_streak),
                 "transition_ready": bool(self.transition_generation is not None),
                 "transition_generation": (
@@ -1399,6 +2939,8 @@ class LoggedParallelEvaluator:
                 ),
                 "latest_imitation": None,
                 "latest_win_rate": None,
+                "latest_win_rate_ci_low": None,
+                "latest_win_rate_ci_high": None,
                 "latest_mean_gold_delta": None,
                 "latest_best_fitness": None,
                 "latest_imitation_slope_5": None,
@@ -1416,10 +2958,18 @@ class LoggedParallelEvaluator:
 
         self.ema_imitation = _ema(self.ema_imitation, imitation, self.ema_alpha)
         self.ema_win_rate = _ema(self.ema_win_rate, win_rate, self.ema_alpha)
+        self.ema_win_rate_ci_low = _ema(
+            self.ema_win_rate_ci_low,
+            _safe_float(best_record.get("win_rate_ci_low"), 0.0),
+            self.ema_alpha,
+        )
 
         transition_ok = True
         if self.transition_ema_win_rate is not None:
-            transition_ok = transition_ok and (self.ema_win_rate >= self.transition_ema_win_rate)
+            transition_win_rate = (
+                self.ema_win_rate_ci_low if self.transition_win_rate_basis == "ci_low" else self.ema_win_rate
+            )
+            transition_ok = transition_ok and (transition_win_rate >= self.transition_ema_win_rate)
         if self.transition_mean_gold_delta_min is not None:
             transition_ok = transition_ok and (
                 mean_gold_delta == mean_gold_delta
@@ -1467,6 +3017,7 @@ class LoggedParallelEvaluator:
             "ema_alpha": float(self.ema_alpha),
             "ema_imitation": float(self.ema_imitation),
             "ema_win_rate": float(self.ema_win_rate),
+            "ema_win_rate_ci_low": float(self.ema_win_rate_ci_low),
             "gate_streak": int(self.gate_streak),
             "transition_ready": bool(self.transition_generation is not None),
             "transition_generation": (
@@ -1482,6 +3033,8 @@ class LoggedParallelEvaluator:
             ),
             "latest_imitation": float(imitation),
             "latest_win_rate": float(win_rate),
+            "latest_win_rate_ci_low": _safe_optional_float(best_record.get("win_rate_ci_low")),
+            "latest_win_rate_ci_high": _safe_optional_float(best_record.get("win_rate_ci_high")),
             "latest_mean_gold_delta": float(mean_gold_delta) if mean_gold_delta == mean_gold_delta else None,
             "latest_best_fitness": float(best_fitness),
             "latest_imitation_slope_5": float(imitation_slope_5),
@@ -1489,31 +3042,346 @@ class LoggedParallelEvaluator:
             "thresholds": self._thresholds(),
         }
 
-    def evaluate(self, genomes, config):
+    def _eval_cache_lookup(self, genome, config, seed_text: str, eval_kwargs: dict):
+        """Return (key, cached result or None, exported payload); a miss sends the payload as is."""
+        with _PHASE_TIMER.measure("payload_export"):
+            payload = _export_neat_python_genome(genome, config, self.runtime)
+        # "run" drops the per-generation seed so unchanged elites hit across generations;
+        # their cached score then comes from the seeds of the generation that stored it.
+        key_seed = seed_text if str(self.runtime["eval_cache_seed_scope"]) == "generation" else self.runtime_seed
+        key = _eval_cache_key(payload, self.runtime, key_seed, eval_kwargs, self.eval_cache.worker_digest)
+        cached = self.eval_cache.get(key)
+        if cached is not None:
+            cached["eval_cache_hit"] = True
+        return key, cached, payload
+
+    def _evaluate_entries(self, genomes, config, seed_text: str, display_generation: int, **eval_kwargs) -> list:
+        """Evaluate [(genome_key, genome), ...]; results keep input order.
+
+        With eval_cache enabled, cached summaries are reused and identical genomes inside
+        one call are played once; only the remaining unique genomes reach the workers.
+        """
+        if self.eval_cache is None:
+            return self._dispatch_entries(genomes, config, seed_text, display_generation, **eval_kwargs)
+
+        stats = self.eval_cache_stats
+        results = [None] * len(genomes)
+        pending: Dict[str, list] = {}
+        payloads = {}
+        for idx, (_, genome) in enumerate(genomes):
+            key, cached, payload = self._eval_cache_lookup(genome, config, seed_text, eval_kwargs)
+            if cached is not None:
+                results[idx] = cached
+                stats["hits"] += 1
+            else:
+                pending.setdefault(key, []).append(idx)
+                payloads.setdefault(key, payload)
+
+        fresh_results = self._dispatch_entries(
+            [genomes[idxs[0]] for idxs in pending.values()],
+            config,
+            seed_text,
+            display_generation,
+            payloads=list(payloads.values()),
+            **eval_kwargs,
+        )
+        for (key, idxs), result in zip(pending.items(), fresh_results):
+            stats["misses"] += 1
+            results[idxs[0]] = result
+            if bool(result.get("eval_ok")):
+                self.eval_cache.put(key, result)
+                stats["stored"] += 1
+            for idx in idxs[1:]:
+                duplicate = copy.deepcopy(result)
+                duplicate["eval_cache_hit"] = True
+                results[idx] = duplicate
+                stats["duplicates"] += 1
+        return results
+
+    def _predict_eval_cost(self, genome_key: int, genome) -> float:
+        observed = self.eval_ms_per_game.get(int(genome_key))
+        if observed is not None:
+            return observed
+        size = float(_genome_eval_size(genome))
+        if self.eval_cost_size_sum > 0:
+            return size * (self.eval_cost_ms_sum / self.eval_cost_size_sum)
+        return size
+
+    def _observe_eval_cost(self, genome_key: int, genome, result: dict) -> None:
+        if not bool(result.get("eval_ok")) or bool(result.get("eval_cache_hit")):
+            return
+        games = _to_int(result.get("games"), 0)
+        eval_ms = _safe_float(result.get("eval_time_ms"), -1.0)
+        if games <= 0 or eval_ms < 0:
+            return
+        ms_per_game = eval_ms / float(games)
+        self.eval_ms_per_game[int(genome_key)] = ms_per_game
+        self.eval_cost_ms_sum = (self.eval_cost_ms_sum * _EVAL_COST_DECAY) + ms_per_game
+        self.eval_cost_size_sum = (self.eval_cost_size_sum * _EVAL_COST_DECAY) + float(_genome_eval_size(genome))
+
+    def _plan_batches(self, genomes) -> list:
+        """Split entry indices into worker batches, in submission order.
+
+        population: contiguous slices, one per eval thread by default.
+        longest_first: greedy LPT packing by predicted cost into smaller batches, largest
+        batch first; the executor queue then hands the next batch to whichever thread frees up.
+        """
+        count = len(genomes)
+        if self.eval_job_order == "population":
+            batch_size = self.eval_batch_size
+            if batch_size <= 0:
+                batch_size = max(1, int(math.ceil(count / float(self.num_workers))))
+            return [list(range(start, min(count, start + batch_size))) for start in range(0, count, batch_size)]
+
+        batch_size = self.eval_batch_size
+        if batch_size <= 0:
+            batch_size = max(1, int(math.ceil(count / float(self.num_workers * _EVAL_JOB_SLICES_PER_WORKER))))
+        costs = [self._predict_eval_cost(int(genome_key), genome) for genome_key, genome in genomes]
+        num_batches = int(math.ceil(count / float(batch_size))) if count > 0 else 0
+        batches = [[] for _ in range(num_batches)]
+        loads = [0.0] * num_batches
+        for idx in sorted(range(count), key=lambda i: costs[i], reverse=True):
+            target = min(
+                (b for b in range(num_batches) if len(batches[b]) < batch_size),
+                key=lambda b: loads[b],
+            )
+            batches[target].append(idx)
+            loads[target] += costs[idx]
+        order = sorted(range(num_batches), key=lambda b: loads[b], reverse=True)
+        return [batches[b] for b in order]
+
+    def _dispatch_entries(
+        self, genomes, config, seed_text: str, display_generation: int, payloads=None, **eval_kwargs
+    ) -> list:
+        """Run [(genome_key, genome), ...] through the eval threads in batches; results keep input order.
+
+        Batches are consumed as they complete, so a slow batch never blocks collection of the rest.
+        payloads, when given, holds the already-exported genome JSON per entry and is sent as is.
+        """
+        jobs = {}
+        for indices in self._plan_batches(genomes):
+            batch = [
+                (int(genomes[idx][0]), genomes[idx][1] if payloads is None else payloads[idx])
+                for idx in indices
+            ]
+            future = self.executor.submit(
+                _run_eval_worker_for_genomes,
+                batch,
+                config,
+                self.runtime,
+                seed_text,
+                int(display_generation),
+                **eval_kwargs,
+            )
+            jobs[future] = indices
+
+        results = [None] * len(genomes)
+        try:
+            for future in concurrent.futures.as_completed(jobs):
+                indices = jobs[future]
+                try:
+                    batch_results = list(future.result())
+                except Exception as exc:
+                    batch_results = [
+                        {
+                            "fitness": -1e9,
+                            "worker_exception": repr(exc),
+                            "traceback": traceback.format_exc(),
+                            "seed_used": seed_text,
+                            "eval_ok": False,
+                        }
+                        for _ in indices
+                    ]
+                for idx, result in zip(indices, batch_results):
+                    results[idx] = result
+                    self._observe_eval_cost(int(genomes[idx][0]), genomes[idx][1], result)
+        except BaseException:
+            # Interrupted (Ctrl+C or a fatal error): drop queued batches and kill running Node children.
+            for future in jobs:
+                future.cancel()
+            _close_eval_servers(kill=True)
+            raise
+        return results
+
+    def _evaluate_successive_halving(self, genomes, config, seed_text: str, display_generation: int):
+        """Play short rounds for everyone, keep the top keep_fraction, repeat until games_per_genome.
+
+        Every round plays the next slice of the per-game seed schedule (--game-offset), so all
+        genomes see the same seeds and an eliminated genome keeps its pooled partial record.
+        Each round starts a fresh gold series at its offset, hence continuous_series = false.
+        """
+        cfg = self.successive_halving_cfg
+        full_games = int(self.full_eval_games)
+        keep_fraction = float(cfg["keep_fraction"])
+        partials = {int(genome_key): [] for genome_key, _ in genomes}
+        failures = {}
+        survivors = list(genomes)
+        played = 0
+        rounds = []
+        while survivors and played < full_games:
+            if played <= 0:
+                target = min(full_games, int(cfg["initial_games"]))
+            else:
+                target = min(full_games, max(played + 1, int(math.ceil(played / keep_fraction))))
+            round_results = self._evaluate_entries(
+                survivors,
+                config,
+                seed_text,
+                display_generation,
+                games_override=int(target - played),
+                early_stop_win_rate_cutoffs_override=[],
+                early_stop_go_take_rate_cutoffs_override=[],
+                game_offset=int(played),
+                schedule_games=full_games,
+            )
+            for (genome_key, _), result in zip(survivors, round_results):
+                if bool(result.get("eval_ok")):
+                    partials[int(genome_key)].append(result)
+                else:
+                    failures[int(genome_key)] = result
+            alive = [(genome_key, genome) for genome_key, genome in survivors if int(genome_key) not in failures]
+            rounds.append(
+                {
+                    "game_offset": int(played),
+                    "games": int(target - played),
+                    "entrants": len(survivors),
+                    "failed": len(survivors) - len(alive),
+                }
+            )
+            played = target
+            if played >= full_games:
+                break
+            alive.sort(
+                key=lambda item: _safe_float(
+                    (_merge_eval_records(partials[int(item[0])], self.runtime, "successive_halving") or {}).get("fitness"),
+                    -1e9,
+                ),
+                reverse=True,
+            )
+            keep = max(int(cfg["min_survivors"]), int(math.ceil(len(alive) * keep_fraction)))
+            survivors = alive[:keep]
+
+        results = []
+        for genome_key, _ in genomes:
+            if int(genome_key) in failures:
+                results.append(failures[int(genome_key)])
+                continue
+            merged = _merge_eval_records(partials[int(genome_key)], self.runtime, "successive_halving")
+            if merged is None:
+                results.append({"fitness": -1e9, "seed_used": seed_text, "eval_ok": False})
+                continue
+            merged["seed_used"] = seed_text
+            merged["eval_ok"] = True
+            merged["successive_halving_rounds"] = len(partials[int(genome_key)])
+            results.append(merged)
+        return results, rounds
+
+    def begin_generation(self) -> dict:
+        """Advance the generation counter and return the eval context shared by its genomes."""
         self.generation += 1
         display_generation = self._display_generation()
-        seed_for_generation = f"{self.runtime_seed}|gen={display_generation}"
-        jobs = []
-        for genome_key, genome in genomes:
-            job = self.pool.apply_async(
-                eval_function,
-                (genome, config, seed_for_generation, int(display_generation), int(genome_key)),
+        if self.eval_cache is not None:
+            self.eval_cache_stats = {"hits": 0, "misses": 0, "duplicates": 0, "stored": 0}
+        eval_kwargs = {}
+        if self.early_stop_mode == "sprt":
+            early_stop_sprt = _sprt_hypotheses(self.sprt_reference_win_rate, self.early_stop_sprt_cfg)
+            # Until a reference win rate exists, the staircase cutoffs still stop clearly bad genomes.
+            if early_stop_sprt is not None:
+                eval_kwargs["early_stop_win_rate_cutoffs_override"] = []
+                eval_kwargs["early_stop_sprt"] = early_stop_sprt
+        return {
+            "display_generation": int(display_generation),
+            "seed": f"{self.runtime_seed}|gen={display_generation}",
+            "eval_kwargs": eval_kwargs,
+            "started": time.perf_counter(),
+        }
+
+    def evaluate(self, genomes, config):
+        ctx = self.begin_generation()
+        genomes = list(genomes)
+        # Only genomes still alive can be re-evaluated; drop cost history for the rest.
+        live_keys = {int(genome_key) for genome_key, _ in genomes}
+        self.eval_ms_per_game = {k: v for k, v in self.eval_ms_per_game.items() if k in live_keys}
+        halving_rounds = []
+        if self.eval_schedule == "successive_halving":
+            ctx["eval_kwargs"].pop("early_stop_sprt", None)
+            results, halving_rounds = self._evaluate_successive_halving(
+                genomes, config, ctx["seed"], ctx["display_generation"]
+            )
+        else:
+            results = self._evaluate_entries(
+                genomes,
+                config,
+                ctx["seed"],
+                ctx["display_generation"],
+                **ctx["eval_kwargs"],
             )
-            jobs.append((genome_key, genome, job))
+        self.record_generation(ctx, genomes, results, halving_rounds=halving_rounds)
+
+    def submit_genome(self, ctx: dict, genome_key: int, genome, config) -> tuple:
+        """Queue one genome on the eval threads (steady_state loop); pair with collect_genome().
+
+        Returns (future, cache_key); cache_key is None when eval_cache is off or the result was cached.
+        """
+        cache_key = None
+        worker_genome = genome
+        if self.eval_cache is not None:
+            cache_key, cached, worker_genome = self._eval_cache_lookup(genome, config, ctx["seed"], ctx["eval_kwargs"])
+            if cached is not None:
+                self.eval_cache_stats["hits"] += 1
+                future = concurrent.futures.Future()
+                future.set_result([cached])
+                return future, None
+            self.eval_cache_stats["misses"] += 1
+        future = self.executor.submit(
+            _run_eval_worker_for_genomes,
+            [(int(genome_key), worker_genome)],
+            config,
+            self.runtime,
+            ctx["seed"],
+            int(ctx["display_generation"]),
+            **ctx["eval_kwargs"],
+        )
+        return future, cache_key
 
-        records = []
-        for genome_key, genome, job in jobs:
-            try:
-                result = job.get()
-            except Exception as exc:
-                result = {
-                    "fitness": -1e9,
-                    "worker_exception": repr(exc),
-                    "traceback": traceback.format_exc(),
-                    "seed_used": seed_for_generation,
-                    "eval_ok": False,
-                }
+    def collect_genome(
+        self,
+        future: concurrent.futures.Future,
+        genome_key: int,
+        genome,
+        seed_text: str,
+        cache_key: Optional[str] = None,
+    ) -> dict:
+        try:
+            result = list(future.result())[0]
+        except Exception as exc:
+            result = {
+                "fitness": -1e9,
+                "worker_exception": repr(exc),
+                "traceback": traceback.format_exc(),
+                "seed_used": seed_text,
+                "eval_ok": False,
+            }
+        if cache_key is not None and bool(result.get("eval_ok")):
+            self.eval_cache.put(cache_key, result)
+            self.eval_cache_stats["stored"] += 1
+        self._observe_eval_cost(int(genome_key), genome, result)
+        return result
+
+    def record_generation(self, ctx: dict, genomes, results, halving_rounds=None) -> None:
+        """Write eval/generation metrics and advance gate state for one (generation-equivalent) batch."""
+        build_started = time.perf_counter()
+        display_generation = int(ctx["display_generation"])
+        seed_for_generation = str(ctx["seed"])
+        early_stop_sprt = ctx["eval_kwargs"].get("early_stop_sprt")
+        halving_rounds = list(halving_rounds or [])
+        eval_wall_ms = (time.perf_counter() - float(ctx["started"])) * 1000.0
+        evaluated = [
+            (genome_key, genome, result) for (genome_key, genome), result in zip(genomes, results)
+        ]
 
+        records = []
+        for genome_key, genome, result in evaluated:
             if isinstance(result, dict):
                 fitness = _safe_float(result.get("fitness"), -1e9)
             else:
@@ -1554,10 +3422,17 @@ class LoggedParallelEvaluator:
             )
             records.append(record)
 
-        self._append_lines(self.eval_metrics_log, records)
+        self._append_lines(self.eval_metrics_log, records, column_table="eval_metrics")
 
         valid_records = [r for r in records if self._is_valid_gate_record(r)]
         full_eval_records = [r for r in valid_records if self._is_full_eval_record(r)]
+        sprt_stop_count = sum(1 for r in records if r.get("early_stop_reason") == "sprt_accept_h0")
+        if self.early_stop_mode == "sprt" and len(full_eval_records) > 0:
+            top_win_rates = sorted(
+                (_safe_float(r.get("win_rate"), 0.0) for r in full_eval_records),
+                reverse=True,
+            )[: int(self.early_stop_sprt_cfg["topk"])]
+            self.sprt_reference_win_rate = float(top_win_rates[-1])
 
         if records:
             selection_best_record = (
@@ -1597,7 +3472,7 @@ class LoggedParallelEvaluator:
             valid_eval_ms = [
                 max(0.0, _safe_float(r.get("eval_time_ms"), 0.0))
                 for r in valid_records
-                if r.get("eval_time_ms") is not None
+                if r.get("eval_time_ms") is not None and not bool(r.get("eval_cache_hit"))
             ]
             generation_record = {
                 "saved_at": datetime.now(timezone.utc).isoformat(),
@@ -1661,9 +3536,34 @@ class LoggedParallelEvaluator:
                 "mean_eval_time_ms": (
                     sum(valid_eval_ms) / max(1, len(valid_eval_ms)) if len(valid_eval_ms) > 0 else None
                 ),
+                "eval_wall_ms": eval_wall_ms,
                 "p90_eval_time_ms": (
                     _quantile(valid_eval_ms, 0.9) if len(valid_eval_ms) > 0 else None
                 ),
+                "total_games": int(sum(int(_safe_float(r.get("games"), 0.0)) for r in records)),
+                "best_win_rate_ci_low": (
+                    _safe_optional_float(best_record.get("win_rate_ci_low")) if best_record is not None else None
+                ),
+                "best_win_rate_ci_high": (
+                    _safe_optional_float(best_record.get("win_rate_ci_high")) if best_record is not None else None
+                ),
+                "early_stop_mode": self.early_stop_mode,
+                "sprt_hypotheses": early_stop_sprt,
+                "sprt_stop_count": int(sprt_stop_count),
+                "eval_schedule": self.eval_schedule,
+                "eval_job_order": self.eval_job_order,
+                "successive_halving_rounds": halving_rounds,
+                "crn_reference_policy": str(self.runtime["crn_reference_policy"]) or None,
+                "eval_cache": (
+                    dict(self.eval_cache_stats, entries=len(self.eval_cache.entries))
+                    if self.eval_cache is not None
+                    else None
+                ),
+                "best_crn": (
+                    dict(best_record.get("crn") or {}) or None
+                    if best_record is not None
+                    else None
+                ),
             }
         else:
             generation_record = {
@@ -1688,27 +3588,62 @@ class LoggedParallelEvaluator:
                 "best_genome_nodes": 0,
                 "best_genome_connections": 0,
                 "mean_eval_time_ms": None,
+                "eval_wall_ms": eval_wall_ms,
                 "p90_eval_time_ms": None,
+                "total_games": 0,
+                "best_win_rate_ci_low": None,
+                "best_win_rate_ci_high": None,
+                "early_stop_mode": self.early_stop_mode,
+                "sprt_hypotheses": early_stop_sprt,
+                "sprt_stop_count": 0,
+                "eval_schedule": self.eval_schedule,
+                "eval_job_order": self.eval_job_order,
+                "successive_halving_rounds": halving_rounds,
+                "crn_reference_policy": str(self.runtime["crn_reference_policy"]) or None,
+                "eval_cache": (
+                    dict(self.eval_cache_stats, entries=len(self.eval_cache.entries))
+                    if self.eval_cache is not None
+                    else None
+                ),
+                "best_crn": None,
             }
             best_record = None
 
+        # Cache hits replay a stored summary, so only fresh evaluations count toward throughput.
+        generation_record["throughput"] = _sum_eval_throughput(
+            [r.get("throughput") for r in records if not bool(r.get("eval_cache_hit"))],
+            elapsed_ms=eval_wall_ms,
+        )
+        if generation_record["throughput"] is not None:
+            self.run_throughput = _sum_eval_throughput(
+                [self.run_throughput, generation_record["throughput"]],
+                elapsed_ms=_safe_float((self.run_throughput or {}).get("elapsed_ms"), 0.0) + eval_wall_ms,
+            )
+        gate_started = time.perf_counter()
+        _PHASE_TIMER.add("record_build", (gate_started - build_started) * 1000.0)
         best_gate_record = max(valid_records, key=lambda r: _safe_float(r.get("fitness"), -1e9)) if len(valid_records) > 0 else None
         self._update_gate(best_gate_record, len(valid_records), len(records))
         generation_record["gate_state"] = dict(self.gate_state)
-        self._append_lines(self.generation_metrics_log, [generation_record])
+        self._append_lines(self.generation_metrics_log, [generation_record], column_table="generation_metrics")
         with open(self.gate_state_path, "w", encoding="utf-8") as f:
             json.dump(self.gate_state, f, ensure_ascii=False, indent=2)
+        _PHASE_TIMER.add("gate_update", (time.perf_counter() - gate_started) * 1000.0)
 
     def close(self):
-        if self.pool is None:
+        if self.executor is None:
             return
-        self.pool.close()
-        self.pool.join()
-        self.pool = None
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.executor = None
+        _close_eval_servers()
 
     def snapshot(self):
         return dict(self.gate_state)
 
+    def throughput_snapshot(self):
+        if self.run_throughput is None:
+            return None
+        return copy.deepcopy(self.run_throughput)
+
     def best_record_snapshot(self):
         if self.best_record_overall is None:
             return None
@@ -1758,76 +3693,162 @@ def _serialize_playoff_entry(training_record: dict, playoff_record: dict) -> dic
         "playoff_go_take_rate": playoff_record.get("go_take_rate"),
         "playoff_go_fail_rate": playoff_record.get("go_fail_rate"),
         "playoff_seed_used": playoff_record.get("seed_used"),
+        "playoff_shards": playoff_record.get("playoff_shards"),
+        "playoff_games": playoff_record.get("games"),
+        "playoff_eliminated_round": playoff_record.get("playoff_eliminated_round"),
+        "playoff_crn_mean_result_diff": (playoff_record.get("crn") or {}).get("mean_result_diff"),
+        "playoff_crn_std_err_result_diff": (playoff_record.get("crn") or {}).get("std_err_result_diff"),
         "eval_ok": playoff_record.get("eval_ok"),
     }
 
 
 def _build_pooled_best_record(records: list[dict], runtime: dict) -> Optional[dict]:
-    source_records = [dict(item or {}) for item in records if isinstance(item, dict)]
-    source_records = [item for item in source_records if _safe_float(item.get("games"), 0.0) > 0.0]
-    if not source_records:
+    return _merge_eval_records(records, runtime, record_mode="pooled_training_playoff")
+
+
+# raw_stats keys that are not sums over games; merges keep the first source's value.
+_EVAL_RAW_STATS_FIXED_KEYS = ("format", "imitation_weights")
+
+
+def _eval_raw_stats_from_record(record: dict) -> dict:
+    """Sufficient statistics of one eval summary.
+
+    Worker summaries carry them as raw_stats; older summaries (e.g. eval cache entries written
+    before raw_stats existed) are reconstructed from their counts and means. Sums a legacy
+    summary cannot provide (per-seat gold squares, per-opponent tallies) are None, and None
+    wins in _merge_eval_raw_stats.
+    """
+    raw_stats = record.get("raw_stats")
+    if isinstance(raw_stats, dict):
+        return copy.deepcopy(raw_stats)
+
+    def _count(value) -> int:
+        return max(0, int(_safe_float(value, 0.0)))
+
+    games = _count(record.get("games"))
+    seats = {}
+    for side in ("first", "second"):
+        seat = dict(((record.get("seat_breakdown") or {}).get(side) or {}))
+        seat_games = _count(seat.get("games"))
+        seats[side] = {
+            "games": seat_games,
+            "wins": _count(seat.get("wins")),
+            "losses": _count(seat.get("losses")),
+            "draws": _count(seat.get("draws")),
+            "gold_sum": float(seat_games) * _safe_float(seat.get("mean_gold_delta"), 0.0),
+            "gold_sum_sq": None,
+        }
+    crn = record.get("crn")
+    return {
+        "format": "neat_eval_raw_stats_v1",
+        "games": games,
+        "wins": _count(record.get("wins")),
+        "losses": _count(record.get("losses")),
+        "draws": _count(record.get("draws")),
+        "gold_delta_sum": float(games) * _safe_float(record.get("mean_gold_delta"), 0.0),
+        "gold_delta_sum_sq": _safe_optional_float(record.get("gold_delta_sum_sq")),
+        "go_opportunity_count": _count(record.get("go_opportunity_count")),
+        "go_opportunity_games": _count(record.get("go_opportunity_games")),
+        "go_count": _count(record.get("go_count")),
+        "go_games": _count(record.get("go_games")),
+        "go_fail_count": _count(record.get("go_fail_count")),
+        "my_bankrupt_count": _count((record.get("bankrupt") or {}).get("my_bankrupt_count")),
+        "inflicted_bankrupt_count": _count((record.get("bankrupt") or {}).get("my_inflicted_bankrupt_count")),
+        "imitation_totals": {
+            "play": _count(record.get("imitation_play_total")),
+            "match": _count(record.get("imitation_match_total")),
+            "option": _count(record.get("imitation_option_total")),
+        },
+        "imitation_matches": {
+            "play": _count(record.get("imitation_play_matches")),
+            "match": _count(record.get("imitation_match_matches")),
+            "option": _count(record.get("imitation_option_matches")),
+        },
+        "imitation_weights": {
+            "play": _safe_float(record.get("imitation_weight_play"), 0.5),
+            "match": _safe_float(record.get("imitation_weight_match"), 0.3),
+            "option": _safe_float(record.get("imitation_weight_option"), 0.2),
+        },
+        "seats": seats,
+        "opponents": None,
+        "opponent_policy_counts": (
+            dict(record["opponent_policy_counts"]) if isinstance(record.get("opponent_policy_counts"), dict) else None
+        ),
+        "first_turn_counts": (
+            dict(record["first_turn_counts"]) if isinstance(record.get("first_turn_counts"), dict) else None
+        ),
+        "crn_sums": (dict(crn["sums"]) if isinstance(crn, dict) and isinstance(crn.get("sums"), dict) else None),
+    }
+
+
+def _merge_eval_raw_stats(raw_stats_list: list) -> Optional[dict]:
+    """Add raw_stats of disjoint game sets key by key (None in any source makes the merged value None)."""
+    if not raw_stats_list:
         return None
 
-    total_games = sum(max(0, int(_safe_float(item.get("games"), 0.0))) for item in source_records)
+    def _add(a, b):
+        if a is None or b is None:
+            return None
+        if isinstance(a, dict) and isinstance(b, dict):
+            # A key only one side has (e.g. an opponent policy the other shard never drew) is taken as is.
+            merged = dict(a)
+            for key, value in b.items():
+                merged[key] = _add(merged[key], value) if key in merged else copy.deepcopy(value)
+            return merged
+        return a + b
+
+    merged = copy.deepcopy(raw_stats_list[0])
+    for raw_stats in raw_stats_list[1:]:
+        fixed = {key: merged.get(key) for key in _EVAL_RAW_STATS_FIXED_KEYS}
+        merged = _add(
+            {key: value for key, value in merged.items() if key not in _EVAL_RAW_STATS_FIXED_KEYS},
+            {key: value for key, value in raw_stats.items() if key not in _EVAL_RAW_STATS_FIXED_KEYS},
+        )
+        merged.update(fixed)
+    return merged
+
+
+def _finalize_eval_stats(raw_stats: dict, runtime: dict, record_mode: str) -> Optional[dict]:
+    """Turn raw_stats into an eval record with the worker's derived rates and fitness formula."""
+    total_games = max(0, int(_safe_float(raw_stats.get("games"), 0.0)))
     if total_games <= 0:
         return None
 
-    wins = sum(max(0, int(_safe_float(item.get("wins"), 0.0))) for item in source_records)
-    losses = sum(max(0, int(_safe_float(item.get("losses"), 0.0))) for item in source_records)
-    draws = sum(max(0, int(_safe_float(item.get("draws"), 0.0))) for item in source_records)
-    requested_games = sum(max(0, int(_safe_float(item.get("requested_games"), item.get("games")))) for item in source_records)
-
-    def _seat_block(record: dict, side: str) -> dict:
-        return dict(((record.get("seat_breakdown") or {}).get(side) or {}))
-
-    def _sum_seat_count(side: str, key: str) -> int:
-        return sum(max(0, int(_safe_float(_seat_block(item, side).get(key), 0.0))) for item in source_records)
-
-    def _seat_mean_gold_delta(side: str) -> float:
-        games = _sum_seat_count(side, "games")
-        if games <= 0:
-            return 0.0
-        total = 0.0
-        for item in source_records:
-            seat = _seat_block(item, side)
-            seat_games = max(0, int(_safe_float(seat.get("games"), 0.0)))
-            seat_mean = _safe_float(seat.get("mean_gold_delta"), 0.0)
-            total += float(seat_games) * seat_mean
-        return total / float(games)
-
-    first_games = _sum_seat_count("first", "games")
-    second_games = _sum_seat_count("second", "games")
-    first_wins = _sum_seat_count("first", "wins")
-    first_losses = _sum_seat_count("first", "losses")
-    first_draws = _sum_seat_count("first", "draws")
-    second_wins = _sum_seat_count("second", "wins")
-    second_losses = _sum_seat_count("second", "losses")
-    second_draws = _sum_seat_count("second", "draws")
-    first_mean_gold_delta = _seat_mean_gold_delta("first")
-    second_mean_gold_delta = _seat_mean_gold_delta("second")
-
     def _rate(numerator: float, denominator: float) -> float:
         return (float(numerator) / float(denominator)) if float(denominator) > 0.0 else 0.0
 
+    def _breakdown(block: dict) -> dict:
+        block = dict(block or {})
+        games = max(0, int(_safe_float(block.get("games"), 0.0)))
+        return {
+            "games": games,
+            "wins": int(_safe_float(block.get("wins"), 0.0)),
+            "losses": int(_safe_float(block.get("losses"), 0.0)),
+            "draws": int(_safe_float(block.get("draws"), 0.0)),
+            "win_rate": _rate(_safe_float(block.get("wins"), 0.0), games),
+            "loss_rate": _rate(_safe_float(block.get("losses"), 0.0), games),
+            "draw_rate": _rate(_safe_float(block.get("draws"), 0.0), games),
+            "mean_gold_delta": _rate(_safe_float(block.get("gold_sum"), 0.0), games),
+        }
+
+    wins = int(_safe_float(raw_stats.get("wins"), 0.0))
+    losses = int(_safe_float(raw_stats.get("losses"), 0.0))
+    draws = int(_safe_float(raw_stats.get("draws"), 0.0))
     win_rate = _rate(wins, total_games)
+    win_rate_ci = _wilson_interval(wins, total_games)
     loss_rate = _rate(losses, total_games)
     draw_rate = _rate(draws, total_games)
-    mean_gold_delta = sum(
-        float(max(0, int(_safe_float(item.get("games"), 0.0)))) * _safe_float(item.get("mean_gold_delta"), 0.0)
-        for item in source_records
-    ) / float(total_games)
-
-    first_win_rate = _rate(first_wins, first_games)
-    first_loss_rate = _rate(first_losses, first_games)
-    first_draw_rate = _rate(first_draws, first_games)
-    second_win_rate = _rate(second_wins, second_games)
-    second_loss_rate = _rate(second_losses, second_games)
-    second_draw_rate = _rate(second_draws, second_games)
-
-    weighted_win_rate = (0.48 * first_win_rate) + (0.52 * second_win_rate)
-    weighted_loss_rate = (0.48 * first_loss_rate) + (0.52 * second_loss_rate)
-    weighted_draw_rate = (0.48 * first_draw_rate) + (0.52 * second_draw_rate)
-    weighted_mean_gold_delta = (0.48 * first_mean_gold_delta) + (0.52 * second_mean_gold_delta)
+    mean_gold_delta = _rate(_safe_float(raw_stats.get("gold_delta_sum"), 0.0), total_games)
+    gold_delta_sum_sq = _safe_optional_float(raw_stats.get("gold_delta_sum_sq"))
+
+    seats = dict(raw_stats.get("seats") or {})
+    first = _breakdown(seats.get("first"))
+    second = _breakdown(seats.get("second"))
+
+    weighted_win_rate = (0.48 * first["win_rate"]) + (0.52 * second["win_rate"])
+    weighted_loss_rate = (0.48 * first["loss_rate"]) + (0.52 * second["loss_rate"])
+    weighted_draw_rate = (0.48 * first["draw_rate"]) + (0.52 * second["draw_rate"])
+    weighted_mean_gold_delta = (0.48 * first["mean_gold_delta"]) + (0.52 * second["mean_gold_delta"])
 
     fitness_gold_scale = max(1e-9, _safe_float(runtime.get("fitness_gold_scale"), 1500.0))
     fitness_gold_neutral_delta = _safe_float(runtime.get("fitness_gold_neutral_delta"), 0.0)
@@ -1851,55 +3872,56 @@ def _build_pooled_best_record(records: list[dict], runtime: dict) -> Optional[di
 
     fitness = (fitness_gold_weight * gold_norm) + (fitness_win_weight * result_norm)
 
-    go_opportunity_count = sum(max(0, int(_safe_float(item.get("go_opportunity_count"), 0.0))) for item in source_records)
-    go_opportunity_games = sum(max(0, int(_safe_float(item.get("go_opportunity_games"), 0.0))) for item in source_records)
-    go_count = sum(max(0, int(_safe_float(item.get("go_count"), 0.0))) for item in source_records)
-    go_fail_count = sum(max(0, int(_safe_float(item.get("go_fail_count"), 0.0))) for item in source_records)
-    go_games = sum(max(0, int(_safe_float(item.get("go_games"), 0.0))) for item in source_records)
-
-    my_bankrupt_count = sum(
-        max(0, int(_safe_float(((item.get("bankrupt") or {}).get("my_bankrupt_count")), 0.0)))
-        for item in source_records
-    )
-    inflicted_bankrupt_count = sum(
-        max(0, int(_safe_float(((item.get("bankrupt") or {}).get("my_inflicted_bankrupt_count")), 0.0)))
-        for item in source_records
-    )
-
-    imitation_play_total = sum(max(0, int(_safe_float(item.get("imitation_play_total"), 0.0))) for item in source_records)
-    imitation_play_matches = sum(max(0, int(_safe_float(item.get("imitation_play_matches"), 0.0))) for item in source_records)
-    imitation_match_total = sum(max(0, int(_safe_float(item.get("imitation_match_total"), 0.0))) for item in source_records)
-    imitation_match_matches = sum(max(0, int(_safe_float(item.get("imitation_match_matches"), 0.0))) for item in source_records)
-    imitation_option_total = sum(max(0, int(_safe_float(item.get("imitation_option_total"), 0.0))) for item in source_records)
-    imitation_option_matches = sum(max(0, int(_safe_float(item.get("imitation_option_matches"), 0.0))) for item in source_records)
-    imitation_weight_play = _safe_float(source_records[0].get("imitation_weight_play"), 0.5)
-    imitation_weight_match = _safe_float(source_records[0].get("imitation_weight_match"), 0.3)
-    imitation_weight_option = _safe_float(source_records[0].get("imitation_weight_option"), 0.2)
-    imitation_play_ratio = _rate(imitation_play_matches, imitation_play_total)
-    imitation_match_ratio = _rate(imitation_match_matches, imitation_match_total)
-    imitation_option_ratio = _rate(imitation_option_matches, imitation_option_total)
-    imitation_weight_sum = imitation_weight_play + imitation_weight_match + imitation_weight_option
+    go_opportunity_count = int(_safe_float(raw_stats.get("go_opportunity_count"), 0.0))
+    go_opportunity_games = int(_safe_float(raw_stats.get("go_opportunity_games"), 0.0))
+    go_count = int(_safe_float(raw_stats.get("go_count"), 0.0))
+    go_fail_count = int(_safe_float(raw_stats.get("go_fail_count"), 0.0))
+    go_games = int(_safe_float(raw_stats.get("go_games"), 0.0))
+    my_bankrupt_count = int(_safe_float(raw_stats.get("my_bankrupt_count"), 0.0))
+    inflicted_bankrupt_count = int(_safe_float(raw_stats.get("inflicted_bankrupt_count"), 0.0))
+
+    imitation_totals = dict(raw_stats.get("imitation_totals") or {})
+    imitation_matches = dict(raw_stats.get("imitation_matches") or {})
+    imitation_weights = dict(raw_stats.get("imitation_weights") or {"play": 0.5, "match": 0.3, "option": 0.2})
+    imitation_ratios = {
+        key: _rate(_safe_float(imitation_matches.get(key), 0.0), _safe_float(imitation_totals.get(key), 0.0))
+        for key in ("play", "match", "option")
+    }
+    # Same as the worker's buildImitationMetrics: only decision kinds that occurred carry weight.
+    imitation_weight_sum = sum(
+        _safe_float(imitation_weights.get(key), 0.0)
+        for key in ("play", "match", "option")
+        if _safe_float(imitation_totals.get(key), 0.0) > 0.0
+    )
     if imitation_weight_sum > 0.0:
-        imitation_weighted_score = (
-            (imitation_weight_play * imitation_play_ratio)
-            + (imitation_weight_match * imitation_match_ratio)
-            + (imitation_weight_option * imitation_option_ratio)
+        imitation_weighted_score = sum(
+            _safe_float(imitation_weights.get(key), 0.0) * imitation_ratios[key] for key in ("play", "match", "option")
         ) / imitation_weight_sum
     else:
         imitation_weighted_score = 0.0
 
-    pooled_record = {
-        "generation": source_records[0].get("generation"),
-        "genome_key": source_records[0].get("genome_key"),
+    crn = None
+    crn_sums = raw_stats.get("crn_sums")
+    if isinstance(crn_sums, dict):
+        crn = _crn_summary_from_sums(str(runtime.get("crn_reference_policy") or ""), crn_sums)
+
+    opponents = raw_stats.get("opponents")
+    opponent_breakdown = None
+    if isinstance(opponents, dict):
+        opponent_breakdown = {str(policy): _breakdown(block) for policy, block in sorted(opponents.items())}
+
+    return {
         "games": int(total_games),
-        "requested_games": int(requested_games),
         "wins": int(wins),
         "losses": int(losses),
         "draws": int(draws),
         "win_rate": win_rate,
+        "win_rate_ci_low": win_rate_ci[0],
+        "win_rate_ci_high": win_rate_ci[1],
         "loss_rate": loss_rate,
         "draw_rate": draw_rate,
         "mean_gold_delta": mean_gold_delta,
+        "gold_delta_sum_sq": gold_delta_sum_sq,
         "go_opportunity_count": int(go_opportunity_count),
         "go_opportunity_games": int(go_opportunity_games),
         "go_opportunity_rate": _rate(go_opportunity_games, total_games),
@@ -1907,7 +3929,7 @@ def _build_pooled_best_record(records: list[dict], runtime: dict) -> Optional[di
         "go_fail_count": int(go_fail_count),
         "go_fail_rate": _rate(go_fail_count, go_games),
         "go_games": int(go_games),
-        "go_rate": _rate(go_count, total_games),
+        "go_rate": _rate(go_games, total_games),
         "go_take_rate": _rate(go_count, go_opportunity_count),
         "bankrupt": {
             "my_bankrupt_count": int(my_bankrupt_count),
@@ -1916,26 +3938,8 @@ def _build_pooled_best_record(records: list[dict], runtime: dict) -> Optional[di
         "my_bankrupt_rate": _rate(my_bankrupt_count, total_games),
         "inflicted_bankrupt_rate": _rate(inflicted_bankrupt_count, total_games),
         "seat_breakdown": {
-            "first": {
-                "games": int(first_games),
-                "wins": int(first_wins),
-                "losses": int(first_losses),
-                "draws": int(first_draws),
-                "win_rate": first_win_rate,
-                "loss_rate": first_loss_rate,
-                "draw_rate": first_draw_rate,
-                "mean_gold_delta": first_mean_gold_delta,
-            },
-            "second": {
-                "games": int(second_games),
-                "wins": int(second_wins),
-                "losses": int(second_losses),
-                "draws": int(second_draws),
-                "win_rate": second_win_rate,
-                "loss_rate": second_loss_rate,
-                "draw_rate": second_draw_rate,
-                "mean_gold_delta": second_mean_gold_delta,
-            },
+            "first": first,
+            "second": second,
             "weighted": {
                 "win_rate": weighted_win_rate,
                 "loss_rate": weighted_loss_rate,
@@ -1945,27 +3949,31 @@ def _build_pooled_best_record(records: list[dict], runtime: dict) -> Optional[di
                 "gold_weights": {"first": 0.48, "second": 0.52},
             },
         },
+        "opponent_breakdown": opponent_breakdown,
+        "opponent_policy_counts": copy.deepcopy(raw_stats.get("opponent_policy_counts")),
+        "first_turn_counts": copy.deepcopy(raw_stats.get("first_turn_counts")),
         "fitness_gold_scale": fitness_gold_scale,
         "fitness_gold_neutral_delta": fitness_gold_neutral_delta,
         "fitness_win_neutral_rate": fitness_win_neutral_rate,
         "fitness_win_weight": fitness_win_weight_raw,
         "fitness_gold_weight": fitness_gold_weight_raw,
-        "imitation_play_total": int(imitation_play_total),
-        "imitation_play_matches": int(imitation_play_matches),
-        "imitation_play_ratio": imitation_play_ratio,
-        "imitation_match_total": int(imitation_match_total),
-        "imitation_match_matches": int(imitation_match_matches),
-        "imitation_match_ratio": imitation_match_ratio,
-        "imitation_go_stop_total": int(imitation_option_total),
-        "imitation_go_stop_matches": int(imitation_option_matches),
-        "imitation_go_stop_ratio": imitation_option_ratio,
-        "imitation_option_total": int(imitation_option_total),
-        "imitation_option_matches": int(imitation_option_matches),
-        "imitation_option_ratio": imitation_option_ratio,
-        "imitation_weight_play": imitation_weight_play,
-        "imitation_weight_match": imitation_weight_match,
-        "imitation_weight_option": imitation_weight_option,
+        "imitation_play_total": int(_safe_float(imitation_totals.get("play"), 0.0)),
+        "imitation_play_matches": int(_safe_float(imitation_matches.get("play"), 0.0)),
+        "imitation_play_ratio": imitation_ratios["play"],
+        "imitation_match_total": int(_safe_float(imitation_totals.get("match"), 0.0)),
+        "imitation_match_matches": int(_safe_float(imitation_matches.get("match"), 0.0)),
+        "imitation_match_ratio": imitation_ratios["match"],
+        "imitation_go_stop_total": int(_safe_float(imitation_totals.get("option"), 0.0)),
+        "imitation_go_stop_matches": int(_safe_float(imitation_matches.get("option"), 0.0)),
+        "imitation_go_stop_ratio": imitation_ratios["option"],
+        "imitation_option_total": int(_safe_float(imitation_totals.get("option"), 0.0)),
+        "imitation_option_matches": int(_safe_float(imitation_matches.get("option"), 0.0)),
+        "imitation_option_ratio": imitation_ratios["option"],
+        "imitation_weight_play": _safe_float(imitation_weights.get("play"), 0.5),
+        "imitation_weight_match": _safe_float(imitation_weights.get("match"), 0.3),
+        "imitation_weight_option": _safe_float(imitation_weights.get("option"), 0.2),
         "imitation_weighted_score": imitation_weighted_score,
+        "sim_imitation_weighted_score": imitation_weighted_score,
         "fitness_components": {
             "gold_norm": gold_norm,
             "weighted_gold_delta": weighted_mean_gold_delta,
@@ -1993,23 +4001,335 @@ def _build_pooled_best_record(records: list[dict], runtime: dict) -> Optional[di
             },
         },
         "fitness": fitness,
-        "seed_used": "pooled:" + ",".join(
-            str(item.get("seed_used") or "").strip()
-            for item in source_records
-            if str(item.get("seed_used") or "").strip()
-        ),
-        "record_mode": "pooled_training_playoff",
-        "record_sources": [
-            {
-                "games": int(_safe_float(item.get("games"), 0.0)),
-                "seed_used": item.get("seed_used"),
-            }
-            for item in source_records
-        ],
+        "crn": crn,
+        "raw_stats": raw_stats,
+        "record_mode": str(record_mode),
     }
+
+
+_EVAL_DECISION_TYPES = ("play", "match", "option")
+
+
+def _sum_eval_throughput(blocks, elapsed_ms: Optional[float] = None) -> Optional[dict]:
+    """Add eval worker throughput blocks and recompute the per-second rates over elapsed_ms.
+
+    elapsed_ms defaults to the summed game_loop_ms (worker busy time); pass a wall time to get
+    rates over that window instead.
+    """
+    blocks = [block for block in blocks if isinstance(block, dict)]
+    if not blocks:
+        return None
+    decisions = {
+        kind: sum(int(_safe_float((block.get("decisions") or {}).get(kind), 0.0)) for block in blocks)
+        for kind in _EVAL_DECISION_TYPES
+    }
+    out = {
+        "games": sum(int(_safe_float(block.get("games"), 0.0)) for block in blocks),
+        "engine_steps": sum(int(_safe_float(block.get("engine_steps"), 0.0)) for block in blocks),
+        "decisions": decisions,
+        "forward_passes": sum(int(_safe_float(block.get("forward_passes"), 0.0)) for block in blocks),
+        "game_loop_ms": sum(max(0.0, _safe_float(block.get("game_loop_ms"), 0.0)) for block in blocks),
+    }
+    window_ms = out["game_loop_ms"] if elapsed_ms is None else max(0.0, float(elapsed_ms))
+
+    def _per_sec(count: float) -> float:
+        return float(count) * 1000.0 / window_ms if window_ms > 0.0 else 0.0
+
+    out.update(
+        {
+            "elapsed_ms": window_ms,
+            "games_per_sec": _per_sec(out["games"]),
+            "steps_per_sec": _per_sec(out["engine_steps"]),
+            "decisions_per_sec": _per_sec(sum(decisions.values())),
+            "forward_passes_per_sec": _per_sec(out["forward_passes"]),
+        }
+    )
+    return out
+
+
+# Worker summary keys that are the same for every game of a run; merged records copy the first source's.
+_EVAL_RECORD_RUN_KEYS = (
+    "control_actor",
+    "opponent_actor",
+    "opponent_policy",
+    "opponent_policy_mix",
+    "opponent_genome",
+    "opponent_eval_tuning",
+    "control_policy_mode",
+    "native_inference_backend",
+    "first_turn_policy",
+    "fixed_first_turn",
+    "continuous_series",
+    "imitation_source",
+    "win_rate_ci_z",
+    "early_stop_win_rate_cutoffs",
+    "early_stop_go_take_rate_cutoffs",
+    "early_stop_sprt",
+)
+
+# Worker summary keys that raw_stats cannot rebuild (quantiles, per-process counters, the state of
+# one source's early stop); merged records set them to None.
+_EVAL_RECORD_UNMERGEABLE_KEYS = (
+    "p10_gold_delta",
+    "p50_gold_delta",
+    "p90_gold_delta",
+    "sprt_llr",
+    "early_stop_cutoff_games",
+    "early_stop_cutoff_max_win_rate",
+    "early_stop_observed_win_rate",
+    "early_stop_cutoff_min_go_opportunity_count",
+    "early_stop_cutoff_min_go_take_rate",
+    "early_stop_cutoff_max_go_take_rate",
+    "early_stop_observed_go_take_rate",
+    "early_stop_observed_go_opportunity_count",
+    "native_inference_stats",
+    "native_inference_bridge_stats",
+    "session_rounds",
+    "timing_breakdown",
+)
+
+
+def _merge_eval_records(records: list[dict], runtime: dict, record_mode: str) -> Optional[dict]:
+    """Pool eval summaries of one genome (disjoint game sets) and recompute fitness from the totals.
+
+    The result has the worker summary's keys: sums and rates come from the pooled raw_stats, run
+    constants from the first source, and _EVAL_RECORD_UNMERGEABLE_KEYS are None.
+    """
+    source_records = [dict(item or {}) for item in records if isinstance(item, dict)]
+    source_records = [item for item in source_records if _safe_float(item.get("games"), 0.0) > 0.0]
+    if not source_records:
+        return None
+
+    raw_stats = _merge_eval_raw_stats([_eval_raw_stats_from_record(item) for item in source_records])
+    pooled_record = _finalize_eval_stats(raw_stats, runtime, record_mode)
+    if pooled_record is None:
+        return None
+    crn_sources = [item.get("crn") for item in source_records]
+    if pooled_record["crn"] is not None and isinstance(crn_sources[0], dict):
+        pooled_record["crn"]["reference_policy"] = crn_sources[0].get("reference_policy")
+    pooled_record.update({key: copy.deepcopy(source_records[0].get(key)) for key in _EVAL_RECORD_RUN_KEYS})
+    pooled_record.update({key: None for key in _EVAL_RECORD_UNMERGEABLE_KEYS})
+    early_stopped = [item for item in source_records if bool(item.get("early_stop_triggered"))]
+    pooled_record.update(
+        {
+            "early_stop_triggered": bool(early_stopped),
+            "early_stop_reason": (early_stopped[0].get("early_stop_reason") if early_stopped else None),
+            "game_offset": min(max(0, int(_safe_float(item.get("game_offset"), 0.0))) for item in source_records),
+            "schedule_games": max(
+                max(0, int(_safe_float(item.get("schedule_games"), item.get("games")))) for item in source_records
+            ),
+            "generation": source_records[0].get("generation"),
+            "genome_key": source_records[0].get("genome_key"),
+            "requested_games": sum(
+                max(0, int(_safe_float(item.get("requested_games"), item.get("games")))) for item in source_records
+            ),
+            "seed_used": "pooled:" + ",".join(
+                str(item.get("seed_used") or "").strip()
+                for item in source_records
+                if str(item.get("seed_used") or "").strip()
+            ),
+            "eval_time_ms": sum(max(0.0, _safe_float(item.get("eval_time_ms"), 0.0)) for item in source_records),
+            "throughput": _sum_eval_throughput([item.get("throughput") for item in source_records]),
+            "record_sources": [
+                {
+                    "games": int(_safe_float(item.get("games"), 0.0)),
+                    "seed_used": item.get("seed_used"),
+                }
+                for item in source_records
+            ],
+        }
+    )
     return pooled_record
 
 
+def _breed_steady_state_child(population):
+    """Replace the worst evaluated genome with one offspring bred inside a fitness-weighted species.
+
+    Mirrors DefaultReproduction's per-species step (survival_threshold parents, crossover,
+    mutate, ancestors) for a single child. Each species' best member is never replaced.
+    Returns (genome_key, genome) or None while too few genomes have a fitness.
+    """
+    config = population.config
+    reproduction = population.reproduction
+    repro_cfg = reproduction.reproduction_config
+    members_by_species = []
+    for species in population.species.species.values():
+        members = [
+            (int(key), genome)
+            for key, genome in species.members.items()
+            if key in population.population and genome.fitness is not None
+        ]
+        if members:
+            members.sort(reverse=True, key=lambda item: (item[1].fitness, item[0]))
+            members_by_species.append(members)
+    if not members_by_species:
+        return None
+
+    if len(population.population) >= int(config.pop_size):
+        protected = {members[0][0] for members in members_by_species}
+        removable = [
+            (genome.fitness, int(key))
+            for key, genome in population.population.items()
+            if genome.fitness is not None and int(key) not in protected
+        ]
+        if not removable:
+            return None
+        _, worst_key = min(removable)
+        del population.population[worst_key]
+        members_by_species = [
+            [item for item in members if item[0] != worst_key] for members in members_by_species
+        ]
+
+    mean_fitness = [sum(g.fitness for _, g in members) / len(members) for members in members_by_species]
+    floor = min(mean_fitness)
+    weights = [(value - floor) + 1e-6 for value in mean_fitness]
+    members = random.choices(members_by_species, weights=weights, k=1)[0]
+    cutoff = max(2, int(math.ceil(float(repro_cfg.survival_threshold) * len(members))))
+    parents = members[:cutoff]
+    parent1_id, parent1 = random.choice(parents)
+    parent2_id, parent2 = random.choice(parents)
+
+    gid = next(reproduction.genome_indexer)
+    child = config.genome_type(gid)
+    child.configure_crossover(parent1, parent2, config.genome_config)
+    child.mutate(config.genome_config)
+    population.population[gid] = child
+    reproduction.ancestors[gid] = (parent1_id, parent2_id)
+    return gid, child
+
+
+def _remove_stagnant_species(population) -> None:
+    """Steady-state counterpart of DefaultReproduction's stagnation step, once per generation-equivalent.
+
+    Species fitness counts evaluated members only. A stagnant species loses its evaluated members
+    (breeding refills the slots from the other species); members still in flight are re-speciated
+    at the next generation-equivalent. species_elitism is honored by DefaultStagnation.update.
+    """
+    species_set = population.species
+    # DefaultStagnation.update reads every member's fitness, so hide genomes still in flight.
+    full_members = {}
+    unevaluated_species = {}
+    for sid, species in list(species_set.species.items()):
+        evaluated = {key: genome for key, genome in species.members.items() if genome.fitness is not None}
+        if not evaluated:
+            unevaluated_species[sid] = species_set.species.pop(sid)
+        elif len(evaluated) != len(species.members):
+            full_members[sid] = species.members
+            species.members = evaluated
+    try:
+        updates = population.reproduction.stagnation.update(species_set, population.generation)
+    finally:
+        for sid, members in full_members.items():
+            species_set.species[sid].members = members
+        species_set.species.update(unevaluated_species)
+
+    for sid, species, stagnant in updates:
+        if not stagnant:
+            continue
+        population.reporters.species_stagnant(sid, species)
+        for key, genome in species.members.items():
+            species_set.genome_to_species.pop(key, None)
+            if genome.fitness is not None:
+                population.population.pop(key, None)
+        del species_set.species[sid]
+
+
+def _run_steady_state(population, evaluator: LoggedParallelEvaluator, generation_count: int):
+    """Steady-state NEAT: keep eval_workers genomes in flight and breed a child whenever a slot frees.
+
+    Every pop_size completed evaluations form one generation-equivalent: it is recorded through
+    evaluator.record_generation, re-speciated, and reported with the same start/post_evaluate/
+    end_generation hooks as Population.run, so gate state, checkpoints and lineage keep counting
+    in generations. Genomes without a fitness in a checkpoint are simply dispatched first on resume.
+    Stagnant species are dropped at each generation-equivalent (_remove_stagnant_species), and
+    complete extinction follows reset_on_extinction like Population.run.
+    """
+    config = population.config
+    pop_size = int(config.pop_size)
+    slots = int(evaluator.num_workers)
+    config.genome_config.innovation_tracker = population.reproduction.innovation_tracker
+    pending = collections.deque(
+        (int(key), genome) for key, genome in population.population.items() if genome.fitness is None
+    )
+    in_flight = {}
+    window_entries = []
+    window_results = []
+    completed_generations = 0
+
+    population.reporters.start_generation(population.generation)
+    ctx = evaluator.begin_generation()
+    try:
+        while completed_generations < int(generation_count):
+            while len(in_flight) < slots:
+                if not pending:
+                    with _PHASE_TIMER.measure("reproduction"):
+                        child = _breed_steady_state_child(population)
+                    if child is None:
+                        break
+                    pending.append(child)
+                genome_key, genome = pending.popleft()
+                future, cache_key = evaluator.submit_genome(ctx, genome_key, genome, config)
+                in_flight[future] = (genome_key, genome, ctx["seed"], cache_key)
+            if not in_flight:
+                raise RuntimeError("steady_state loop has nothing to evaluate (empty population)")
+
+            done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                genome_key, genome, seed_text, cache_key = in_flight.pop(future)
+                result = evaluator.collect_genome(future, genome_key, genome, seed_text, cache_key)
+                # Fitness is needed right away so the genome can be a parent or be replaced.
+                genome.fitness = _safe_float(result.get("fitness"), -1e9)
+                window_entries.append((genome_key, genome))
+                window_results.append(result)
+                if len(window_entries) < pop_size:
+                    continue
+
+                evaluator.record_generation(ctx, window_entries, window_results)
+                window_entries = []
+                window_results = []
+                population.reproduction.innovation_tracker.reset_generation()
+                with _PHASE_TIMER.measure("speciation"):
+                    population.species.speciate(config, population.population, population.generation)
+                evaluated = {
+                    key: genome for key, genome in population.population.items() if genome.fitness is not None
+                }
+                best = max(evaluated.values(), key=lambda g: g.fitness)
+                population.reporters.post_evaluate(config, evaluated, population.species, best)
+                if population.best_genome is None or best.fitness > population.best_genome.fitness:
+                    population.best_genome = best
+                with _PHASE_TIMER.measure("reproduction"):
+                    _remove_stagnant_species(population)
+                if not population.species.species:
+                    population.reporters.complete_extinction()
+                    if not config.reset_on_extinction:
+                        raise neat.CompleteExtinctionException()
+                    population.population = population.reproduction.create_new(
+                        config.genome_type, config.genome_config, pop_size
+                    )
+                    pending = collections.deque(population.population.items())
+                    with _PHASE_TIMER.measure("speciation"):
+                        population.species.speciate(config, population.population, population.generation)
+                population.reporters.end_generation(config, population.population, population.species)
+                population.generation += 1
+                completed_generations += 1
+                if completed_generations >= int(generation_count):
+                    break
+                if not config.no_fitness_termination:
+                    fv = population.fitness_criterion(g.fitness for g in evaluated.values())
+                    if fv >= config.fitness_threshold:
+                        population.reporters.found_solution(config, population.generation, best)
+                        return population.best_genome
+                population.reporters.start_generation(population.generation)
+                ctx = evaluator.begin_generation()
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+    if config.no_fitness_termination:
+        population.reporters.found_solution(config, population.generation, population.best_genome)
+    return population.best_genome
+
+
 def _population_candidate_snapshots(population, limit: int = 5) -> list[dict]:
     if population is None or not hasattr(population, "population"):
         return []
@@ -2037,34 +4357,205 @@ def _population_candidate_snapshots(population, limit: int = 5) -> list[dict]:
     return entries[: max(1, int(limit))]
 
 
-def _run_winner_playoff(candidate_entries, config, runtime: dict) -> Optional[dict]:
+def _resolve_playoff_shard_games(runtime: dict, playoff_games: int) -> int:
+    """winner_playoff_shard_games, or one shard per candidate (no sharding) when it is 0."""
+    shard_games = int(runtime.get("winner_playoff_shard_games", 0) or 0)
+    if shard_games <= 0:
+        return int(playoff_games)
+    return max(1, min(int(playoff_games), shard_games))
+
+
+def _merge_playoff_shards(shard_records: list, runtime: dict, playoff_seed: str) -> dict:
+    """Fold one candidate's shard results into a single playoff record (any failed shard fails it)."""
+    if any(not bool(record.get("eval_ok")) for record in shard_records):
+        return {"fitness": -1e9, "seed_used": playoff_seed, "eval_ok": False, "playoff_shards": len(shard_records)}
+    if len(shard_records) == 1:
+        record = dict(shard_records[0])
+    else:
+        record = _merge_eval_records(shard_records, runtime, "winner_playoff_shards")
+        if record is None:
+            return {"fitness": -1e9, "seed_used": playoff_seed, "eval_ok": False, "playoff_shards": len(shard_records)}
+        record["eval_ok"] = True
+    record["seed_used"] = playoff_seed
+    record["playoff_shards"] = len(shard_records)
+    return record
+
+
+def _run_playoff_shards(candidates, config, runtime: dict, executor, playoff_seed: str, game_start: int, game_end: int, schedule_games: int) -> list:
+    """Play games [game_start, game_end) of the playoff schedule for every candidate, sharded.
+
+    Returns one list of shard records (in game order) per candidate.
+    """
+    span = int(game_end) - int(game_start)
+    shard_games = _resolve_playoff_shard_games(runtime, span)
+    jobs = {}
+    shard_records = [dict() for _ in candidates]
+    try:
+        for candidate_index, entry in enumerate(candidates):
+            training_record = dict(entry.get("record") or {})
+            for game_offset in range(int(game_start), int(game_end), shard_games):
+                future = executor.submit(
+                    _run_eval_worker_for_genomes,
+                    [(int(training_record.get("genome_key", -1)), entry.get("genome"))],
+                    config,
+                    runtime,
+                    playoff_seed,
+                    int(training_record.get("generation", -1)),
+                    games_override=min(shard_games, int(game_end) - game_offset),
+                    early_stop_win_rate_cutoffs_override=[],
+                    early_stop_go_take_rate_cutoffs_override=[],
+                    context_label="winner_playoff",
+                    game_offset=game_offset,
+                    schedule_games=int(schedule_games),
+                )
+                jobs[future] = (candidate_index, game_offset)
+        for future in concurrent.futures.as_completed(jobs):
+            candidate_index, game_offset = jobs[future]
+            try:
+                shard_records[candidate_index][game_offset] = future.result()[0]
+            except Exception as exc:
+                shard_records[candidate_index][game_offset] = {
+                    "fitness": -1e9,
+                    "worker_exception": repr(exc),
+                    "seed_used": playoff_seed,
+                    "eval_ok": False,
+                }
+    except BaseException:
+        for future in jobs:
+            future.cancel()
+        _close_eval_servers(kill=True)
+        raise
+    return [[shards[offset] for offset in sorted(shards)] for shards in shard_records]
+
+
+def _playoff_clearly_behind(record: dict, leader: dict, runtime: dict) -> bool:
+    """True when record cannot catch the leader within the playoff tie thresholds.
+
+    Either its optimistic win_rate bound is more than the win tie threshold below the
+    leader's pessimistic bound, or win_rate cannot beat the leader beyond the tie band and
+    its optimistic mean_gold_delta bound trails the leader's pessimistic bound by more than
+    the gold tie threshold.
+    """
+    if not bool(record.get("eval_ok")):
+        return True
+    z = float(runtime["winner_playoff_racing"]["z"])
+    win_tie = max(0.0, _safe_float(runtime.get("winner_playoff_win_rate_tie_threshold"), 0.01))
+    gold_tie = max(0.0, _safe_float(runtime.get("winner_playoff_mean_gold_delta_tie_threshold"), 100.0))
+    games = int(_safe_float(record.get("games"), 0.0))
+    leader_games = int(_safe_float(leader.get("games"), 0.0))
+    _, win_high = _wilson_interval(_safe_float(record.get("wins"), 0.0), games, z)
+    leader_win_low, _ = _wilson_interval(_safe_float(leader.get("wins"), 0.0), leader_games, z)
+    if win_high + win_tie < leader_win_low:
+        return True
+    if win_high > _safe_float(leader.get("win_rate"), 0.0) + win_tie:
+        return False
+    gold = _gold_delta_interval(record, z)
+    leader_gold = _gold_delta_interval(leader, z)
+    if gold is None or leader_gold is None:
+        return False
+    return gold[1] + gold_tie < leader_gold[0]
+
+
+def _run_winner_playoff(candidate_entries, config, runtime: dict, executor=None) -> Optional[dict]:
+    """Replay the top-K candidates on one fresh seed and rank them.
+
+    Each candidate's winner_playoff_games schedule is cut into --game-offset shards and every
+    shard of every candidate goes through the eval threads at once (the training evaluator's
+    executor when given, else a temporary one); shards are merged per candidate afterwards.
+    With winner_playoff_mode=racing the schedule is played in rounds and candidates that are
+    clearly behind the current leader (_playoff_clearly_behind) drop out after each round.
+    """
     if not candidate_entries:
         return None
 
     playoff_topk = max(1, int(runtime.get("winner_playoff_topk", 5)))
     playoff_games = max(1, int(runtime.get("winner_playoff_games", runtime["games_per_genome"])))
+    playoff_mode = str(runtime.get("winner_playoff_mode") or "full")
     seed_base = str(runtime.get("seed") or "winner_playoff")
 
     playoff_seed = f"{seed_base}|winner_playoff"
-    playoff_candidates = list(candidate_entries[:playoff_topk])
+    playoff_candidates = [
+        entry for entry in candidate_entries[:playoff_topk] if entry.get("genome") is not None
+    ]
+    if not playoff_candidates:
+        return None
+    if playoff_mode == "racing":
+        round_games = max(1, int(runtime["winner_playoff_racing"]["round_games"]))
+    else:
+        round_games = playoff_games
+
+    owned_executor = None
+    if executor is None:
+        owned_executor = executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, int(runtime["eval_workers"])),
+            thread_name_prefix="neat-playoff",
+        )
+    shards_by_candidate = [[] for _ in playoff_candidates]
+    records = [None for _ in playoff_candidates]
+    eliminated_round = [None for _ in playoff_candidates]
+    alive = list(range(len(playoff_candidates)))
+    race_rounds = []
+    played = 0
+    try:
+        while alive and played < playoff_games:
+            round_end = min(playoff_games, played + round_games)
+            round_shards = _run_playoff_shards(
+                [playoff_candidates[idx] for idx in alive],
+                config,
+                runtime,
+                executor,
+                playoff_seed,
+                played,
+                round_end,
+                playoff_games,
+            )
+            for idx, shards in zip(alive, round_shards):
+                shards_by_candidate[idx].extend(shards)
+                records[idx] = _merge_playoff_shards(shards_by_candidate[idx], runtime, playoff_seed)
+            played = round_end
+            if playoff_mode != "racing":
+                continue
+            leader_idx = max(
+                alive,
+                key=functools.cmp_to_key(
+                    lambda a, b: _playoff_record_compare(records[a], records[b], runtime)
+                ),
+            )
+            dropped = [
+                idx
+                for idx in alive
+                if idx != leader_idx and _playoff_clearly_behind(records[idx], records[leader_idx], runtime)
+            ]
+            for idx in dropped:
+                eliminated_round[idx] = len(race_rounds)
+            race_rounds.append(
+                {
+                    "round": len(race_rounds),
+                    "game_end": int(played),
+                    "leader_genome_key": int(
+                        (playoff_candidates[leader_idx].get("record") or {}).get("genome_key", -1)
+                    ),
+                    "alive_genome_keys": [
+                        int((playoff_candidates[idx].get("record") or {}).get("genome_key", -1)) for idx in alive
+                    ],
+                    "eliminated_genome_keys": [
+                        int((playoff_candidates[idx].get("record") or {}).get("genome_key", -1)) for idx in dropped
+                    ],
+                }
+            )
+            alive = [idx for idx in alive if idx not in dropped]
+            if len(alive) <= 1:
+                break
+    finally:
+        if owned_executor is not None:
+            owned_executor.shutdown(wait=True, cancel_futures=True)
+
     playoff_results = []
-    for entry in playoff_candidates:
+    for idx, entry in enumerate(playoff_candidates):
         training_record = dict(entry.get("record") or {})
         genome = entry.get("genome")
-        if genome is None:
-            continue
-        playoff_record = _run_eval_worker_for_genome(
-            genome=genome,
-            config=config,
-            runtime=runtime,
-            seed_text=playoff_seed,
-            generation=int(training_record.get("generation", -1)),
-            genome_key=int(training_record.get("genome_key", -1)),
-            games_override=playoff_games,
-            early_stop_win_rate_cutoffs_override=[],
-            early_stop_go_take_rate_cutoffs_override=[],
-            context_label="winner_playoff",
-        )
+        playoff_record = dict(records[idx] or {"fitness": -1e9, "seed_used": playoff_seed, "eval_ok": False})
+        playoff_record["playoff_eliminated_round"] = eliminated_round[idx]
         playoff_record["generation"] = int(training_record.get("generation", -1))
         playoff_record["genome_key"] = int(training_record.get("genome_key", -1))
         playoff_record["num_nodes"] = int(training_record.get("num_nodes", 0))
@@ -2078,19 +4569,27 @@ def _run_winner_playoff(candidate_entries, config, runtime: dict) -> Optional[di
             }
         )
 
-    if not playoff_results:
-        return None
+    # Candidates still in the race rank first; eliminated ones by how long they lasted.
+    def _race_rank(entry) -> int:
+        eliminated = entry["playoff_record"].get("playoff_eliminated_round")
+        return len(race_rounds) + 1 if eliminated is None else int(eliminated)
 
     playoff_results.sort(
         key=functools.cmp_to_key(
-            lambda a, b: -_playoff_record_compare(
-                a.get("playoff_record") or {},
-                b.get("playoff_record") or {},
-                runtime,
+            lambda a, b: (
+                -_compare_desc(_race_rank(a), _race_rank(b))
+                or -_playoff_record_compare(
+                    a.get("playoff_record") or {},
+                    b.get("playoff_record") or {},
+                    runtime,
+                )
             )
         )
     )
     winner_entry = playoff_results[0]
+    consumed_games = sum(
+        int(_safe_float((entry.get("playoff_record") or {}).get("games"), 0.0)) for entry in playoff_results
+    )
     return {
         "winner_genome": copy.deepcopy(winner_entry.get("genome")),
         "winner_record": dict(winner_entry.get("playoff_record") or {}),
@@ -2112,6 +4611,12 @@ def _run_winner_playoff(candidate_entries, config, runtime: dict) -> Optional[di
             "playoff": {
                 "topk": int(playoff_topk),
                 "games": int(playoff_games),
+                "playoff_mode": playoff_mode,
+                "shard_games": int(_resolve_playoff_shard_games(runtime, min(round_games, playoff_games))),
+                "racing": (dict(runtime["winner_playoff_racing"]) if playoff_mode == "racing" else None),
+                "race_rounds": race_rounds,
+                "consumed_games": int(consumed_games),
+                "full_games": int(playoff_games * len(playoff_candidates)),
                 "seed": playoff_seed,
                 "results": [
                     _serialize_playoff_entry(entry.get("training_record") or {}, entry.get("playoff_record") or {})
@@ -2138,11 +4643,18 @@ def parse_args() -> argparse.Namespace:
         help="Path to runtime JSON (workers/games/checkpoint interval)",
     )
     parser.add_argument("--output-dir", default="logs/NEAT/neat_python", help="Output directory")
-    parser.add_argument("--resume", default="", help="Checkpoint file path to resume")
+    parser.add_argument(
+        "--resume",
+        default="",
+        help="Checkpoint file path to resume, or a checkpoint directory (newest indexed checkpoint)",
+    )
     parser.add_argument(
         "--seed-genome",
         default="",
-        help="Path to winner_genome.pkl used to reseed a fresh population for the next phase",
+        help=(
+            "Path to winner_genome.pkl used to reseed a fresh population for the next phase; "
+            "an indexed checkpoint file seeds from its best-so-far genome"
+        ),
     )
     parser.add_argument(
         "--seed-genome-count",
@@ -2173,6 +4685,11 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--generations", type=int, default=0, help="Override generations")
     parser.add_argument("--workers", type=int, default=0, help="Override worker count")
+    parser.add_argument(
+        "--broker",
+        default="",
+        help="host:port to listen on for neat_eval_broker_client.mjs (sets eval_backend=broker)",
+    )
     parser.add_argument("--games-per-genome", type=int, default=0, help="Override games per genome")
     parser.add_argument("--eval-timeout-sec", type=int, default=0, help="Override evaluation timeout seconds")
     parser.add_argument("--max-eval-steps", type=int, default=0, help="Override max game steps per evaluation")
@@ -2238,6 +4755,35 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Force fixed seats (control actor always human side)",
     )
+    parser.add_argument(
+        "--eval-genome",
+        default="",
+        help="Evaluate one exported genome JSON (sharded over eval_workers), print the record and exit",
+    )
+    parser.add_argument(
+        "--eval-games",
+        type=int,
+        default=0,
+        help="Games for --eval-genome (default: games_per_genome)",
+    )
+    parser.add_argument(
+        "--lineage-query",
+        default="",
+        help=(
+            "Query <output-dir>/lineage_index.sqlite and exit: ancestry:<genome_key>, "
+            "descendants:<bootstrap_source>, species_fitness[:<species_id>], rebuild"
+        ),
+    )
+    parser.add_argument(
+        "--metrics-columnar-backfill",
+        action="store_true",
+        help="Build <output-dir>/metrics_columns from existing eval/generation metrics ndjson and exit",
+    )
+    parser.add_argument(
+        "--compact-checkpoints",
+        default="",
+        help="Prune a checkpoint directory with the runtime checkpoint_keep_* policy and exit",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -2251,6 +4797,138 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _run_eval_genome_only(args: argparse.Namespace, runtime: dict) -> None:
+    """--eval-genome: one sharded evaluation of an exported genome; the record is the last stdout line."""
+    genome_path = os.path.abspath(str(args.eval_genome).strip())
+    if not os.path.exists(genome_path):
+        raise RuntimeError(f"eval genome not found: {genome_path}")
+    with open(genome_path, "r", encoding="utf-8-sig") as f:
+        genome_payload = json.load(f)
+    if not isinstance(genome_payload, dict):
+        raise RuntimeError(f"eval genome must be a JSON object: {genome_path}")
+    _set_eval_env(runtime, args.output_dir)
+    runtime["output_dir"] = os.path.abspath(args.output_dir)
+    games = int(args.eval_games) if int(args.eval_games) > 0 else int(runtime["games_per_genome"])
+    try:
+        record = _run_eval_worker_for_genome(
+            genome_payload,
+            None,
+            runtime,
+            str(runtime["seed"]),
+            games_override=games,
+            early_stop_win_rate_cutoffs_override=[],
+            early_stop_go_take_rate_cutoffs_override=[],
+            context_label="eval_genome",
+        )
+    finally:
+        _close_eval_servers()
+        _close_eval_broker()
+    if not bool(record.get("eval_ok")):
+        raise RuntimeError(f"eval failed for {genome_path}; see {_eval_failure_log_path(runtime['output_dir'])}")
+    record["genome_path"] = genome_path
+    print(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+
+
+def _run_lineage_query_only(args: argparse.Namespace) -> None:
+    """--lineage-query: answer one lineage question from the run's SQLite index as JSON.
+
+    A run without the index (older runs, lineage_index = false) gets it built from lineage.ndjson
+    first; "rebuild" forces that.
+    """
+    output_dir = os.path.abspath(args.output_dir)
+    index_path = os.path.join(output_dir, _LINEAGE_INDEX_FILENAME)
+    kind, _, arg = str(args.lineage_query).strip().partition(":")
+    if kind not in ("ancestry", "descendants", "species_fitness", "rebuild"):
+        raise RuntimeError(f"unknown --lineage-query: {args.lineage_query}")
+    if kind == "rebuild" or not os.path.exists(index_path):
+        if os.path.exists(index_path):
+            os.remove(index_path)
+        lineage_log_path = os.path.join(output_dir, "lineage.ndjson")
+        if not os.path.exists(lineage_log_path) and os.path.exists(f"{lineage_log_path}.gz"):
+            lineage_log_path = f"{lineage_log_path}.gz"
+        count = _build_lineage_index_from_log(lineage_log_path, index_path)
+        print(f"lineage index built from {count} records: {index_path}", file=sys.stderr)
+        if kind == "rebuild":
+            return
+    started = time.perf_counter()
+    with contextlib.closing(_open_lineage_index(index_path)) as conn:
+        if kind == "ancestry":
+            if not arg.strip():
+                raise RuntimeError("--lineage-query ancestry needs a genome key (ancestry:<genome_key>)")
+            rows = _lineage_index_ancestry(conn, int(arg))
+        elif kind == "descendants":
+            if not arg.strip():
+                raise RuntimeError("--lineage-query descendants needs a source (descendants:<bootstrap_source>)")
+            rows = _lineage_index_descendants(conn, arg.strip())
+        else:
+            rows = _lineage_index_species_fitness(conn, int(arg) if arg.strip() else None)
+    print(
+        json.dumps(
+            {
+                "query": str(args.lineage_query),
+                "index_path": index_path,
+                "elapsed_ms": (time.perf_counter() - started) * 1000.0,
+                "count": len(rows),
+                "rows": rows,
+            },
+            ensure_ascii=False,
+        )
+    )
+
+
+def _run_metrics_columnar_backfill_only(args: argparse.Namespace) -> None:
+    """--metrics-columnar-backfill: columnar copies of a finished run's eval/generation metrics."""
+    output_dir = os.path.abspath(args.output_dir)
+    built = {}
+    for table in ("eval_metrics", "generation_metrics"):
+        log_path = os.path.join(output_dir, f"{table}.ndjson")
+        if not os.path.exists(log_path) and os.path.exists(f"{log_path}.gz"):
+            log_path = f"{log_path}.gz"
+        if not os.path.exists(log_path):
+            raise RuntimeError(f"metrics log not found: {log_path}")
+        built[table] = _build_columnar_metrics_from_log(log_path, os.path.join(output_dir, _COLUMNAR_DIRNAME, table))
+    print(json.dumps({"metrics_columns_dir": os.path.join(output_dir, _COLUMNAR_DIRNAME), "rows": built}))
+
+
+def _run_compact_checkpoints_only(args: argparse.Namespace, runtime: dict) -> None:
+    """--compact-checkpoints: apply the checkpoint_keep_* policy to an existing checkpoint directory."""
+    checkpoint_dir = os.path.abspath(str(args.compact_checkpoints).strip())
+    if not os.path.isdir(checkpoint_dir):
+        raise RuntimeError(f"checkpoint directory not found: {checkpoint_dir}")
+    if int(runtime["checkpoint_keep_last"]) <= 0:
+        raise RuntimeError("--compact-checkpoints requires runtime checkpoint_keep_last >= 1")
+    name_prefix = "neat-checkpoint-"
+    pattern = re.compile(rf"^{re.escape(name_prefix)}gen(\d+)$")
+    generations = sorted(
+        int(match.group(1)) for match in (pattern.match(name) for name in os.listdir(checkpoint_dir)) if match
+    )
+    if not generations:
+        raise RuntimeError(f"no checkpoints in {checkpoint_dir}")
+    keep_generations = []
+    if bool(runtime["checkpoint_keep_best"]):
+        # The newest checkpoint's metadata carries the run's best-so-far generation.
+        data = _load_checkpoint_data(os.path.join(checkpoint_dir, f"{name_prefix}gen{generations[-1]}"))
+        metadata = data[5] if len(data) > 5 and isinstance(data[5], dict) else {}
+        keep_generations.append(metadata.get("best_genome_display_generation"))
+    removed = _compact_checkpoints(
+        checkpoint_dir,
+        name_prefix,
+        int(runtime["checkpoint_keep_last"]),
+        int(runtime["checkpoint_keep_every"]),
+        keep_generations,
+    )
+    print(
+        json.dumps(
+            {
+                "checkpoint_dir": checkpoint_dir,
+                "removed": [os.path.basename(path) for path in removed],
+                "kept": len(generations) - len(removed),
+            },
+            ensure_ascii=False,
+        )
+    )
+
+
 def _build_config(config_path: str):
     if neat is None:
         raise RuntimeError("neat-python is not installed. Install with: pip install neat-python")
@@ -2296,8 +4974,11 @@ def _load_seed_genome(seed_genome_path: str):
     if not os.path.exists(seed_path):
         raise RuntimeError(f"seed genome not found: {seed_genome_path}")
 
-    with open(seed_path, "rb") as f:
-        seed_genome = pickle.load(f)
+    if _checkpoint_index_entry(seed_path) is not None:
+        seed_genome = _load_checkpoint_best_genome(seed_path)
+    else:
+        with open(seed_path, "rb") as f:
+            seed_genome = pickle.load(f)
 
     if seed_genome is None or not hasattr(seed_genome, "nodes") or not hasattr(seed_genome, "connections"):
         raise RuntimeError(f"invalid seed genome pickle: {seed_genome_path}")
@@ -2519,15 +5200,318 @@ def _resolve_effective_base_generation(
     resume_raw = str(resume_path or "").strip()
     if not resume_raw:
         return 0
-    display_generation = _parse_checkpoint_display_generation(resume_raw)
+    entry = _checkpoint_index_entry(resume_raw)
+    if entry is not None:
+        display_generation = int(entry["display_generation"])
+    else:
+        display_generation = _parse_checkpoint_display_generation(resume_raw)
     if display_generation is None:
         return 0
     return max(0, int(display_generation) - int(start_generation))
 
 
-def _restore_population_from_checkpoint(filename: str, new_config=None):
+_CHECKPOINT_DELTA_FORMAT = "neat_checkpoint_delta_v1"
+
+
+class _CheckpointStatePickler(pickle.Pickler):
+    """Pickles checkpoint state with population genomes replaced by ("genome", key) references."""
+
+    def __init__(self, file, genome_keys_by_id: dict):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._genome_keys_by_id = genome_keys_by_id
+
+    def persistent_id(self, obj):
+        key = self._genome_keys_by_id.get(id(obj))
+        return None if key is None else ("genome", key)
+
+
+class _CheckpointStateUnpickler(pickle.Unpickler):
+    def __init__(self, file, genomes: dict):
+        super().__init__(file)
+        self._genomes = genomes
+
+    def persistent_load(self, pid):
+        kind, key = pid
+        if kind != "genome" or key not in self._genomes:
+            raise pickle.UnpicklingError(f"checkpoint delta references unknown genome: {pid!r}")
+        return self._genomes[key]
+
+
+def _genome_gene_signature(genome) -> tuple[dict, dict]:
+    """Value snapshot of a genome's node and connection genes, for delta comparison."""
+    return (
+        {key: (type(gene), dict(vars(gene))) for key, gene in genome.nodes.items()},
+        {key: (type(gene), dict(vars(gene))) for key, gene in genome.connections.items()},
+    )
+
+
+def _checkpoint_gene_signatures(population: dict) -> dict:
+    return {key: _genome_gene_signature(genome) for key, genome in population.items()}
+
+
+def _build_checkpoint_delta(data: tuple, previous_signatures: dict, parent_name: str, base_name: str) -> tuple[dict, dict]:
+    """Delta checkpoint of data (the full checkpoint tuple) against the previous checkpoint's genomes.
+
+    A genome that kept its key stores only its changed genes; a new offspring stores the genes
+    that differ from its first parent (reproduction ancestors) when that parent was in the
+    previous checkpoint, else the whole genome. Non-gene attributes (fitness, eval meta) and
+    gene order are always stored. Config, species, RNG state and metadata are pickled once,
+    with population genomes as references. Returns (delta payload, signatures for the next delta).
+    """
+    config = data[1]
+    population = data[2]
+    ancestors = dict(getattr(config, "_codex_lineage_ancestors", {}) or {})
+    signatures = _checkpoint_gene_signatures(population)
+    genome_entries = {}
+    for key, genome in population.items():
+        ref_key = key if key in previous_signatures else None
+        if ref_key is None:
+            ref_key = next((parent for parent in ancestors.get(key, ()) if parent in previous_signatures), None)
+        # Gene maps are placeholders here so the rebuilt genome keeps the original attribute order.
+        attrs = {name: None if name in ("nodes", "connections") else value for name, value in vars(genome).items()}
+        if ref_key is None:
+            genome_entries[key] = {"ref": None, "genome": genome}
+            continue
+        ref_nodes, ref_connections = previous_signatures[ref_key]
+        nodes, connections = signatures[key]
+        changed_nodes = {gk: genome.nodes[gk] for gk, sig in nodes.items() if ref_nodes.get(gk) != sig}
+        changed_connections = {
+            gk: genome.connections[gk] for gk, sig in connections.items() if ref_connections.get(gk) != sig
+        }
+        if (
+            ref_key == key
+            and not changed_nodes
+            and not changed_connections
+            and list(nodes) == list(ref_nodes)
+            and list(connections) == list(ref_connections)
+        ):
+            genome_entries[key] = {"ref": key, "attrs": attrs}
+            continue
+        genome_entries[key] = {
+            "ref": ref_key,
+            "attrs": attrs,
+            "node_order": list(genome.nodes),
+            "nodes": changed_nodes,
+            "connection_order": list(genome.connections),
+            "connections": changed_connections,
+        }
+    buffer = io.BytesIO()
+    _CheckpointStatePickler(buffer, {id(genome): key for key, genome in population.items()}).dump(data)
+    delta = {
+        "format": _CHECKPOINT_DELTA_FORMAT,
+        "parent": str(parent_name),
+        "base": str(base_name),
+        "generation": int(data[0]),
+        "genomes": genome_entries,
+        "state": buffer.getvalue(),
+    }
+    return delta, signatures
+
+
+def _apply_checkpoint_delta_genomes(entries: dict, previous: dict) -> dict:
+    """Genome map of a delta checkpoint, rebuilt from the previous checkpoint's genome map."""
+    genomes = {}
+    for key, entry in entries.items():
+        if entry["ref"] is None:
+            genomes[key] = entry["genome"]
+            continue
+        ref = previous[entry["ref"]]
+        genome = object.__new__(type(ref))
+        genome.__dict__.update(entry["attrs"])
+        if "node_order" not in entry:
+            genome.nodes = copy.deepcopy(ref.nodes)
+            genome.connections = copy.deepcopy(ref.connections)
+        else:
+            genome.nodes = {
+                gk: entry["nodes"][gk] if gk in entry["nodes"] else copy.deepcopy(ref.nodes[gk])
+                for gk in entry["node_order"]
+            }
+            genome.connections = {
+                gk: entry["connections"][gk] if gk in entry["connections"] else copy.deepcopy(ref.connections[gk])
+                for gk in entry["connection_order"]
+            }
+        genomes[key] = genome
+    return genomes
+
+
+def _load_checkpoint_payload(filename: str):
     with gzip.open(filename, "rb") as f:
-        data = pickle.load(f)
+        return pickle.load(f)
+
+
+def _is_checkpoint_delta(payload) -> bool:
+    return isinstance(payload, dict) and payload.get("format") == _CHECKPOINT_DELTA_FORMAT
+
+
+def _load_checkpoint_data(filename: str) -> tuple:
+    """Full checkpoint tuple (generation, config, population, species_set, rndstate[, metadata]).
+
+    A delta checkpoint is resolved by walking its parent links back to the full base and
+    replaying the genome changes forward.
+    """
+    payload = _load_checkpoint_payload(filename)
+    if not _is_checkpoint_delta(payload):
+        return payload
+    chain = [payload]
+    directory = os.path.dirname(os.path.abspath(filename))
+    while True:
+        parent_path = os.path.join(directory, str(chain[-1]["parent"]))
+        if not os.path.exists(parent_path):
+            raise RuntimeError(f"checkpoint delta parent missing: {parent_path} (needed by {filename})")
+        parent = _load_checkpoint_payload(parent_path)
+        if not _is_checkpoint_delta(parent):
+            break
+        chain.append(parent)
+    if not isinstance(parent, tuple) or len(parent) < 5:
+        raise RuntimeError(f"Unsupported checkpoint payload: {parent_path}")
+    genomes = dict(parent[2])
+    for delta in reversed(chain):
+        genomes = _apply_checkpoint_delta_genomes(delta["genomes"], genomes)
+    return _CheckpointStateUnpickler(io.BytesIO(payload["state"]), genomes).load()
+
+
+_CHECKPOINT_INDEX_FORMAT = "neat_checkpoint_index_v1"
+_CHECKPOINT_INDEX_FILENAME = "checkpoint_index.ndjson"
+
+
+def _read_checkpoint_index(checkpoint_dir: str) -> dict:
+    """Latest checkpoint_index.ndjson entry per checkpoint file name.
+
+    Entries whose file is gone (pruned) or no longer has the indexed size are dropped.
+    """
+    index_path = os.path.join(checkpoint_dir, _CHECKPOINT_INDEX_FILENAME)
+    if not os.path.exists(index_path):
+        return {}
+    entries = {}
+    with open(index_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            if entry.get("format") != _CHECKPOINT_INDEX_FORMAT:
+                raise RuntimeError(f"unsupported checkpoint index entry in {index_path}: {line[:120]}")
+            entries[str(entry["file"])] = entry
+    live = {}
+    for name, entry in entries.items():
+        path = os.path.join(checkpoint_dir, name)
+        if os.path.exists(path) and os.path.getsize(path) == int(entry["file_bytes"]):
+            live[name] = entry
+    return live
+
+
+def _checkpoint_index_entry(checkpoint_path: str) -> Optional[dict]:
+    path = os.path.abspath(str(checkpoint_path))
+    return _read_checkpoint_index(os.path.dirname(path)).get(os.path.basename(path))
+
+
+def _resolve_resume_checkpoint(resume_path: str) -> str:
+    """--resume target: a checkpoint file as is, or the newest live checkpoint of a directory.
+
+    A directory is resolved through checkpoint_index.ndjson (highest display generation);
+    directories from before the index fall back to the neat-checkpoint-gen<N> file names.
+    """
+    path = os.path.abspath(str(resume_path))
+    if not os.path.isdir(path):
+        return path
+    entries = _read_checkpoint_index(path)
+    if entries:
+        entry = max(entries.values(), key=lambda item: int(item["display_generation"]))
+        return os.path.join(path, str(entry["file"]))
+    candidates = [
+        (generation, name)
+        for name in os.listdir(path)
+        if name.startswith("neat-checkpoint-gen")
+        for generation in [_parse_checkpoint_display_generation(name)]
+        if generation is not None
+    ]
+    if not candidates:
+        raise RuntimeError(f"--resume directory has no checkpoint: {path}")
+    return os.path.join(path, max(candidates)[1])
+
+
+def _load_checkpoint_best_genome(checkpoint_path: str):
+    """Best-so-far genome of an indexed checkpoint, read from its own gzip member.
+
+    Only best_genome_bytes at best_genome_offset are decompressed; the population state is skipped.
+    """
+    entry = _checkpoint_index_entry(checkpoint_path)
+    if entry is None:
+        raise RuntimeError(f"checkpoint not in {_CHECKPOINT_INDEX_FILENAME}: {checkpoint_path}")
+    if int(entry.get("best_genome_bytes") or 0) <= 0:
+        raise RuntimeError(f"checkpoint has no best genome snapshot: {checkpoint_path}")
+    with open(checkpoint_path, "rb") as f:
+        f.seek(int(entry["best_genome_offset"]))
+        member = f.read(int(entry["best_genome_bytes"]))
+    return pickle.loads(gzip.decompress(member))
+
+
+def _checkpoint_parent_name(checkpoint_dir: str, name: str, index: dict) -> str:
+    """Delta parent file name of a checkpoint ("" for a full one), from checkpoint_index.ndjson.
+
+    Only checkpoints written before the index existed are unpickled to find out.
+    """
+    entry = index.get(name)
+    if entry is not None:
+        return str(entry.get("parent") or "")
+    payload = _load_checkpoint_payload(os.path.join(checkpoint_dir, name))
+    return str(payload["parent"]) if _is_checkpoint_delta(payload) else ""
+
+
+def _compact_checkpoints(
+    checkpoint_dir: str,
+    name_prefix: str,
+    keep_last: int,
+    keep_every: int,
+    keep_generations,
+    scope_names=None,
+) -> list:
+    """Delete checkpoints outside the retention policy; returns the removed paths.
+
+    Kept: the keep_last newest (always including the newest, which phase_run.ps1 falls back to),
+    generations divisible by keep_every, keep_generations (best-so-far) and every delta-chain
+    parent of a kept checkpoint. keep_last = 0 keeps everything. scope_names limits ranking and
+    removal to those files (the training run's own checkpoints), so resuming into a directory
+    that already holds higher generations never prunes the new ones.
+    """
+    if int(keep_last) <= 0:
+        return []
+    pattern = re.compile(rf"^{re.escape(name_prefix)}gen(\d+)$")
+    names_by_generation = {}
+    for name in os.listdir(checkpoint_dir):
+        match = pattern.match(name)
+        if match and (scope_names is None or name in scope_names):
+            names_by_generation[int(match.group(1))] = name
+    generations = sorted(names_by_generation)
+    index = _read_checkpoint_index(checkpoint_dir)
+    keep = set(generations[-int(keep_last):])
+    if int(keep_every) > 0:
+        keep.update(g for g in generations if g % int(keep_every) == 0)
+    keep.update(int(g) for g in keep_generations if g is not None and int(g) in names_by_generation)
+    kept_names = {names_by_generation[g] for g in keep}
+    pending = sorted(kept_names)
+    while pending:
+        name = pending.pop()
+        parent = _checkpoint_parent_name(checkpoint_dir, name, index)
+        if not parent or parent in kept_names:
+            continue
+        if not os.path.exists(os.path.join(checkpoint_dir, parent)):
+            raise RuntimeError(f"checkpoint delta parent missing: {parent} (needed by {name} in {checkpoint_dir})")
+        kept_names.add(parent)
+        pending.append(parent)
+    removed = []
+    for generation in generations:
+        name = names_by_generation[generation]
+        if name in kept_names:
+            continue
+        path = os.path.join(checkpoint_dir, name)
+        os.remove(path)
+        removed.append(path)
+    return removed
+
+
+def _restore_population_from_checkpoint(filename: str, new_config=None):
+    data = _load_checkpoint_data(filename)
 
     if not isinstance(data, tuple) or len(data) < 5:
         raise RuntimeError(f"Unsupported checkpoint payload: {filename}")
@@ -2570,6 +5554,50 @@ def _coerce_lineage_parent_tuple(raw_value: object) -> tuple[int, ...]:
     return tuple(out)
 
 
+_LINEAGE_STATE_MAP_NAMES = (
+    "birth_generation_by_key",
+    "parents_by_key",
+    "origin_by_key",
+    "last_seen_generation_by_key",
+    "bootstrap_source_by_key",
+)
+
+
+def _lineage_state_log_path(state_path: str) -> str:
+    """Append-only delta log that sits next to a lineage_state.json snapshot."""
+    return os.path.join(os.path.dirname(os.path.abspath(state_path)), "lineage_state_log.ndjson")
+
+
+def _replay_lineage_state_log(raw: dict, log_path: str) -> None:
+    """Apply lineage_state_log.ndjson deltas newer than the snapshot's log_seq onto raw, in place.
+
+    A torn last line (crash mid-append) is dropped; every earlier line must parse.
+    """
+    if not os.path.exists(log_path):
+        return
+    snapshot_seq = int(raw.get("log_seq") or 0)
+    with open(log_path, "r", encoding="utf-8") as f:
+        lines = f.read().split("\n")
+    for index, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            if index == len(lines) - 1:
+                break
+            raise
+        if int(record.get("seq") or 0) <= snapshot_seq:
+            continue
+        for name in _LINEAGE_STATE_MAP_NAMES:
+            updates = record.get(name)
+            if isinstance(updates, dict):
+                merged = dict(raw.get(name) or {})
+                merged.update(updates)
+                raw[name] = merged
+
+
 def _load_lineage_state_from_path(path: str) -> Optional[dict]:
     target = os.path.abspath(str(path or "").strip())
     if not target or not os.path.exists(target):
@@ -2581,6 +5609,8 @@ def _load_lineage_state_from_path(path: str) -> Optional[dict]:
         return None
     if not isinstance(raw, dict):
         return None
+    # Outside the try: a corrupt journal must fail the resume, not silently drop lineage.
+    _replay_lineage_state_log(raw, _lineage_state_log_path(target))
 
     def _coerce_int_map(src: object) -> dict[int, int]:
         out: dict[int, int] = {}
@@ -2706,6 +5736,197 @@ def _build_winner_lineage_export(lineage_state: Optional[dict], winner_genome_ke
     }
 
 
+_LINEAGE_INDEX_FILENAME = "lineage_index.sqlite"
+_LINEAGE_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS genome (
+    genome_key INTEGER PRIMARY KEY,
+    birth_generation INTEGER,
+    last_seen_generation INTEGER,
+    origin TEXT,
+    bootstrap_source TEXT
+);
+CREATE TABLE IF NOT EXISTS parent_edge (
+    child_key INTEGER NOT NULL,
+    parent_key INTEGER NOT NULL,
+    PRIMARY KEY (child_key, parent_key)
+);
+CREATE TABLE IF NOT EXISTS generation_member (
+    generation INTEGER NOT NULL,
+    genome_key INTEGER NOT NULL,
+    species_id INTEGER,
+    fitness REAL,
+    win_rate REAL,
+    mean_gold_delta REAL,
+    games INTEGER,
+    PRIMARY KEY (generation, genome_key)
+);
+CREATE INDEX IF NOT EXISTS parent_edge_parent ON parent_edge (parent_key);
+CREATE INDEX IF NOT EXISTS genome_bootstrap_source ON genome (bootstrap_source);
+CREATE INDEX IF NOT EXISTS generation_member_species ON generation_member (species_id, generation);
+CREATE INDEX IF NOT EXISTS generation_member_genome ON generation_member (genome_key);
+"""
+
+
+def _open_lineage_index(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_LINEAGE_INDEX_SCHEMA)
+    return conn
+
+
+def _lineage_index_add_records(conn: sqlite3.Connection, records) -> None:
+    """Upsert lineage.ndjson records (one per genome per generation) into the index tables."""
+    genome_rows = []
+    edge_rows = []
+    member_rows = []
+    for record in records or []:
+        key = int(record["genome_key"])
+        generation = int(record["generation"])
+        genome_rows.append(
+            (
+                key,
+                int(record.get("birth_generation", generation)),
+                generation,
+                record.get("origin") or None,
+                record.get("bootstrap_source") or None,
+            )
+        )
+        edge_rows.extend((key, int(parent_key)) for parent_key in record.get("parent_keys") or [])
+        member_rows.append(
+            (
+                generation,
+                key,
+                record.get("species_id"),
+                record.get("fitness"),
+                record.get("win_rate"),
+                record.get("mean_gold_delta"),
+                record.get("games"),
+            )
+        )
+    conn.executemany(
+        """
+        INSERT INTO genome (genome_key, birth_generation, last_seen_generation, origin, bootstrap_source)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (genome_key) DO UPDATE SET
+            birth_generation = MIN(birth_generation, excluded.birth_generation),
+            last_seen_generation = MAX(last_seen_generation, excluded.last_seen_generation),
+            bootstrap_source = COALESCE(excluded.bootstrap_source, bootstrap_source)
+        """,
+        genome_rows,
+    )
+    conn.executemany("INSERT OR IGNORE INTO parent_edge (child_key, parent_key) VALUES (?, ?)", edge_rows)
+    conn.executemany(
+        """
+        INSERT OR REPLACE INTO generation_member
+            (generation, genome_key, species_id, fitness, win_rate, mean_gold_delta, games)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        member_rows,
+    )
+
+
+def _build_lineage_index_from_log(lineage_log_path: str, index_path: str) -> int:
+    """(Re)build lineage_index.sqlite from a run's lineage.ndjson; returns the record count."""
+    if not os.path.exists(lineage_log_path):
+        raise RuntimeError(f"lineage log not found: {lineage_log_path}")
+    count = 0
+    opener = gzip.open if lineage_log_path.endswith(".gz") else open
+    with contextlib.closing(_open_lineage_index(index_path)) as conn:
+        with conn:
+            batch = []
+            with opener(lineage_log_path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    batch.append(json.loads(line))
+                    if len(batch) >= 5000:
+                        _lineage_index_add_records(conn, batch)
+                        count += len(batch)
+                        batch = []
+            _lineage_index_add_records(conn, batch)
+            count += len(batch)
+    return count
+
+
+def _lineage_index_ancestry(conn: sqlite3.Connection, genome_key: int) -> list[dict]:
+    """Every ancestor of genome_key (itself included), newest birth first; no node cap."""
+    rows = conn.execute(
+        """
+        WITH RECURSIVE ancestor(genome_key) AS (
+            SELECT ?
+            UNION
+            SELECT e.parent_key FROM parent_edge e JOIN ancestor a ON e.child_key = a.genome_key
+        )
+        SELECT a.genome_key, g.birth_generation, g.last_seen_generation, g.origin, g.bootstrap_source
+        FROM ancestor a LEFT JOIN genome g ON g.genome_key = a.genome_key
+        ORDER BY g.birth_generation DESC, a.genome_key
+        """,
+        (int(genome_key),),
+    ).fetchall()
+    return [
+        {
+            "genome_key": int(row[0]),
+            "birth_generation": row[1],
+            "last_seen_generation": row[2],
+            "origin": row[3],
+            "bootstrap_source": row[4],
+        }
+        for row in rows
+    ]
+
+
+def _lineage_index_descendants(conn: sqlite3.Connection, bootstrap_source: str) -> list[dict]:
+    """Genomes tagged with bootstrap_source plus every descendant of them through parent edges."""
+    rows = conn.execute(
+        """
+        WITH RECURSIVE descendant(genome_key) AS (
+            SELECT genome_key FROM genome WHERE bootstrap_source = ?
+            UNION
+            SELECT e.child_key FROM parent_edge e JOIN descendant d ON e.parent_key = d.genome_key
+        )
+        SELECT d.genome_key, g.birth_generation, g.last_seen_generation, g.bootstrap_source
+        FROM descendant d LEFT JOIN genome g ON g.genome_key = d.genome_key
+        ORDER BY g.birth_generation, d.genome_key
+        """,
+        (str(bootstrap_source),),
+    ).fetchall()
+    return [
+        {
+            "genome_key": int(row[0]),
+            "birth_generation": row[1],
+            "last_seen_generation": row[2],
+            "bootstrap_source": row[3],
+        }
+        for row in rows
+    ]
+
+
+def _lineage_index_species_fitness(conn: sqlite3.Connection, species_id: Optional[int] = None) -> list[dict]:
+    """Per generation and species: member count and max / mean fitness and win rate."""
+    rows = conn.execute(
+        """
+        SELECT generation, species_id, COUNT(*), MAX(fitness), AVG(fitness), AVG(win_rate)
+        FROM generation_member
+        WHERE ? IS NULL OR species_id = ?
+        GROUP BY generation, species_id
+        ORDER BY generation, species_id
+        """,
+        (species_id, species_id),
+    ).fetchall()
+    return [
+        {
+            "generation": int(row[0]),
+            "species_id": row[1],
+            "members": int(row[2]),
+            "max_fitness": row[3],
+            "mean_fitness": row[4],
+            "mean_win_rate": row[5],
+        }
+        for row in rows
+    ]
+
+
 if neat is not None:
 
     class OffsetCheckpointer(neat.Checkpointer):
@@ -2718,11 +5939,35 @@ if neat is not None:
             filename_prefix: str,
             initial_best_genome=None,
             initial_best_display_generation: Optional[int] = None,
+            async_write: bool = True,
+            full_every: int = 1,
+            keep_last: int = 0,
+            keep_every: int = 0,
+            keep_best: bool = True,
         ):
             super().__init__(
                 generation_interval=max(1, int(generation_interval)),
                 filename_prefix=str(filename_prefix),
             )
+            # async_write: the training thread only pickles the state (the snapshot); gzip and the
+            # disk write run on one background thread, in order, into <file>.tmp + os.replace.
+            self.async_write = bool(async_write)
+            self._writer = None
+            self._pending_writes = []
+            # full_every > 1: a full checkpoint, then up to full_every - 1 deltas chained to it
+            # (_build_checkpoint_delta). The first save of every process is full.
+            self.full_every = max(1, int(full_every))
+            self._gene_signatures = None
+            self._chain_base_name = ""
+            self._chain_parent_name = ""
+            self._deltas_since_full = 0
+            # keep_last > 0: after each write, _compact_checkpoints prunes this directory
+            # (on the writer thread when async_write, so it never races a pending write).
+            self.keep_last = max(0, int(keep_last))
+            self.keep_every = max(0, int(keep_every))
+            self.keep_best = bool(keep_best)
+            # Checkpoint files written by this process; the only ones keep_last prunes.
+            self._run_checkpoint_names = set()
             self.base_generation = int(base_generation)
             self.last_generation_checkpoint = int(start_generation)
             self._last_saved_display_generation = None
@@ -2733,6 +5978,15 @@ if neat is not None:
                 else None
             )
 
+        def __getstate__(self):
+            # Checkpoints pickle the species set, whose reporter list includes this object.
+            state = dict(self.__dict__)
+            state["_writer"] = None
+            state["_pending_writes"] = []
+            state["_gene_signatures"] = None
+            state["_run_checkpoint_names"] = set()
+            return state
+
         def _display_from_generation(self, generation: int) -> int:
             return int(self.base_generation + int(generation))
 
@@ -2758,23 +6012,146 @@ if neat is not None:
             state_generation: int,
             display_generation: int,
         ) -> None:
+            started = time.perf_counter()
             filename = f"{self.filename_prefix}gen{int(display_generation)}"
             print(f"Saving checkpoint to {filename}", file=sys.stderr)
-            with gzip.open(filename, "w", compresslevel=5) as f:
-                metadata = {
-                    "best_genome": copy.deepcopy(self.best_genome_snapshot),
-                    "best_genome_display_generation": self.best_genome_display_generation,
-                }
-                data = (
-                    int(state_generation),
-                    config,
-                    population,
-                    species_set,
-                    random.getstate(),
-                    metadata,
+            metadata = {
+                "best_genome": self.best_genome_snapshot,
+                "best_genome_display_generation": self.best_genome_display_generation,
+            }
+            data = (
+                int(state_generation),
+                config,
+                population,
+                species_set,
+                random.getstate(),
+                metadata,
+            )
+            name = os.path.basename(filename)
+            parent_name = ""
+            if (
+                self.full_every > 1
+                and self._gene_signatures is not None
+                and self._deltas_since_full < self.full_every - 1
+            ):
+                delta, self._gene_signatures = _build_checkpoint_delta(
+                    data, self._gene_signatures, self._chain_parent_name, self._chain_base_name
                 )
-                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                payload = pickle.dumps(delta, protocol=pickle.HIGHEST_PROTOCOL)
+                parent_name = self._chain_parent_name
+                self._deltas_since_full += 1
+            else:
+                payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+                if self.full_every > 1:
+                    self._gene_signatures = _checkpoint_gene_signatures(population)
+                self._chain_base_name = name
+                self._deltas_since_full = 0
+            self._chain_parent_name = name
+            keep_generations = [self.best_genome_display_generation] if self.keep_best else []
+            best_genome = self.best_genome_snapshot
+            best_fitness = getattr(best_genome, "fitness", None)
+            index_entry = {
+                "format": _CHECKPOINT_INDEX_FORMAT,
+                "file": name,
+                "display_generation": int(display_generation),
+                "state_generation": int(state_generation),
+                "kind": "delta" if parent_name else "full",
+                "parent": parent_name or None,
+                "population_size": len(population),
+                "species_count": len(getattr(species_set, "species", {}) or {}),
+                "best_genome_key": getattr(best_genome, "key", None),
+                "best_fitness": float(best_fitness) if best_fitness is not None else None,
+                "best_genome_display_generation": self.best_genome_display_generation,
+            }
+            best_blob = b"" if best_genome is None else pickle.dumps(best_genome, protocol=pickle.HIGHEST_PROTOCOL)
+            write_args = (filename, payload, best_blob, index_entry, keep_generations)
+            if self.async_write:
+                self._collect_finished_writes()
+                if self._writer is None:
+                    self._writer = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=1,
+                        thread_name_prefix="neat-checkpoint",
+                    )
+                self._pending_writes.append(self._writer.submit(self._write_and_compact, *write_args))
+            else:
+                self._write_and_compact(*write_args)
             self._last_saved_display_generation = int(display_generation)
+            # With async_write this is the pickling / delta cost; gzip and file I/O run on the writer.
+            _PHASE_TIMER.add("checkpoint", (time.perf_counter() - started) * 1000.0)
+
+        @staticmethod
+        def _write_checkpoint_file(filename: str, payload: bytes, best_blob: bytes) -> dict:
+            """Writes the checkpoint pickle, then the best genome as a second gzip member.
+
+            Whole-file readers (pickle.load over gzip.open) stop at the first pickle, so the extra
+            member is invisible to them; _load_checkpoint_best_genome seeks straight to it.
+            """
+            temp_path = f"{filename}.tmp"
+            with gzip.open(temp_path, "wb", compresslevel=5) as f:
+                f.write(payload)
+            state_bytes = os.path.getsize(temp_path)
+            best_bytes = 0
+            if best_blob:
+                member = gzip.compress(best_blob, compresslevel=5)
+                with open(temp_path, "ab") as f:
+                    f.write(member)
+                best_bytes = len(member)
+            os.replace(temp_path, filename)
+            return {
+                "state_bytes": int(state_bytes),
+                "best_genome_offset": int(state_bytes) if best_bytes else None,
+                "best_genome_bytes": int(best_bytes),
+                "file_bytes": int(state_bytes + best_bytes),
+            }
+
+        def _write_and_compact(
+            self,
+            filename: str,
+            payload: bytes,
+            best_blob: bytes,
+            index_entry: dict,
+            keep_generations,
+        ) -> None:
+            index_entry = dict(index_entry)
+            index_entry.update(self._write_checkpoint_file(filename, payload, best_blob))
+            index_entry["saved_at"] = datetime.now(timezone.utc).isoformat()
+            index_path = os.path.join(os.path.dirname(filename), _CHECKPOINT_INDEX_FILENAME)
+            with open(index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(index_entry, ensure_ascii=False))
+                f.write("\n")
+            if self.keep_last <= 0:
+                return
+            self._run_checkpoint_names.add(os.path.basename(filename))
+            removed = _compact_checkpoints(
+                os.path.dirname(filename),
+                os.path.basename(self.filename_prefix),
+                self.keep_last,
+                self.keep_every,
+                keep_generations,
+                self._run_checkpoint_names,
+            )
+            self._run_checkpoint_names.difference_update(os.path.basename(path) for path in removed)
+            if removed:
+                names = ", ".join(os.path.basename(path) for path in removed)
+                print(f"Pruned checkpoints: {names}", file=sys.stderr)
+
+        def _collect_finished_writes(self) -> None:
+            pending = []
+            for future in self._pending_writes:
+                if future.done():
+                    future.result()
+                else:
+                    pending.append(future)
+            self._pending_writes = pending
+
+        def flush(self) -> None:
+            """Wait for queued checkpoint writes; re-raises the first write error."""
+            pending, self._pending_writes = self._pending_writes, []
+            for future in pending:
+                future.result()
+            if self._writer is not None:
+                self._writer.shutdown(wait=True)
+                self._writer = None
 
         def save_checkpoint(self, config, population, species_set, generation):
             display_generation = self._display_from_generation(max(0, int(generation) - 1))
@@ -2830,11 +6207,24 @@ if neat is not None:
             output_dir: str,
             generation_display_offset: int = 0,
             state_seed: Optional[dict] = None,
+            compact_every: int = 50,
+            index_enabled: bool = True,
         ):
             self.output_dir = os.path.abspath(output_dir)
             os.makedirs(self.output_dir, exist_ok=True)
             self.lineage_log = os.path.join(self.output_dir, "lineage.ndjson")
             self.lineage_state_path = os.path.join(self.output_dir, "lineage_state.json")
+            # Each generation appends only the keys it touched to lineage_state_log.ndjson;
+            # lineage_state.json is rewritten (and the log reset) every compact_every generations.
+            self.lineage_state_log_path = _lineage_state_log_path(self.lineage_state_path)
+            self.compact_every = max(1, int(compact_every))
+            self._log_seq = 0
+            self._generations_since_compact = 0
+            # lineage_index.sqlite mirrors lineage.ndjson for ancestry / species queries; the
+            # connection is opened per generation so this reporter stays picklable in checkpoints.
+            self.lineage_index_path = (
+                os.path.join(self.output_dir, _LINEAGE_INDEX_FILENAME) if bool(index_enabled) else None
+            )
             self.generation_display_offset = int(generation_display_offset)
             self.current_generation = 0
 
@@ -2853,34 +6243,54 @@ if neat is not None:
             return int(self.generation_display_offset + int(generation))
 
         def _append_lines(self, path: str, records) -> None:
-            if not records:
-                return
-            with open(path, "a", encoding="utf-8") as f:
-                for record in records:
-                    f.write(json.dumps(record, ensure_ascii=False))
-                    f.write("\n")
+            _METRICS_SINK.append(path, records)
 
-        def _write_state(self) -> None:
-            payload = {
-                "saved_at": datetime.now(timezone.utc).isoformat(),
+        def _state_maps(self, keys=None) -> dict:
+            def _select(src: dict) -> dict:
+                if keys is None:
+                    return src
+                return {key: src[key] for key in keys if key in src}
+
+            return {
                 "birth_generation_by_key": {
-                    str(key): int(value) for key, value in self.birth_generation_by_key.items()
+                    str(key): int(value) for key, value in _select(self.birth_generation_by_key).items()
                 },
                 "parents_by_key": {
-                    str(key): [int(x) for x in value] for key, value in self.parents_by_key.items()
+                    str(key): [int(x) for x in value] for key, value in _select(self.parents_by_key).items()
                 },
                 "origin_by_key": {
-                    str(key): str(value or "") for key, value in self.origin_by_key.items()
+                    str(key): str(value or "") for key, value in _select(self.origin_by_key).items()
                 },
                 "last_seen_generation_by_key": {
-                    str(key): int(value) for key, value in self.last_seen_generation_by_key.items()
+                    str(key): int(value) for key, value in _select(self.last_seen_generation_by_key).items()
                 },
                 "bootstrap_source_by_key": {
-                    str(key): str(value or "") for key, value in self.bootstrap_source_by_key.items()
+                    str(key): str(value or "") for key, value in _select(self.bootstrap_source_by_key).items()
                 },
             }
-            with open(self.lineage_state_path, "w", encoding="utf-8") as f:
+
+        def _write_state(self) -> None:
+            """Compaction: full lineage_state.json snapshot, then an empty delta log."""
+            payload = {"saved_at": datetime.now(timezone.utc).isoformat(), "log_seq": int(self._log_seq)}
+            payload.update(self._state_maps())
+            temp_path = f"{self.lineage_state_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
                 json.dump(payload, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.lineage_state_path)
+            # Lines up to log_seq are already in the snapshot, so a crash before this reset is harmless.
+            with open(self.lineage_state_log_path, "w", encoding="utf-8"):
+                pass
+            self._generations_since_compact = 0
+
+        def _append_state_delta(self, keys) -> None:
+            self._log_seq += 1
+            record = {"seq": int(self._log_seq), "saved_at": datetime.now(timezone.utc).isoformat()}
+            record.update(self._state_maps(keys))
+            # The replay journal bypasses the buffered metrics sink: it must be on disk before the
+            # checkpoint of this generation is.
+            with open(self.lineage_state_log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write("\n")
 
         def _species_membership(self, species_set) -> dict[int, int]:
             out: dict[int, int] = {}
@@ -2895,7 +6305,15 @@ if neat is not None:
         def start_generation(self, generation):
             self.current_generation = int(generation)
 
+        def end_generation(self, config, population, species_set):
+            # One metrics flush per generation covers the eval, generation, lineage and failure logs.
+            _METRICS_SINK.flush()
+
         def post_evaluate(self, config, population, species, best_genome):
+            with _PHASE_TIMER.measure("lineage_write"):
+                self._record_lineage(config, population, species)
+
+        def _record_lineage(self, config, population, species):
             display_generation = self._display_generation(self.current_generation)
             ancestors_map = getattr(config, "_codex_lineage_ancestors", {}) or {}
             bootstrap_sources_map = getattr(config, "_codex_lineage_bootstrap_sources", {}) or {}
@@ -2958,7 +6376,15 @@ if neat is not None:
                     }
                 )
             self._append_lines(self.lineage_log, records)
-            self._write_state()
+            if self.lineage_index_path is not None:
+                with contextlib.closing(_open_lineage_index(self.lineage_index_path)) as conn:
+                    with conn:
+                        _lineage_index_add_records(conn, records)
+            self._generations_since_compact += 1
+            if self._generations_since_compact >= self.compact_every:
+                self._write_state()
+            else:
+                self._append_state_delta([int(key) for key in (population or {})])
 
         def snapshot_state(self) -> dict:
             return {
@@ -2972,11 +6398,72 @@ if neat is not None:
             }
 
 
+    class PhaseTimingReporter(neat.reporting.BaseReporter):
+        """Writes one generation_timings.ndjson row per generation from _PHASE_TIMER.
+
+        Registered before every other reporter, so end_generation runs right after speciation,
+        which is timed from the end of reproduce (see _timed_reproduce). A generation's row is
+        written at the next start_generation (or finish()), so it also covers the checkpoint and
+        lineage work the later reporters do in end_generation.
+        """
+
+        def __init__(self, output_dir: str, generation_display_offset: int = 0):
+            self.timings_log = os.path.join(os.path.abspath(output_dir), "generation_timings.ndjson")
+            self.generation_display_offset = int(generation_display_offset)
+            self._pending_generation = None
+            self._generation_started = None
+
+        def start_generation(self, generation):
+            self.finish()
+            self._pending_generation = int(generation)
+            self._generation_started = time.perf_counter()
+
+        def end_generation(self, config, population, species_set):
+            reproduce_finished = _PHASE_TIMER.reproduce_finished
+            if reproduce_finished is not None:
+                _PHASE_TIMER.add("speciation", (time.perf_counter() - reproduce_finished) * 1000.0)
+                _PHASE_TIMER.reproduce_finished = None
+
+        def finish(self) -> None:
+            if self._pending_generation is None:
+                return
+            totals = _PHASE_TIMER.take()
+            record = {
+                "saved_at": datetime.now(timezone.utc).isoformat(),
+                "generation": int(self.generation_display_offset + self._pending_generation),
+                "generation_wall_ms": (time.perf_counter() - self._generation_started) * 1000.0,
+            }
+            extra_phases = tuple(sorted(set(totals) - set(_TIMING_PHASES)))
+            for phase in _TIMING_PHASES + extra_phases:
+                total_ms, count = totals.get(phase, (0.0, 0))
+                record[f"{phase}_ms"] = float(total_ms)
+                record[f"{phase}_count"] = int(count)
+            _METRICS_SINK.append(self.timings_log, [record], column_table="generation_timings")
+            self._pending_generation = None
+
+
+def _timed_reproduce(reproduce):
+    """Wraps a reproduction.reproduce bound method to time it and mark where speciation starts."""
+
+    @functools.wraps(reproduce)
+    def _wrapped(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return reproduce(*args, **kwargs)
+        finally:
+            _PHASE_TIMER.reproduce_finished = time.perf_counter()
+            _PHASE_TIMER.add("reproduction", (_PHASE_TIMER.reproduce_finished - started) * 1000.0)
+
+    return _wrapped
+
+
 # =============================================================================
 # Section 10. Entrypoint
 # =============================================================================
 def main() -> None:
     args = parse_args()
+    if args.resume:
+        args.resume = _resolve_resume_checkpoint(args.resume)
     run_started_wall = datetime.now(timezone.utc)
     run_started_perf = time.perf_counter()
 
@@ -2984,6 +6471,11 @@ def main() -> None:
         raise RuntimeError("neat-python is not installed. Install with: pip install neat-python")
 
     runtime = _load_runtime_config(args.runtime_config)
+    _METRICS_SINK.configure(
+        background=bool(runtime["metrics_background_writer"]),
+        compression=str(runtime["metrics_compression"]),
+        columnar=str(runtime["metrics_columnar"]),
+    )
     applied_overrides = {}
     seed_genome_path = str(args.seed_genome or "").strip()
     seed_genome_count = max(0, int(args.seed_genome_count or 0))
@@ -3022,6 +6514,10 @@ def main() -> None:
     if args.workers > 0:
         runtime["eval_workers"] = args.workers
         override_keys.append("eval_workers")
+    if str(args.broker).strip():
+        runtime["eval_backend"] = "broker"
+        runtime["broker_listen"] = str(args.broker).strip()
+        override_keys.extend(["eval_backend", "broker_listen"])
     if args.games_per_genome > 0:
         runtime["games_per_genome"] = args.games_per_genome
         override_keys.append("games_per_genome")
@@ -3089,6 +6585,18 @@ def main() -> None:
             raise RuntimeError(f"opponent genome not found: {opponent_genome}")
 
     os.makedirs(args.output_dir, exist_ok=True)
+    if str(args.eval_genome).strip():
+        _run_eval_genome_only(args, runtime)
+        return
+    if str(args.compact_checkpoints).strip():
+        _run_compact_checkpoints_only(args, runtime)
+        return
+    if str(args.lineage_query).strip():
+        _run_lineage_query_only(args)
+        return
+    if bool(args.metrics_columnar_backfill):
+        _run_metrics_columnar_backfill_only(args)
+        return
     checkpoints_dir = os.path.join(args.output_dir, "checkpoints")
     models_dir = os.path.join(args.output_dir, "models")
     os.makedirs(checkpoints_dir, exist_ok=True)
@@ -3146,6 +6654,13 @@ def main() -> None:
     if base_generation != 0:
         applied_overrides["base_generation"] = int(base_generation)
 
+    timing_reporter = None
+    if bool(runtime["timing_breakdown"]):
+        # First in the reporter list; see PhaseTimingReporter.
+        timing_reporter = PhaseTimingReporter(args.output_dir, generation_display_offset=int(base_generation))
+        p.add_reporter(timing_reporter)
+        p.reproduction.reproduce = _timed_reproduce(p.reproduction.reproduce)
+
     # Keep training output quiet by default to reduce terminal I/O overhead.
     if bool(args.verbose):
         p.add_reporter(neat.StdOutReporter(True))
@@ -3155,6 +6670,8 @@ def main() -> None:
         output_dir=args.output_dir,
         generation_display_offset=int(base_generation),
         state_seed=lineage_state_seed,
+        compact_every=int(runtime["lineage_compact_every"]),
+        index_enabled=bool(runtime["lineage_index"]),
     )
     p.add_reporter(lineage_reporter)
 
@@ -3167,17 +6684,27 @@ def main() -> None:
         filename_prefix=prefix,
         initial_best_genome=getattr(p, "best_genome", None),
         initial_best_display_generation=getattr(p, "best_genome_display_generation", None),
+        async_write=bool(runtime["checkpoint_async"]),
+        full_every=int(runtime["checkpoint_full_every"]),
+        keep_last=int(runtime["checkpoint_keep_last"]),
+        keep_every=int(runtime["checkpoint_keep_every"]),
+        keep_best=bool(runtime["checkpoint_keep_best"]),
     )
     p.add_reporter(checkpointer)
 
     evaluator = None
 
     def _run_population(eval_callable):
+        if isinstance(eval_callable, LoggedParallelEvaluator) and runtime["evolution_mode"] == "steady_state":
+            run = functools.partial(_run_steady_state, p, eval_callable, int(run_generation_count))
+        else:
+            evaluate = eval_callable.evaluate if isinstance(eval_callable, LoggedParallelEvaluator) else eval_callable
+            run = functools.partial(p.run, evaluate, int(run_generation_count))
         if bool(args.verbose):
-            return p.run(eval_callable, int(run_generation_count))
+            return run()
         with open(os.devnull, "w", encoding="utf-8") as devnull:
             with contextlib.redirect_stdout(devnull):
-                return p.run(eval_callable, int(run_generation_count))
+                return run()
 
     skip_training_run = (
         bool(args.resume)
@@ -3188,8 +6715,11 @@ def main() -> None:
         winner = getattr(p, "best_genome", None)
         mode = "resume_postprocess"
     elif args.dry_run:
-        winner = _run_population(_run_dry_eval)
-        checkpointer.save_final_checkpoint(p.config, p.population, p.species, p.generation)
+        try:
+            winner = _run_population(_run_dry_eval)
+            checkpointer.save_final_checkpoint(p.config, p.population, p.species, p.generation)
+        finally:
+            checkpointer.flush()
         mode = "dry_run"
     else:
         evaluator = LoggedParallelEvaluator(
@@ -3200,11 +6730,17 @@ def main() -> None:
             generation_display_offset=int(base_generation),
         )
         try:
-            winner = _run_population(evaluator.evaluate)
-            checkpointer.save_final_checkpoint(p.config, p.population, p.species, p.generation)
+            try:
+                winner = _run_population(evaluator)
+                checkpointer.save_final_checkpoint(p.config, p.population, p.species, p.generation)
+            finally:
+                checkpointer.flush()
             mode = "real_eval"
-        finally:
+        except BaseException:
             evaluator.close()
+            raise
+    if timing_reporter is not None:
+        timing_reporter.finish()
 
     best_winner = None
     if evaluator is not None:
@@ -3225,8 +6761,18 @@ def main() -> None:
         playoff_candidates = evaluator.top_candidate_snapshots(limit=int(runtime.get("winner_playoff_topk", 5)))
     elif skip_training_run:
         playoff_candidates = _population_candidate_snapshots(p, limit=int(runtime.get("winner_playoff_topk", 5)))
-    if len(playoff_candidates) > 0:
-        winner_playoff = _run_winner_playoff(playoff_candidates, p.config, runtime)
+    try:
+        if len(playoff_candidates) > 0:
+            # The evaluator's threads (and their persistent eval servers) stay up for the playoff.
+            winner_playoff = _run_winner_playoff(
+                playoff_candidates,
+                p.config,
+                runtime,
+                executor=(evaluator.executor if evaluator is not None else None),
+            )
+    finally:
+        if evaluator is not None:
+            evaluator.close()
     if winner_playoff is not None and winner_playoff.get("winner_genome") is not None:
         best_winner = copy.deepcopy(winner_playoff.get("winner_genome"))
 
@@ -3285,6 +6831,12 @@ def main() -> None:
     )
     winner_lineage_path = os.path.join(args.output_dir, "winner_lineage.json")
     winner_lineage_export = _build_winner_lineage_export(lineage_state_snapshot, winner_lineage_key)
+    if winner_lineage_export is not None and lineage_reporter.lineage_index_path is not None:
+        # nodes stays capped for readability; the index gives the uncapped ancestor count.
+        with contextlib.closing(_open_lineage_index(lineage_reporter.lineage_index_path)) as conn:
+            winner_lineage_export["indexed_ancestor_count"] = (
+                len(_lineage_index_ancestry(conn, winner_lineage_key)) - 1
+            )
     if winner_lineage_export is not None:
         with open(winner_lineage_path, "w", encoding="utf-8") as f:
             json.dump(winner_lineage_export, f, ensure_ascii=False, indent=2)
@@ -3314,14 +6866,23 @@ def main() -> None:
         "champions": champion_exports,
         "applied_overrides": applied_overrides,
         "runtime_effective": runtime,
-        "eval_failure_log": os.path.join(args.output_dir, "eval_failures.log"),
-        "eval_metrics_log": os.path.join(args.output_dir, "eval_metrics.ndjson"),
-        "generation_metrics_log": os.path.join(args.output_dir, "generation_metrics.ndjson"),
-        "lineage_log": os.path.join(args.output_dir, "lineage.ndjson"),
+        "eval_failure_log": _eval_failure_log_path(args.output_dir),
+        "eval_metrics_log": _METRICS_SINK.path_for(os.path.join(args.output_dir, "eval_metrics.ndjson")),
+        "generation_metrics_log": _METRICS_SINK.path_for(os.path.join(args.output_dir, "generation_metrics.ndjson")),
+        "lineage_log": _METRICS_SINK.path_for(os.path.join(args.output_dir, "lineage.ndjson")),
+        "metrics_columns_dir": (
+            os.path.join(args.output_dir, _COLUMNAR_DIRNAME) if runtime["metrics_columnar"] != "off" else None
+        ),
+        "generation_timings_log": (
+            _METRICS_SINK.path_for(timing_reporter.timings_log) if timing_reporter is not None else None
+        ),
         "lineage_state_path": os.path.join(args.output_dir, "lineage_state.json"),
+        "lineage_state_log_path": os.path.join(args.output_dir, "lineage_state_log.ndjson"),
+        "lineage_index_path": lineage_reporter.lineage_index_path,
         "winner_lineage_path": winner_lineage_path,
         "gate_state_path": os.path.join(args.output_dir, "gate_state.json"),
         "gate_state": evaluator.snapshot() if evaluator is not None else {},
+        "throughput": evaluator.throughput_snapshot() if evaluator is not None else None,
         "winner_pickle": winner_pkl,
         "winner_json": winner_json_path,
         "seed_genome": seed_genome_path or None,
@@ -3329,6 +6890,8 @@ def main() -> None:
         "config_feedforward": os.path.abspath(args.config_feedforward),
         "runtime_config": os.path.abspath(args.runtime_config),
     }
+    # Logs are complete on disk before run_summary.json points at them.
+    _METRICS_SINK.close()
     run_summary_path = os.path.join(args.output_dir, "run_summary.json")
     with open(run_summary_path, "w", encoding="utf-8") as f:
         json.dump(run_summary, f, ensure_ascii=False, indent=2)
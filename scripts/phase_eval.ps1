@@ -239,9 +239,10 @@ function Get-NetworkOutputPrefix {
 }
 
 $lineageLayout = Get-LineageLayout -Profile $LineageProfile
+$pythonInfo = Resolve-PythonCommand
 $nodeInfo = Resolve-NodeCommand
-Enable-RepoToolchainPath -NodeInfo $nodeInfo
-$node = [string]$nodeInfo.Path
+Enable-RepoToolchainPath -PythonInfo $pythonInfo -NodeInfo $nodeInfo
+$python = [string]$pythonInfo.Path
 <#
 
   $savePath = Join-Path $outputDir "phase${Phase}_eval_1000.json"
@@ -460,31 +461,19 @@ if (-not $hasPolicy -and -not $hasPolicyMix) {
   throw "runtime must contain opponent_policy or opponent_policy_mix"
 }
 
+# neat_train.py --eval-genome plays the games as one series; only with continuous_series = false and
+# eval_shard_games > 0 does it split them into --game-offset shards over eval_workers and merge them.
+# Opponent policy/mix and fitness params come from the runtime.
 $cmd = @(
-  "scripts/neat_eval_worker.mjs",
-  "--genome", $genomePath,
-  "--games", "$games",
-  "--seed", $seedTag,
-  "--max-steps", "$(Get-PropertyValue -Object $runtime -Name 'max_eval_steps')",
-  "--first-turn-policy", "alternate",
-  "--fitness-gold-scale", "$(Get-PropertyValue -Object $runtime -Name 'fitness_gold_scale')",
-  "--fitness-gold-neutral-delta", "$(Get-PropertyValue -Object $runtime -Name 'fitness_gold_neutral_delta')",
-  "--fitness-win-weight", "$(Get-PropertyValue -Object $runtime -Name 'fitness_win_weight')",
-  "--fitness-gold-weight", "$(Get-PropertyValue -Object $runtime -Name 'fitness_gold_weight')",
-  "--fitness-win-neutral-rate", "$(Get-PropertyValue -Object $runtime -Name 'fitness_win_neutral_rate')"
+  "scripts/neat_train.py",
+  "--runtime-config", $runtimeConfigPath,
+  "--output-dir", $outputDir,
+  "--eval-genome", $genomePath,
+  "--eval-games", "$games",
+  "--seed", $seedTag
 )
-if (-not $hasPolicy -and $hasPolicyMix) {
-  $mixJson = $mixValue | ConvertTo-Json -Depth 8 -Compress
-  $mixArg = ConvertTo-NativeJsonArg -JsonText $mixJson
-  # Use key=value single token to avoid PowerShell quote-stripping on native args.
-  $cmd += @("--opponent-policy-mix=$mixArg")
-}
-if ($hasPolicy) {
-  # opponent_policy 우선. 둘 다 있으면 opponent_policy를 사용한다.
-  $cmd += @("--opponent-policy", "$policyValue")
-}
 
-$resultLines = & $node @cmd
+$resultLines = & $python @cmd
 $exitCode = $LASTEXITCODE
 if ($exitCode -ne 0) {
   exit $exitCode
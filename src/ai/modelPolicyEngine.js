@@ -53,6 +53,16 @@ const NEAT_OUT_OPTION_BIAS = 1;
 const DEFAULT_RUNTIME_MEMORY_PROFILE = "recent_play_v4";
 const DEFAULT_RUNTIME_DEBUG_HISTORY_LIMIT = 64;
 const V4_RECENT_PLAY_SLOTS = 3;
+// Counters for neat_eval_worker summaries: forward passes are always counted, the wall-time
+// fields only while timing is enabled (off by default).
+const MODEL_POLICY_STATS = {
+  timingEnabled: false,
+  compile_ms: 0,
+  compile_count: 0,
+  feature_ms: 0,
+  feature_calls: 0,
+  forward_passes: 0,
+};
 
 /* 2) Feature extraction helpers */
 function clamp01(x) {
@@ -1220,6 +1230,44 @@ function featureVector(
   featureSpec = null,
   recentPlayMemory = null,
   opponentRecentPlayMemory = null
+) {
+  if (!MODEL_POLICY_STATS.timingEnabled) {
+    return buildFeatureVector(
+      state,
+      actor,
+      decisionType,
+      candidate,
+      inputDim,
+      featureSpec,
+      recentPlayMemory,
+      opponentRecentPlayMemory
+    );
+  }
+  const startMs = performance.now();
+  const features = buildFeatureVector(
+    state,
+    actor,
+    decisionType,
+    candidate,
+    inputDim,
+    featureSpec,
+    recentPlayMemory,
+    opponentRecentPlayMemory
+  );
+  MODEL_POLICY_STATS.feature_ms += performance.now() - startMs;
+  MODEL_POLICY_STATS.feature_calls += 1;
+  return features;
+}
+
+function buildFeatureVector(
+  state,
+  actor,
+  decisionType,
+  candidate,
+  inputDim,
+  featureSpec,
+  recentPlayMemory,
+  opponentRecentPlayMemory
 ) {
   const profile = normalizeFeatureProfile(featureSpec, inputDim);
   let features = null;
@@ -1437,10 +1485,15 @@ function getCompiledPolicyModel(policyModel) {
   if (!policyModel || !isSupportedPolicyModel(policyModel)) return null;
   const cached = COMPILED_NEAT_CACHE.get(policyModel);
   if (cached) return cached;
+  const startMs = MODEL_POLICY_STATS.timingEnabled ? performance.now() : 0;
   const compiled = isNeatModel(policyModel)
     ? compileNeatPythonGenome(policyModel)
     : compileKHyperneatExecutor(policyModel);
   COMPILED_NEAT_CACHE.set(policyModel, compiled);
+  if (MODEL_POLICY_STATS.timingEnabled) {
+    MODEL_POLICY_STATS.compile_ms += performance.now() - startMs;
+    MODEL_POLICY_STATS.compile_count += 1;
+  }
   return compiled;
 }
 
@@ -1856,6 +1909,7 @@ function forwardRecurrent(compiled, inputVec, baseSnapshot = null) {
 }
 
 function evaluateForward(compiled, inputVec, baseSnapshot = null) {
+  MODEL_POLICY_STATS.forward_passes += 1;
   if (isRecurrentNetworkType(compiled?.networkType)) {
     return forwardRecurrent(compiled, inputVec, baseSnapshot);
   }
@@ -1921,6 +1975,7 @@ async function evaluateManyForwardAsync(compiled, rows, baseSnapshot, policyMode
             Number(options.nativeInferenceStats.native_output_batches || 0) + 1;
         }
         noteNativeInferenceUsage(options.nativeInferenceStats, nativeResult.backendUsed);
+        MODEL_POLICY_STATS.forward_passes += rows.length;
         return rows.map((row, index) => ({
           outputs: Array.isArray(nativeResult.outputs[index]) ? nativeResult.outputs[index] : [],
           nextSnapshot: Array.isArray(nativeResult.snapshots)
@@ -2120,6 +2175,7 @@ function buildKHyperneatActionScoreBundle(state, actor, compiled, bindings, deci
   for (const candidate of candidates) {
     const inputs = encodeMatgoFocusedCandidateInputs(state, actor, compiled, decisionType, candidate);
     const outputs = runKHyperneatExecutor(compiled, inputs);
+    MODEL_POLICY_STATS.forward_passes += 1;
     if (!firstInputs) {
       firstInputs = inputs;
       firstOutputs = outputs;
@@ -2159,6 +2215,7 @@ function buildKHyperneatCandidateScoreBundle(state, actor, compiled, decisionTyp
       decisionType,
     });
     const outputs = runKHyperneatExecutor(compiled, inputs);
+    MODEL_POLICY_STATS.forward_passes += 1;
     return {
       inputs,
       outputs,
@@ -2205,6 +2262,28 @@ function pickBestByScore(candidates, scoreMap) {
 }
 
 /* 6) Public APIs */
+export function setModelPolicyTimingEnabled(enabled) {
+  MODEL_POLICY_STATS.timingEnabled = Boolean(enabled);
+}
+
+export function getModelPolicyStats() {
+  return {
+    compile_ms: Number(MODEL_POLICY_STATS.compile_ms || 0),
+    compile_count: Number(MODEL_POLICY_STATS.compile_count || 0),
+    feature_ms: Number(MODEL_POLICY_STATS.feature_ms || 0),
+    feature_calls: Number(MODEL_POLICY_STATS.feature_calls || 0),
+    forward_passes: Number(MODEL_POLICY_STATS.forward_passes || 0),
+  };
+}
+
+export function resetModelPolicyStats() {
+  MODEL_POLICY_STATS.compile_ms = 0;
+  MODEL_POLICY_STATS.compile_count = 0;
+  MODEL_POLICY_STATS.feature_ms = 0;
+  MODEL_POLICY_STATS.feature_calls = 0;
+  MODEL_POLICY_STATS.forward_passes = 0;
+}
+
 export function getModelCandidateProbabilities(state, actor, policyModel, options = {}) {
   const compiledRuntime = getCompiledPolicyModel(policyModel);
   if (!compiledRuntime) return null;